@@ -0,0 +1,95 @@
+"""Moves on many simulated devices from one thread, with tlk.aio and with blocking waits.
+
+Every round moves all --devices controllers to a new position and waits until
+each has reported the end of its move.  With tlk.aio the moves run concurrently
+on one event loop; blocking, one thread moves the devices one after the other,
+each followed by wait_for_message; with threads, one thread per device does
+the same.  For each this reports the wall time and the process CPU time per
+round, and the number of threads used.
+
+    python benchmarks/aio_moves.py --devices 32 --rounds 10
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+from tlk import library
+from tlk.definitions.messages import GenericMotor, Moved
+
+
+def blocking_move(device, position):
+    device.move_to_position(position)
+    while True:
+        message = device.wait_for_message()
+        if message is not None and tuple(message[:2]) == (GenericMotor, Moved):
+            return
+
+
+def blocking(devices, position):
+    for device in devices:
+        blocking_move(device, position)
+    return 1
+
+
+def threaded(devices, position):
+    threads = [threading.Thread(target=blocking_move, args=(device, position)) for device in devices]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return 1 + len(threads)
+
+
+def concurrent(motors, position):
+    async def round_of_moves():
+        await asyncio.gather(*(motor.move_to(position) for motor in motors))
+    asyncio.run(round_of_moves())
+    return 1
+
+
+def measure(function, items, rounds):
+    position = 0
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for _ in range(rounds):
+        position = 2000 - position
+        threads = function(items, position)
+    return (time.perf_counter() - wall) / rounds, (time.process_time() - cpu) / rounds, threads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--time-scale", type=float, default=20.0)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import kcubedcservo, simulator
+    from tlk.aio import Motor
+    simulator.time_scale = args.time_scale
+    devices = []
+    for index in range(args.devices):
+        serial = "%d" % (27000001 + index)
+        simulator.add_device(serial)
+        device = kcubedcservo.KCubeDCServo(serial)
+        device.open_device()
+        device.clear_message_queue()
+        devices.append(device)
+
+    print("%d devices, %d rounds, time scale %g" % (args.devices, args.rounds, args.time_scale))
+    print("%-24s %14s %14s %8s" % ("", "wall ms/round", "CPU ms/round", "threads"))
+    for name, function, items in (
+            ("blocking, sequential", blocking, devices),
+            ("blocking, threads", threaded, devices),
+            ("tlk.aio", concurrent, [Motor(device) for device in devices])):
+        wall, cpu, threads = measure(function, items, args.rounds)
+        print("%-24s %14.2f %14.2f %8d" % (name, 1e3 * wall, 1e3 * cpu, threads))
+    for device in devices:
+        device.bridge.stop()
+        device.close_device()
+
+
+if __name__ == "__main__":
+    main()
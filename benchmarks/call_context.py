@@ -0,0 +1,90 @@
+"""Cost of the hot motor getters through the module wrappers and a CallContext.
+
+For each getter in tlk.callcontext.GETTERS this reports the time per call and
+the memory allocated per call, for the module level wrapper (which encodes the
+serial number and creates its buffers every time) and for a CallContext getter.
+CPython has no allocation counter, so allocation is measured with tracemalloc
+as the peak traced memory during one call above the memory in use before it.
+
+The simulated backend is used by default, with a simulated device added for
+the serial number; with --backend kinesis the serial number must be that of a
+connected device, which is opened for the run.
+
+    python benchmarks/call_context.py --module kcubedcservo --prefix KVS
+    python benchmarks/call_context.py --module benchtopbrushlessmotor --prefix BMC --serial 73000001 --channel 1
+"""
+import argparse
+import importlib
+import time
+import tracemalloc
+
+from tlk import library
+from tlk.callcontext import GETTERS, CallContext
+
+
+def time_per_call(function, calls):
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter_ns() - start) / calls
+
+
+def bytes_per_call(function, samples):
+    function()
+    tracemalloc.start()
+    try:
+        sizes = []
+        for _ in range(samples):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            function()
+            sizes.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return min(sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="kcubedcservo")
+    parser.add_argument("--prefix", default="KVS")
+    parser.add_argument("--serial", default="27000001")
+    parser.add_argument("--channel", type=int)
+    parser.add_argument("--backend", default="simulated")
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    library.set_backend(args.backend)
+    if args.backend == "simulated":
+        from tlk import simulator
+        simulator.add_device(args.serial)
+    module = importlib.import_module("tlk." + args.module)
+    context = CallContext(module.lib, args.prefix, args.serial, args.channel)
+    device = CallContext(module.lib, args.prefix, args.serial)
+    device.call("Open")
+    extra = () if args.channel is None else (args.channel,)
+
+    print("%s %s, %d calls per getter, %s backend" % (args.module, args.serial, args.calls, args.backend))
+    print("%-28s %12s %12s %12s %12s" % ("", "wrapper ns", "context ns", "wrapper B", "context B"))
+    for name in GETTERS:
+        wrapper = getattr(module, name, None)
+        try:
+            getter = getattr(context, name)
+            getter()
+        except Exception as error:
+            print("%-28s skipped: %r" % (name, error))
+            continue
+
+        def call_wrapper():
+            return wrapper(args.serial, *extra)
+
+        print("%-28s %12.0f %12.0f %12d %12d" % (
+            name,
+            time_per_call(call_wrapper, args.calls), time_per_call(getter, args.calls),
+            bytes_per_call(call_wrapper, 100), bytes_per_call(getter, 100)))
+
+    device.call("Close")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Cost and contention of serializing calls with tlk.dispatcher.
+
+"one thread" times request_position/get_position pairs on one simulated
+device, called directly, through a Dispatcher and through one made with
+threadsafe=False: the cost of the uncontended lock and of the wrapper.  Then
+--threads threads per device, on --devices devices, each make --pairs set/get
+pairs of the position counter, as a GUI, a logger and a sequencer would,
+without locks and holding the Dispatcher's lock over each pair.  Reported
+are the pairs per second, the pairs whose get did not return what that thread
+had just set, and the contention statistics of the device locks.  The
+simulated calls hold the GIL, where the dlls release it, so the interpreter's
+switch interval is set to --switch-interval seconds to let threads switch
+within a pair as they do with the dlls.
+
+    python benchmarks/dispatcher.py --devices 4 --threads 3 --pairs 20000
+"""
+import argparse
+import sys
+import threading
+import time
+
+from tlk import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=3)
+    parser.add_argument("--pairs", type=int, default=20000)
+    parser.add_argument("--switch-interval", type=float, default=1e-5)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import dispatcher, simulator
+    from tlk.kcubedcservo import KCubeDCServo
+
+    serials = ["%d" % (27000001 + index) for index in range(args.devices)]
+    for serial in serials:
+        simulator.add_device(serial)
+    devices = [KCubeDCServo(serial) for serial in serials]
+
+    def pairs(device, count):
+        request, get = device.request_position, device.get_position
+        for _ in range(count):
+            request()
+            get()
+
+    print("one thread, %d request/get pairs" % args.pairs)
+    pairs(devices[0], args.pairs)
+    for name, device in (("direct", devices[0]), ("Dispatcher", dispatcher.Dispatcher(devices[0])),
+                         ("unlocked", dispatcher.Dispatcher(devices[0], threadsafe=False))):
+        start = time.perf_counter()
+        pairs(device, args.pairs)
+        elapsed = time.perf_counter() - start
+        print("  %-12s %8.2f us/pair" % (name, 1e6 * elapsed / args.pairs))
+
+    # Every thread tags its request with its own position counter value and
+    # checks that the read that follows sees it.
+    interleaved = [0]
+
+    def unlocked(device, tag):
+        for _ in range(args.pairs):
+            device.set_position_counter(tag)
+            if device.get_position_counter() != tag:
+                interleaved[0] += 1
+
+    def locked(device, tag):
+        for _ in range(args.pairs):
+            with device.exclusive():
+                device.set_position_counter(tag)
+                if device.get_position_counter() != tag:
+                    interleaved[0] += 1
+
+    sys.setswitchinterval(args.switch_interval)
+    print("%d devices x %d threads, %d set/get pairs each" % (args.devices, args.threads, args.pairs))
+    for name, run, wrap in (("no locks", unlocked, lambda device: device),
+                            ("Dispatcher", locked, dispatcher.Dispatcher)):
+        for lock in dispatcher._locks.values():
+            lock.reset()
+        interleaved[0] = 0
+        threads = [threading.Thread(target=run, args=(wrap(device), tag))
+                   for device in devices for tag in range(args.threads)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print("  %-12s %8.0f pairs/s %8d interleaved" % (name, len(threads) * args.pairs / elapsed, interleaved[0]))
+    for serial, stats in sorted(dispatcher.statistics().items()):
+        print("  %s %8d acquisitions %8d contended  wait %7.3f s  max %6.2f ms" % (
+            serial, stats["acquisitions"], stats["contended"], stats["wait_time"], 1e3 * stats["max_wait"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Throughput of converting enumeration members to ctypes arguments, before and after.
+
+"before" is the Enumeration of earlier releases: a ctypes type whose
+from_param creates a new instance on every call, finding the member's name by
+scanning the members.  "after" is tlk.definitions.enumeration: from_param of
+an Enumeration returns the instance kept for the value, and since members are
+ints the plain ctypes type converts them directly.  The last rows call a C
+function (PyLong_FromLong, from the Python C API so that it is found on every
+platform) with a member, an int and a ctypes instance as its argument.
+
+    python benchmarks/enum_from_param.py --calls 1000000
+"""
+import argparse
+import ctypes
+import time
+from ctypes import c_long, c_uint
+
+from tlk.definitions.enumeration import enumeration
+
+
+class OldEnumeration(c_uint):
+    # The conversion of the earlier Enumeration, with its members given
+    # explicitly: its metaclass was never applied on Python 3.
+    _members_ = {}
+
+    def __init__(self, value):
+        for k, v in self._members_.items():
+            if v == value:
+                self.name = k
+                break
+        else:
+            raise ValueError("No enumeration member with value %r" % value)
+        c_uint.__init__(self, value)
+
+    @classmethod
+    def from_param(cls, param):
+        if isinstance(param, OldEnumeration):
+            if param.__class__ != cls:
+                raise ValueError("Cannot mix enumeration members")
+            else:
+                return param
+        else:
+            return cls(param)
+
+
+MEMBERS = (("Trig_Disabled", 0x00), ("Trig_In_GPI", 0x01), ("Trig_InRelativeMove", 0x02),
+           ("Trig_InAbsoluteMove", 0x03), ("Trig_InResetCount", 0x04), ("Trig_Out_GP0", 0x0A),
+           ("Trig_Out_InMotion", 0x0B), ("Trig_Out_AtMaxVelocity", 0x0C), ("Trig_Out_AtEitherLimit", 0x12))
+
+
+class OldTrigModes(OldEnumeration):
+    _members_ = dict(MEMBERS)
+
+
+def rate(function, argument, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        function(argument)
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000000)
+    args = parser.parse_args()
+
+    TrigModes = enumeration({"__name__": __name__}, "TrigModes", c_long, MEMBERS)
+    member = TrigModes.Trig_Out_AtEitherLimit
+    value = int(member)
+    function = ctypes.pythonapi.PyLong_FromLong
+    function.argtypes = (c_long,)
+    function.restype = ctypes.py_object
+
+    print("%d calls, last member of %d" % (args.calls, len(MEMBERS)))
+    for name, convert, argument in (
+            ("before: from_param(value)", OldTrigModes.from_param, value),
+            ("after: from_param(value)", TrigModes.from_param, value),
+            ("after: from_param(member)", TrigModes.from_param, member),
+            ("c_long.from_param(member)", c_long.from_param, member),
+            ("call with member", function, member),
+            ("call with int", function, value),
+            ("call with c_long", function, c_long(value))):
+        print("%-28s %8.2f M/s" % (name, rate(convert, argument, args.calls) / 1e6))
+
+
+if __name__ == "__main__":
+    main()
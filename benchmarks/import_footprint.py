@@ -0,0 +1,84 @@
+"""Import time and memory footprint of the tlk device modules, for one or more trees.
+
+For each source tree given with --src (default: this checkout's src) this
+reports the lines of Python and the size of the compiled bytecode of the device
+modules, and the time and the memory it takes to import all of them in a fresh
+interpreter.  The tlk package itself is imported before the clock starts, so
+only the device modules are measured.  Memory is what tracemalloc sees
+allocated by the imports and still held afterwards; the times are taken in
+separate runs without tracemalloc, from the .pyc files written by a first run.
+
+To compare with an earlier revision, check it out next to this one:
+
+    git worktree add ../tlk-before <revision>
+    python benchmarks/import_footprint.py --src src --src ../tlk-before/src
+"""
+import argparse
+import marshal
+import os
+import statistics
+import subprocess
+import sys
+
+from import_time import DEVICE_MODULES
+
+
+SAMPLE = """
+import importlib
+import sys
+import time
+import tracemalloc
+import tlk.library
+if {trace}:
+    tracemalloc.start()
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module("tlk." + name)
+elapsed = time.perf_counter() - start
+print(elapsed, tracemalloc.get_traced_memory()[0] if {trace} else 0)
+"""
+
+
+def sample(src, trace):
+    code = SAMPLE.format(trace=trace, modules=DEVICE_MODULES)
+    environment = dict(os.environ, PYTHONPATH=os.path.abspath(src))
+    output = subprocess.check_output([sys.executable, "-c", code], env=environment, cwd=os.path.abspath(src))
+    elapsed, size = output.split()
+    return float(elapsed), int(size)
+
+
+def source_size(src):
+    # Lines of Python and bytes of bytecode of the device modules and of the
+    # table modules they are built from.
+    lines = code = 0
+    package = os.path.join(src, "tlk")
+    for name in os.listdir(package):
+        if not name.endswith(".py"):
+            continue
+        path = os.path.join(package, name)
+        with open(path) as source:
+            text = source.read()
+        if name[:-3] in DEVICE_MODULES or name in ("binding.py", "motor.py"):
+            lines += text.count("\n")
+            code += len(marshal.dumps(compile(text, path, "exec")))
+    return lines, code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--src", action="append")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("%d device modules, %d samples" % (len(DEVICE_MODULES), args.repeat))
+    print("%-28s %10s %12s %12s %12s" % ("tree", "lines", "bytecode kB", "import ms", "memory kB"))
+    for src in args.src or ["src"]:
+        lines, code = source_size(src)
+        _, memory = sample(src, True)
+        times = [sample(src, False)[0] for _ in range(args.repeat)]
+        print("%-28s %10d %12.0f %12.1f %12.0f" % (
+            src, lines, code / 1e3, 1e3 * statistics.median(times), memory / 1e3))
+
+
+if __name__ == "__main__":
+    main()
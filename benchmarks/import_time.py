@@ -0,0 +1,87 @@
+"""Cold import time of every tlk device module, with and without lazy binding.
+
+Each sample imports all device modules in a fresh interpreter, so the timings
+include loading the Kinesis dlls when binding is eager.  Use --backend simulated
+to run it where the dlls are not installed.
+
+    python benchmarks/import_time.py --repeat 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+DEVICE_MODULES = (
+    "benchtopbrushlessmotor",
+    "benchtopdcservo",
+    "benchtopnanotrack",
+    "benchtoppiezo",
+    "benchtoppiezopdxc2",
+    "benchtopprecisionpiezo",
+    "benchtopsteppermotor",
+    "benchtopvoicecoil",
+    "filterflipper",
+    "integratedprecisionpiezo",
+    "integratedsteppermotor",
+    "kcubebrushlessmotor",
+    "kcubedcservo",
+    "kcubeinertialmotor",
+    "kcubelaserdiode",
+    "kcubelasersource",
+    "kcubenanotrack",
+    "kcubepiezo",
+    "kcubepiezostraingauge",
+    "kcubepositionaligner",
+    "kcubesolenoid",
+    "kcubesteppermotor",
+    "modularnanotrack",
+    "modularsteppermotor",
+    "polarizer",
+    "tcubebrushlessmotor",
+    "tcubeinertialmotor",
+    "tcubelaserdiode",
+    "tcubelasersource",
+    "tcubenanotrack",
+    "tcubepiezo",
+    "tcubequad",
+    "tcubeservo",
+    "tcubesolenoid",
+    "tcubesteppermotor",
+    "tcubestraingauge",
+    "tcubetec")
+
+SAMPLE = """
+import time
+import importlib
+import tlk.library
+tlk.library.set_backend({backend!r})
+tlk.library.eager_binding = {eager}
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module("tlk." + name)
+print(time.perf_counter() - start)
+"""
+
+
+def sample(backend, eager):
+    code = SAMPLE.format(backend=backend, eager=eager, modules=DEVICE_MODULES)
+    output = subprocess.check_output([sys.executable, "-c", code])
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backend", default="kinesis")
+    args = parser.parse_args()
+
+    print("cold import of %d modules, %d samples" % (len(DEVICE_MODULES), args.repeat))
+    for label, eager in (("eager", True), ("lazy", False)):
+        times = [sample(args.backend, eager) for _ in range(args.repeat)]
+        print("%-6s median %8.2f ms   min %8.2f ms" % (
+            label, 1e3 * statistics.median(times), 1e3 * min(times)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Cost of timing the dll calls with tlk.instrument.
+
+A simulated control loop calls request_status_bits, get_status_bits,
+request_position and get_position on --devices devices, --ticks times, never
+instrumented, with instrument.enable() and after instrument.disable(); the
+time per call shows the cost of the timing and that nothing is left once it
+is disabled.  The table of instrument.report() follows.
+
+    python benchmarks/instrument_overhead.py --devices 20 --ticks 2000
+"""
+import argparse
+import time
+
+from tlk import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=2000)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import instrument, simulator
+    from tlk.kcubedcservo import KCubeDCServo
+
+    serials = ["%d" % (27000001 + index) for index in range(args.devices)]
+    for serial in serials:
+        simulator.add_device(serial)
+    devices = [KCubeDCServo(serial) for serial in serials]
+
+    def loop():
+        start = time.perf_counter()
+        for _ in range(args.ticks):
+            for device in devices:
+                device.request_status_bits()
+                device.get_status_bits()
+                device.request_position()
+                device.get_position()
+        return (time.perf_counter() - start) / (args.ticks * args.devices * 4)
+
+    # Resolve the functions and make the getters first.
+    loop()
+    print("%d devices, %d ticks, 4 calls per device and tick" % (args.devices, args.ticks))
+    print("%-24s %8.2f us/call" % ("not instrumented", 1e6 * loop()))
+    instrument.enable()
+    print("%-24s %8.2f us/call" % ("enabled", 1e6 * loop()))
+    instrument.disable()
+    print("%-24s %8.2f us/call" % ("disabled again", 1e6 * loop()))
+    print()
+    print(instrument.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Writing and reading telemetry with tlk.log, against CSV.
+
+--records position records of --devices devices, taken at --rate per device,
+are written with a LogWriter and with csv.writer, as time, serial number,
+channel and value.  Then one device's records in a window of --window seconds
+in the middle of the run are read back: by LogReader.select, through the
+memory map, and by parsing the CSV file.  Reported are the records per second
+written, the file sizes and the time of the read.
+
+    python benchmarks/log_format.py --records 1000000 --devices 20
+"""
+import argparse
+import csv
+import os
+import shutil
+import tempfile
+import time
+
+from tlk.log import LogReader, LogWriter
+
+
+def write_log(directory, samples):
+    with LogWriter(directory, "positions", "c_double") as writer:
+        append = writer.append
+        for timestamp, serial, value in samples:
+            append(serial, 0, value, timestamp)
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def write_csv(path, samples):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writerow = writer.writerow
+        for timestamp, serial, value in samples:
+            writerow((timestamp, serial, 0, value))
+    return os.path.getsize(path)
+
+
+def read_log(directory, start, stop, serial):
+    records = LogReader(directory, "positions").select(start, stop, serial=serial)
+    return len(records)
+
+
+def read_csv(path, start, stop, serial):
+    count = 0
+    with open(path, newline="") as file:
+        for timestamp, device, channel, value in csv.reader(file):
+            if device == serial and start <= float(timestamp) < stop:
+                float(value)
+                count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000000)
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=200.0)
+    parser.add_argument("--window", type=float, default=10.0)
+    args = parser.parse_args()
+
+    serials = ["%d" % (27000001 + index) for index in range(args.devices)]
+    period = 1.0 / args.rate
+    origin = time.time()
+    samples = [(origin + (index // args.devices) * period, serials[index % args.devices], 0.001 * index)
+               for index in range(args.records)]
+    middle = (origin + samples[-1][0]) / 2
+    start, stop = middle - args.window / 2, middle + args.window / 2
+
+    directory = tempfile.mkdtemp()
+    try:
+        print("%d records of %d devices, reading %g s of one device" % (args.records, args.devices, args.window))
+        print("%-8s %14s %12s %12s %10s" % ("", "written/s", "size MB", "read ms", "records"))
+        for name, write, read, path in (
+                ("tlk.log", write_log, read_log, os.path.join(directory, "log")),
+                ("CSV", write_csv, read_csv, os.path.join(directory, "log.csv"))):
+            began = time.perf_counter()
+            size = write(path, samples)
+            written = args.records / (time.perf_counter() - began)
+            began = time.perf_counter()
+            count = read(path, start, stop, serials[0])
+            elapsed = time.perf_counter() - began
+            print("%-8s %14.0f %12.1f %12.1f %10d" % (name, written, size / 1e6, 1e3 * elapsed, count))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Move completion by polling the message queues against a MessageBridge per device.
+
+Moves are started on --devices simulated controllers at once, and the run waits
+until every one of them has reported GenericMotor Moved, --moves times over.
+Polling calls get_next_message on every device, sleeping --interval seconds
+between rounds when nothing was queued; the bridges are woken by the message
+callback instead.  For each this reports the wall time per round of moves, from
+the first move started to the last Moved seen, and the CPU time the process
+used.
+
+    python benchmarks/message_bridge.py --devices 32 --interval 0.01
+"""
+import argparse
+import time
+
+from tlk import library
+from tlk.definitions.messages import GenericMotor, Moved
+
+MOVED = (GenericMotor, Moved)
+
+
+def poll(module, serials, interval):
+    # Last time each device's Moved message was seen.
+    pending = set(serials)
+    seen = 0.0
+    while pending:
+        found = False
+        for serial in list(pending):
+            message = module.get_next_message(serial)
+            while message is not None:
+                found = True
+                if tuple(message[:2]) == MOVED:
+                    pending.discard(serial)
+                    seen = time.perf_counter()
+                message = module.get_next_message(serial)
+        if pending and not found:
+            time.sleep(interval)
+    return seen
+
+
+def bridged(bridges):
+    seen = 0.0
+    for bridge in bridges:
+        while True:
+            message = bridge.wait()
+            if message[:2] == MOVED:
+                seen = time.perf_counter()
+                break
+    return seen
+
+
+def run(module, devices, moves, wait):
+    position = 0
+    wall = 0.0
+    cpu = time.process_time()
+    for _ in range(moves):
+        position = 2000 - position
+        start = time.perf_counter()
+        for device in devices:
+            device.move_to_position(position)
+        seen = wait()
+        wall += seen - start
+    return wall / moves, (time.process_time() - cpu) / moves
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=32)
+    parser.add_argument("--moves", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--time-scale", type=float, default=20.0)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import kcubedcservo, simulator
+    simulator.time_scale = args.time_scale
+    serials = ["%d" % (27000001 + index) for index in range(args.devices)]
+    devices = []
+    for serial in serials:
+        simulator.add_device(serial)
+        device = kcubedcservo.KCubeDCServo(serial)
+        device.open_device()
+        devices.append(device)
+    for device in devices:
+        device.bridge.drain()
+        device.bridge.messages.clear()
+
+    print("%d devices, %d rounds of moves, time scale %g" % (args.devices, args.moves, args.time_scale))
+    print("%-24s %14s %14s" % ("", "wall ms/round", "CPU ms/round"))
+    wall, cpu = run(kcubedcservo, devices, args.moves, lambda: poll(kcubedcservo, serials, args.interval))
+    print("%-24s %14.2f %14.2f" % ("poll every %g s" % args.interval, 1e3 * wall, 1e3 * cpu))
+    for device in devices:
+        device.bridge.start()
+        device.bridge.messages.clear()
+    wall, cpu = run(kcubedcservo, devices, args.moves, lambda: bridged([device.bridge for device in devices]))
+    print("%-24s %14.2f %14.2f" % ("message bridge", 1e3 * wall, 1e3 * cpu))
+    for device in devices:
+        device.bridge.stop()
+        device.close_device()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compiling and uploading a trajectory as a move array, against timing its points from Python.
+
+A circle of --points points on two channels of a simulated benchtop
+brushless controller, plus a ramp on a third, is compiled into a
+tlk.trajectory.MoveArray and uploaded; reported are the time to compile it,
+the number of SetMultiChannelMoveArraySection calls and the upload time.
+Then the first --timed points are run from Python the way the move array
+replaces: sleeping until each point's time and moving every channel to it.
+The lateness of those calls against the points' times is the jitter a
+firmware move array does not have, since it is started with one call.
+
+    python benchmarks/move_array.py --points 10000 --rate 100 --timed 200
+"""
+import argparse
+import math
+import time
+
+from tlk import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=10000)
+    parser.add_argument("--rate", type=float, default=100.0, help="points per second")
+    parser.add_argument("--timed", type=int, default=200, help="points timed from Python")
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import simulator, trajectory
+    from tlk.benchtopbrushlessmotor import BenchtopBrushlessMotor
+
+    simulator.add_device("73000001")
+    stage = BenchtopBrushlessMotor("73000001")
+    stage.open_device()
+
+    times = [(index + 1) / args.rate for index in range(args.points)]
+    positions = [(5 + math.cos(0.1 * time), 5 + math.sin(0.1 * time), 0.001 * time) for time in times]
+
+    for name, numpy in (("numpy", trajectory.numpy), ("lists", None)):
+        if name == "numpy" and numpy is None:
+            continue
+        saved, trajectory.numpy = trajectory.numpy, numpy
+        try:
+            start = time.perf_counter()
+            array = trajectory.MoveArray(stage, times, positions, channels=(1, 2, 3))
+            compiled = time.perf_counter() - start
+        finally:
+            trajectory.numpy = saved
+        start = time.perf_counter()
+        calls = array.upload()
+        uploaded = time.perf_counter() - start
+        print("%-8s %d points: compile %7.2f ms, upload %6.2f ms in %d section calls" % (
+            name, args.points, 1e3 * compiled, 1e3 * uploaded, calls))
+
+    channels = [stage.channel(number) for number in (1, 2, 3)]
+    units = stage.module.units
+    lateness = []
+    origin = time.perf_counter()
+    for when, row in zip(times[:args.timed], positions):
+        delay = origin + when - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        lateness.append(time.perf_counter() - origin - when)
+        for channel, value in zip(channels, row):
+            channel.move_to_position(units.to_device_units(stage.serial_number, value, channel=channel.number))
+    lateness.sort()
+    print("Python-timed: %d points, %d move calls, lateness mean %.2f ms, p99 %.2f ms, max %.2f ms" % (
+        len(lateness), 3 * len(lateness), 1e3 * sum(lateness) / len(lateness),
+        1e3 * lateness[int(0.99 * (len(lateness) - 1))], 1e3 * lateness[-1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Start skew of moves of motors on different controllers, staged first or not.
+
+The members are a simulated KCube DC servo, a KCube stepper and two channels
+of a benchtop brushless controller, moved back and forth --rounds times.
+"naive" sets and starts each member's move in turn, as a loop over the
+devices would; "group" uses tlk.group.MoveGroup, which stages every member
+before making the move_absolute calls back to back.  Reported are the
+mean and largest skew, the time from the first move_absolute call to the
+last, and the mean time to issue a round.
+
+    python benchmarks/move_group.py --rounds 50 --time-scale 50
+"""
+import argparse
+import statistics
+import time
+
+from tlk import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--time-scale", type=float, default=50.0)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import simulator
+    from tlk.benchtopbrushlessmotor import BenchtopBrushlessMotor
+    from tlk.definitions.messages import Moved
+    from tlk.group import MoveGroup
+    from tlk.kcubedcservo import KCubeDCServo
+    from tlk.kcubesteppermotor import KCubeStepperMotor
+
+    simulator.time_scale = args.time_scale
+    for serial in ("27000001", "26000001", "73000001"):
+        simulator.add_device(serial)
+    servo, stepper, rack = KCubeDCServo("27000001"), KCubeStepperMotor("26000001"), BenchtopBrushlessMotor("73000001")
+    for device in (servo, stepper, rack):
+        device.open_device()
+    group = MoveGroup([servo, stepper, rack.channel(1), rack.channel(2)])
+    clock = time.perf_counter_ns
+
+    def naive(positions):
+        # Each member staged and started in turn; returns the futures and
+        # the start of every move_absolute call.
+        futures, starts = [], []
+        for member, position in zip(group.members, group.device_units(positions)):
+            member.set_move_absolute_position(position)
+            futures.append(member.moves.expect(Moved))
+            starts.append(clock())
+            member.move_absolute()
+        return futures, starts
+
+    def grouped(positions):
+        move = group.move_to(positions)
+        return move.futures, [start for start, _ in move.calls]
+
+    for name, run in (("naive", naive), ("group", grouped)):
+        skews, issues = [], []
+        for round in range(args.rounds):
+            positions = [1.0 + round % 2] * len(group)
+            start = clock()
+            futures, starts = run(positions)
+            issues.append(clock() - start)
+            skews.append(max(starts) - min(starts))
+            for future in futures:
+                future.result(timeout=30.0)
+        print("%-6s skew mean %8.1f us, max %8.1f us; round issued in %8.1f us" % (
+            name, statistics.mean(skews) / 1e3, max(skews) / 1e3, statistics.mean(issues) / 1e3))
+
+
+if __name__ == "__main__":
+    main()
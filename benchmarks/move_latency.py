@@ -0,0 +1,66 @@
+"""Move-to-move time on one simulated device, polling for Moved against move futures.
+
+Short moves are made back to back --moves times.  Polling checks
+get_next_message after every --interval seconds of sleep, as a status loop
+would; the futures of tlk.moves are completed by the message callback.  The
+difference in time per move is the latency the polling adds to every move.
+
+    python benchmarks/move_latency.py --moves 50 --interval 0.01
+"""
+import argparse
+import time
+
+from tlk import library
+from tlk.definitions.messages import GenericMotor, Moved
+
+
+def polled(device, position, interval):
+    device.move_to_position(position)
+    while True:
+        message = device.get_next_message()
+        if message is None:
+            time.sleep(interval)
+        elif tuple(message[:2]) == (GenericMotor, Moved):
+            return
+
+
+def with_future(device, position, interval):
+    device.moves.move_to_position(position).result()
+
+
+def measure(function, device, moves, interval):
+    position = 0
+    start = time.perf_counter()
+    for _ in range(moves):
+        position = 200 - position
+        function(device, position, interval)
+    return (time.perf_counter() - start) / moves
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--time-scale", type=float, default=20.0)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import kcubedcservo, simulator
+    simulator.time_scale = args.time_scale
+    simulator.add_device("27000001")
+    device = kcubedcservo.KCubeDCServo("27000001")
+    device.open_device()
+    device.clear_message_queue()
+
+    print("%d moves, time scale %g" % (args.moves, args.time_scale))
+    polling = measure(polled, device, args.moves, args.interval)
+    print("%-24s %10.2f ms/move" % ("poll every %g s" % args.interval, 1e3 * polling))
+    futures = measure(with_future, device, args.moves, args.interval)
+    print("%-24s %10.2f ms/move" % ("move futures", 1e3 * futures))
+    device.moves.close()
+    device.bridge.stop()
+    device.close_device()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Waiting for moves by polling the status, against sleeping for their predicted duration.
+
+A simulated KCube DC servo, sped up by --time-scale, makes --moves moves to
+random positions.  "polling" reads the status bits every --interval seconds
+from the start of each move until the motor has stopped; "predicted" sleeps
+for the duration tlk.movetime.MoveModel predicts and only then polls.
+Reported are the status reads per move, the wall time and how far the
+predictions were from the time the Moved message arrived.  Last, the
+durations of --array moves are predicted at once and one at a time.
+
+    python benchmarks/move_time.py --moves 20 --time-scale 10
+"""
+import argparse
+import random
+import statistics
+import time
+
+from tlk import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=20)
+    parser.add_argument("--time-scale", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=0.002)
+    parser.add_argument("--array", type=int, default=1000000)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import simulator, status
+    from tlk.definitions.messages import Moved
+    from tlk.kcubedcservo import KCubeDCServo
+    from tlk.movetime import MoveModel, move_time
+
+    simulator.add_device("27000001")
+    simulator.time_scale = args.time_scale
+    servo = KCubeDCServo("27000001")
+    servo.open_device()
+    moving = status.decoder(servo).decode
+    units = servo.module.units
+    model = MoveModel(servo)
+    rng = random.Random(1)
+    targets = [rng.uniform(0.0, 20.0) for _ in range(args.moves)]
+
+    for name, predicted in (("polling", False), ("predicted", True)):
+        reads = 0
+        errors = []
+        start = time.perf_counter()
+        for target in targets:
+            duration = model.duration(target) / args.time_scale
+            future = servo.moves.expect(Moved)
+            issued = time.perf_counter()
+            servo.move_to_position(units.to_device_units(servo.serial_number, target))
+            future.add_done_callback(lambda future, issued=issued, duration=duration: errors.append(
+                time.perf_counter() - issued - duration))
+            if predicted:
+                time.sleep(max(0.0, issued + duration - time.perf_counter()))
+            while True:
+                reads += 1
+                if not moving(servo.get_status_bits()).moving:
+                    break
+                time.sleep(args.interval)
+            future.result(timeout=30.0)
+        elapsed = time.perf_counter() - start
+        print("%-10s %6.1f status reads per move, %6.3f s, Moved %+.2f ms from the prediction on average" % (
+            name, reads / args.moves, elapsed, 1e3 * statistics.mean(errors)))
+
+    starts = [rng.uniform(0.0, 20.0) for _ in range(args.array)]
+    ends = [rng.uniform(0.0, 20.0) for _ in range(args.array)]
+    start = time.perf_counter()
+    model.durations(starts, ends)
+    vectorized = time.perf_counter() - start
+    start = time.perf_counter()
+    for begin, end in zip(starts, ends):
+        move_time(end - begin, model.velocity, model.acceleration, model.jerk)
+    scalar = time.perf_counter() - start
+    print("%d durations in %.3f s at once, %.3f s one at a time" % (args.array, vectorized, scalar))
+
+
+if __name__ == "__main__":
+    main()
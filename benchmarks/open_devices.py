@@ -0,0 +1,65 @@
+"""Wall time to open, configure and close many simulated devices, one by one and with a ConnectionPool.
+
+Every simulated Open takes --open-delay seconds, as the dlls take to find a
+device on USB; --flaky of the devices answer the first Open with
+TL_NO_RESPONSE, which the pool retries.  "sequential" opens the devices and
+loads their settings one after the other, and then closes them; "pool" does
+the same with tlk.connections.ConnectionPool of --workers threads.
+
+    python benchmarks/open_devices.py --devices 40 --open-delay 0.2 --workers 8
+"""
+import argparse
+import time
+
+from tlk import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=40)
+    parser.add_argument("--open-delay", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--flaky", type=int, default=4)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import simulator
+    from tlk.connections import ConnectionPool, load_settings, retry
+    from tlk.kcubedcservo import KCubeDCServo
+
+    simulator.open_delay = args.open_delay
+    serials = ["%d" % (27000001 + index) for index in range(args.devices)]
+    for serial in serials:
+        simulator.add_device(serial)
+
+    def flaky():
+        for serial in serials[:args.flaky]:
+            simulator.devices[serial].open_errors.append(33)
+
+    print("%d devices, Open takes %g s, %d answer the first Open with error 33" % (
+        args.devices, args.open_delay, args.flaky))
+    devices = [KCubeDCServo(serial) for serial in serials]
+    flaky()
+    start = time.perf_counter()
+    for device in devices:
+        retry(device.open_device, delay=0.01)
+        load_settings(device)
+    opened = time.perf_counter() - start
+    for device in devices:
+        device.close_device()
+    closed = time.perf_counter() - start - opened
+    print("%-24s open %8.2f s   close %8.3f s" % ("sequential", opened, closed))
+
+    flaky()
+    with ConnectionPool(workers=args.workers, delay=0.01) as pool:
+        start = time.perf_counter()
+        pool.open(devices, configure=load_settings)
+        opened = time.perf_counter() - start
+        assert len(pool) == args.devices
+        pool.close()
+        closed = time.perf_counter() - start - opened
+    print("%-24s open %8.2f s   close %8.3f s" % ("pool, %d workers" % args.workers, opened, closed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Planning a raster scan and how closely its timeline matches the simulated scan.
+
+A scan of --lines lines of a rectangle is planned with tlk.raster.RasterScan
+on a simulated benchtop brushless controller, and the time to plan it and
+the size of its timeline are reported.  A scan of --run-lines lines is then
+uploaded and run with the simulator sped up by --time-scale, sampling the
+positions of both channels; the largest difference between a sample and
+RasterScan.positions at the sample's time is the error of the prediction,
+and includes the delay of reading the position.
+
+    python benchmarks/raster_scan.py --lines 501 --run-lines 5 --time-scale 4
+"""
+import argparse
+import time
+
+from tlk import library
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=501)
+    parser.add_argument("--run-lines", type=int, default=5)
+    parser.add_argument("--time-scale", type=float, default=4.0)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import raster, simulator
+    from tlk.benchtopbrushlessmotor import BenchtopBrushlessMotor
+
+    simulator.add_device("73000001")
+    simulator.time_scale = args.time_scale
+    stage = BenchtopBrushlessMotor("73000001")
+    stage.open_device()
+
+    for pattern in ("forward_reverse", "flyback"):
+        start = time.perf_counter()
+        scan = raster.RasterScan(stage, 1, 2, (1.0, 11.0), (1.0, 6.0), args.lines, pattern, dwell=0.01)
+        elapsed = time.perf_counter() - start
+        print("%-16s %d lines planned in %6.2f ms: %d events, %.1f s" % (
+            pattern, args.lines, 1e3 * elapsed, len(scan.timeline), scan.duration))
+    if numpy is None:
+        return
+
+    scan = raster.RasterScan(stage, 1, 2, (1.0, 3.0), (1.0, 2.0), args.run_lines, dwell=0.05, step_dwell=0.02)
+    scan.upload()
+    units = stage.module.units
+    channels = [stage.channel(number) for number in (1, 2)]
+    errors = []
+    origin = time.monotonic()
+    scan.start()
+    while True:
+        elapsed = (time.monotonic() - origin) * args.time_scale
+        if elapsed > scan.duration:
+            break
+        actual = [units.to_real_units(stage.serial_number, channel.get_position(), channel=channel.number)
+                  for channel in channels]
+        errors.append(numpy.abs(numpy.array(actual) - scan.positions(elapsed)).max())
+        time.sleep(0.005)
+    print("%d-line scan of %.1f s (simulated %.1f s): %d samples, error mean %.4f, max %.4f mm" % (
+        args.run_lines, scan.duration, scan.duration / args.time_scale, len(errors),
+        numpy.mean(errors), numpy.max(errors)))
+
+
+if __name__ == "__main__":
+    main()
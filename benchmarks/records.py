@@ -0,0 +1,63 @@
+"""Cost per sample of logging structures field by field and into a RecordArray.
+
+Each sample is a copy of one ctypes structure (--structure, from
+tlk.definitions.structures), as a getter returns it.  "dicts" converts it to a
+dict of its fields, as loggers do; "RecordArray" copies it into a contiguous
+buffer with one memmove.  For each this reports the time per sample, and the
+memory held per sample at the end as traced by tracemalloc in a second run.
+
+    python benchmarks/records.py --structure NT_TIAReading --samples 100000
+"""
+import argparse
+import time
+import tracemalloc
+
+from tlk.definitions import structures
+from tlk.records import RecordArray
+
+
+def to_dicts(structure, sample, samples):
+    names = [field[0] for field in structure._fields_]
+    log = []
+    for _ in range(samples):
+        log.append(dict((name, getattr(sample, name)) for name in names))
+    return log
+
+
+def to_records(structure, sample, samples):
+    log = RecordArray(structure, samples)
+    append = log.append
+    for _ in range(samples):
+        append(sample)
+    return log
+
+
+def measure(function, structure, sample, samples):
+    start = time.perf_counter()
+    log = function(structure, sample, samples)
+    elapsed = time.perf_counter() - start
+    del log
+    tracemalloc.start()
+    log = function(structure, sample, samples)  # noqa: F841, kept while the memory is traced
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed / samples, memory / samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--structure", default="NT_TIAReading")
+    parser.add_argument("--samples", type=int, default=100000)
+    args = parser.parse_args()
+
+    structure = getattr(structures, args.structure)
+    sample = structure()
+    print("%s, %d fields, %d bytes; %d samples" % (
+        args.structure, len(structure._fields_), len(bytes(sample)), args.samples))
+    for name, function in (("dicts", to_dicts), ("RecordArray", to_records)):
+        seconds, memory = measure(function, structure, sample, args.samples)
+        print("%-16s %10.0f ns/sample %10.1f B/sample" % (name, 1e9 * seconds, memory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Unpacking a numeric SAFEARRAY element by element versus in bulk.
+
+The per-element path makes one SafeArrayGetElement call per value, the bulk
+path one SafeArrayAccessData call and a memmove.  Needs oleaut32, so Windows
+only.
+
+    python benchmarks/safearray_unpack.py --size 10000 --repeat 20
+"""
+import argparse
+import statistics
+import sys
+import timeit
+from array import array
+
+from tlk.definitions import safearray
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if safearray.windll is None:
+        sys.exit("oleaut32 is not available on this platform")
+
+    _, psa = safearray.SafeArray_FromArray(array("d", range(args.size)))
+    paths = [
+        ("per element", lambda: safearray._unpack_elements(psa)),
+        ("tuple", lambda: safearray.UnpackSafeArray(psa)),
+        ("array", lambda: safearray.UnpackSafeArrayData(psa))]
+    if safearray.numpy is not None:
+        paths.append(("numpy", lambda: safearray.UnpackSafeArrayData(psa, as_numpy=True)))
+
+    print("VT_R8 SAFEARRAY of %d elements, %d samples" % (args.size, args.repeat))
+    baseline = None
+    for label, function in paths:
+        times = timeit.repeat(function, number=1, repeat=args.repeat)
+        median = statistics.median(times)
+        if baseline is None:
+            baseline = median
+        print("%-12s median %10.3f ms   min %10.3f ms   %7.1fx" % (
+            label, 1e3 * median, 1e3 * min(times), baseline / median))
+
+
+if __name__ == "__main__":
+    main()
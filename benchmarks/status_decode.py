@@ -0,0 +1,66 @@
+"""Time to decode motor status words: bit tests per flag, a StatusDecoder, and arrays.
+
+The words are --devices status words as a control tick sees them: a few
+distinct values repeated.  "bit tests" is the code every consumer writes,
+testing the masks of moving, homed, limit, fault and enabled on each word;
+"decoder" decodes each word with tlk.status.MOTOR and reads the same flags.
+decode_array tests every flag of the motor family on an array of --words words.
+
+    python benchmarks/status_decode.py --devices 20 --words 1000000
+"""
+import argparse
+import time
+
+from tlk import status
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MOVING = 0x000000f0
+LIMIT = 0x0000000f
+FAULT = 0x4f0fc000
+WORDS = (0x80000500, 0x80000510, 0x80000420, 0x80000401, 0x80004500)
+
+
+def bit_tests(words):
+    for word in words:
+        (word & MOVING != 0, word & 0x400 != 0, word & LIMIT != 0, word & FAULT != 0, word & 0x80000000 != 0)
+
+
+def decoder(words):
+    decode = status.MOTOR.decode
+    for word in words:
+        flags = decode(word)
+        (flags.moving, flags.homed, flags.limit, flags.fault, flags.enabled)
+
+
+def per_call(function, words, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(words)
+    return (time.perf_counter() - start) / repeat / len(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--words", type=int, default=1000000)
+    args = parser.parse_args()
+
+    words = [WORDS[index % len(WORDS)] for index in range(args.devices)]
+    print("%d status words per tick, %d ticks" % (args.devices, args.ticks))
+    print("%-24s %10.0f ns/word" % ("bit tests", 1e9 * per_call(bit_tests, words, args.ticks)))
+    print("%-24s %10.0f ns/word" % ("decoder", 1e9 * per_call(decoder, words, args.ticks)))
+    if numpy is not None:
+        array = numpy.resize(numpy.array(WORDS, dtype=numpy.uint32), args.words)
+        start = time.perf_counter()
+        flags = status.MOTOR.decode_array(array)
+        elapsed = time.perf_counter() - start
+        print("%-24s %10.2f ns/word (%d flags)" % ("decode_array", 1e9 * elapsed / args.words, len(flags)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Memory and CPU time of logging positions and status bits, in lists and with a Sampler.
+
+--devices simulated stages are sampled at --rate for --seconds, once by a
+thread appending (time, position, status) tuples to a list per device, as a
+simple logger would, and once by a tlk.telemetry.Sampler into its ring buffer.
+For each this reports the memory held at the end, as traced by tracemalloc,
+the bytes per sample and the process CPU time.  The list grows with the run;
+the ring buffer is allocated once, for --seconds of samples.
+
+    python benchmarks/telemetry.py --devices 20 --rate 200 --seconds 5
+"""
+import argparse
+import threading
+import time
+import tracemalloc
+
+from tlk import library
+from tlk.telemetry import Sampler
+
+
+def log_to_lists(devices, rate, seconds):
+    # The logger the sampler replaces: module wrappers into lists of tuples.
+    logs = dict((device.serial, []) for device in devices)
+    period = 1.0 / rate
+    stop = time.monotonic() + seconds
+    due = time.monotonic()
+    while due < stop:
+        for device in devices:
+            logs[device.serial].append((time.monotonic(), device.get_position(), device.get_status_bits()))
+        due += period
+        time.sleep(max(0.0, due - time.monotonic()))
+    return logs
+
+
+def log_to_sampler(devices, rate, seconds):
+    sampler = Sampler(rate=rate, capacity=int(rate * seconds) + 1)
+    for device in devices:
+        sampler.add_device(device, ("get_position", "get_status_bits"))
+    sampler.start()
+    time.sleep(seconds)
+    sampler.stop()
+    return sampler
+
+
+def measure(function, devices, rate, seconds):
+    tracemalloc.start()
+    cpu = time.process_time()
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function(devices, rate, seconds)))
+    thread.start()
+    thread.join()
+    cpu = time.process_time() - cpu
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result[0], memory, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=200.0)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import kcubedcservo, simulator
+    devices = []
+    for index in range(args.devices):
+        serial = "%d" % (27000001 + index)
+        simulator.add_device(serial)
+        device = kcubedcservo.KCubeDCServo(serial)
+        device.open_device()
+        devices.append(device)
+
+    print("%d devices at %g Hz for %g s" % (args.devices, args.rate, args.seconds))
+    print("%-16s %10s %12s %12s %12s" % ("", "samples", "memory kB", "B/sample", "CPU s"))
+    logs, memory, cpu = measure(log_to_lists, devices, args.rate, args.seconds)
+    samples = sum(len(log) for log in logs.values())
+    print("%-16s %10d %12.0f %12.1f %12.2f" % ("lists", samples, memory / 1e3, memory / samples, cpu))
+    del logs
+    sampler, memory, cpu = measure(log_to_sampler, devices, args.rate, args.seconds)
+    samples = len(sampler.buffer) * args.devices
+    print("%-16s %10d %12.0f %12.1f %12.2f" % ("Sampler", samples, memory / 1e3, memory / samples, cpu))
+    for device in devices:
+        device.close_device()
+
+
+if __name__ == "__main__":
+    main()
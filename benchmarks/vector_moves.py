@@ -0,0 +1,74 @@
+"""An XY path run as queued vector moves, against two independent moves per point.
+
+The path is --points points of a circle on channels 1 and 2 of a simulated
+benchtop brushless controller, sped up by --time-scale.  "independent" moves
+each channel to the point with its own move and waits for both Moved
+messages, as the two channels of an XY stage are usually driven; "vector"
+queues the whole path on tlk.vector.VectorMoves, built into one
+MOT_ChannelPosition array, and waits for the last future.  Reported are the
+wall time, the time to build the targets and the largest distance between
+the channels' arrival times at a point (independent moves arrive apart; a
+vector move arrives together by construction).
+
+    python benchmarks/vector_moves.py --points 20 --time-scale 20
+"""
+import argparse
+import math
+import time
+
+from tlk import library
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=20)
+    parser.add_argument("--time-scale", type=float, default=20.0)
+    args = parser.parse_args()
+
+    library.set_backend("simulated")
+    from tlk import simulator, vector
+    from tlk.benchtopbrushlessmotor import BenchtopBrushlessMotor
+
+    simulator.add_device("73000001")
+    simulator.time_scale = args.time_scale
+    stage = BenchtopBrushlessMotor("73000001")
+    stage.open_device()
+    units = stage.module.units
+    channels = [stage.channel(1), stage.channel(2)]
+    path = [(5 + 2 * math.cos(2 * math.pi * index / args.points), 5 + math.sin(2 * math.pi * index / args.points))
+            for index in range(args.points)]
+
+    def arrivals(futures):
+        # When each future completed.
+        times = [None] * len(futures)
+        for index, future in enumerate(futures):
+            future.add_done_callback(lambda future, index=index: times.__setitem__(index, time.perf_counter()))
+        return times
+
+    skew = 0.0
+    start = time.perf_counter()
+    for point in path:
+        futures = [channel.moves.move_to_position(units.to_device_units(
+            stage.serial_number, value, channel=channel.number)) for channel, value in zip(channels, point)]
+        times = arrivals(futures)
+        for future in futures:
+            future.result(timeout=30.0)
+        skew = max(skew, abs(times[0] - times[1]))
+    elapsed = time.perf_counter() - start
+    print("%-12s %d points in %6.3f s, arrivals up to %.1f ms apart" % (
+        "independent", args.points, elapsed, 1e3 * skew))
+
+    with vector.VectorMoves(stage, channels=(1, 2)) as xy:
+        start = time.perf_counter()
+        targets = xy.targets(path)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        futures = xy.queue(path)
+        futures[-1].result(timeout=30.0)
+        elapsed = time.perf_counter() - start
+    print("%-12s %d points in %6.3f s, targets built in %.3f ms (%d structures)" % (
+        "vector", args.points, elapsed, 1e3 * built, len(targets)))
+
+
+if __name__ == "__main__":
+    main()
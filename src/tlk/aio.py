@@ -0,0 +1,111 @@
+"""Moves and homing as coroutines, for driving many stages from one event loop.
+
+A Motor wraps a device object, or a channel of a multi-channel controller, and
+its device's MessageBridge.  Its move methods issue the command and return
+once the device has reported the move's end, without a thread blocked in
+wait_for_message:
+
+    from tlk.aio import Motor
+    from tlk.kcubedcservo import KCubeDCServo
+
+    async def main(serials):
+        motors = [Motor(KCubeDCServo(serial)) for serial in serials]
+        for motor in motors:
+            motor.open_device()
+        await asyncio.gather(*(motor.home() for motor in motors))
+        await asyncio.gather(*(motor.move_to(10000) for motor in motors))
+
+The other functions of the device are passed through unchanged, so
+motor.get_position() is the device's get_position().  A motor runs one
+command at a time: starting one while another is awaited, e.g. stop() during a
+move, makes the earlier one return None.  Only the message ending a command
+is taken from the bridge; the others stay in its messages, for the
+MoveDispatcher, a Sampler or wait_for_message.
+"""
+import asyncio
+
+from .definitions.messages import GenericMotor, Homed, Moved, Stopped
+
+
+class Motor(object):
+    """Coroutine moves of a device or channel object, e.g. KCubeDCServo("27000001")."""
+
+    def __init__(self, device):
+        self.device = device
+        self.bridge = device.bridge
+        self._superseded = None
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+    async def _command(self, function, args, message_id, timeout):
+        # Issue the command and wait for the GenericMotor message ending it,
+        # or for Stopped.  A listener on the bridge takes only that message;
+        # messages queued before the command are drained first so that one
+        # from an earlier move is not taken for this one, and every other
+        # message is left to the bridge's other consumers.
+        bridge = self.bridge
+        if not bridge.started:
+            bridge.start()
+        else:
+            bridge.drain()
+        if self._superseded is not None and not self._superseded.done():
+            self._superseded.set_result(None)
+        loop = asyncio.get_running_loop()
+        ended = self._superseded = loop.create_future()
+        taken = False
+
+        def listener(message):
+            # On the draining thread; ended is only set later, on the loop,
+            # so taken keeps a second message of the same drain.
+            nonlocal taken
+            if taken or message.type != GenericMotor or message.id not in (message_id, Stopped):
+                return False
+            taken = True
+            loop.call_soon_threadsafe(_end, ended, message)
+            return True
+
+        bridge.listeners.append(listener)
+        try:
+            function(*args)
+            if timeout is None:
+                return await ended
+            return await asyncio.wait_for(ended, timeout)
+        finally:
+            bridge.listeners.remove(listener)
+
+    def home(self, timeout=None):
+        """Home the device; returns the Homed message (or Stopped if it was stopped)."""
+        return self._command(self.device.home, (), Homed, timeout)
+
+    def move_to(self, position, timeout=None):
+        """Move to position, in device units; returns the Moved message."""
+        return self._command(self.device.move_to_position, (position,), Moved, timeout)
+
+    def move_relative(self, displacement, timeout=None):
+        """Move by displacement, in device units; returns the Moved message."""
+        return self._command(self.device.move_relative, (displacement,), Moved, timeout)
+
+    def move_jog(self, direction, timeout=None):
+        """Jog in direction, a MOT_TravelDirection; returns the Moved message."""
+        return self._command(self.device.move_jog, (direction,), Moved, timeout)
+
+    def stop(self, timeout=None):
+        """Stop with the current velocity profile; returns the Stopped message."""
+        return self._command(self.device.stop_profiled, (), Stopped, timeout)
+
+    async def wait_for_message(self, timeout=None):
+        """The next message of the device, as a tlk.messagebridge.Message."""
+        if not self.bridge.started:
+            self.bridge.start()
+        if timeout is None:
+            return await self.bridge.next_message()
+        return await asyncio.wait_for(self.bridge.next_message(), timeout)
+
+    def __repr__(self):
+        return "Motor(%r)" % (self.device,)
+
+
+def _end(future, message):
+    if not future.done():
+        future.set_result(message)
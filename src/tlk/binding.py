@@ -0,0 +1,310 @@
+"""Wrappers for dll functions, built at import time from a table.
+
+Instead of spelling out every wrapper, a device module describes the functions
+of its dll with one entry each,
+
+    ("GetVelParams", "status", "Gets the move velocity parameters.", (
+        ("out", "acceleration", "c_int"), ("out", "max_velocity", "c_int"))),
+
+that is the name after the prefix, the return convention, the comment and the
+parameters after the serial number (and channel), and bind() sets the restype
+and argtypes of the LazyFunction and defines the wrapper, named as the wrappers
+always were (GetVelParams -> get_vel_params).  Types are given by name, as
+found in ctypes, tlk.definitions.enumerations or tlk.definitions.structures, so
+that a table is one constant and costs no bytecode.
+
+Parameters are (kind, name, type) tuples, of kind
+
+    "in"       a value passed to the function; structures are passed by
+               reference.
+    "out"      a value the function writes through a pointer.
+    "text"     a str passed as a char pointer, given as (kind, name).
+    "buffer"   a char buffer the function writes a str to, followed by its
+               size: (kind, name, size type, size in bytes).
+
+A wrapper takes the serial number, the channel on multi-channel controllers,
+and the in and text parameters in order.  out and buffer parameters are created
+by the wrapper and passed by reference, and are what it returns: nothing, the
+value of the only one, or a tuple of all of them.  Structures are returned as
+they are, buffers as str.  The return convention is one of
+
+    "status"   the function returns an error code: nonzero raises
+               KinesisException, zero returns the outputs.
+    "void"     the outputs are returned.
+    "c_bool"   with outputs, returns them if the function returned true and
+               None if not; without, returns the bool.
+    any other type, whose value is returned as the function returns it,
+               followed by the outputs if there are any.
+
+Wrappers for the usual shapes of function (inputs only, or inputs followed by
+one output) pass their arguments straight through to the foreign function, so
+every table-driven module shares the same few fast code paths.
+"""
+import ctypes
+import functools
+import inspect
+import re
+from collections import namedtuple
+from ctypes import POINTER, Array, Structure, byref, c_char, c_short, create_string_buffer
+
+from . import library
+from .definitions import enumerations, structures
+from .definitions.kinesisexception import KinesisException
+from .library import LazyFunction
+
+
+STATUS = "status"
+VOID = "void"
+
+IN = "in"
+OUT = "out"
+TEXT = "text"
+BUFFER = "buffer"
+
+# A table parameter with its type resolved.
+Parameter = namedtuple("Parameter", "kind name ctype size")
+
+
+def _named_types():
+    named = {}
+    for module in (ctypes, enumerations, structures):
+        named.update((name, value) for name, value in vars(module).items() if isinstance(value, type))
+    return named
+
+
+# Types that can be named in a table.
+types = _named_types()
+
+
+def parameter(spec):
+    # The Parameter of a table parameter tuple.
+
+    kind, name = spec[:2]
+    if kind == TEXT:
+        return Parameter(kind, name, POINTER(c_char), None)
+    return Parameter(kind, name, types[spec[2]], spec[3] if kind == BUFFER else None)
+
+
+def restype(name):
+    # The ctypes restype of a return convention.
+
+    if name == STATUS:
+        return c_short
+    if name == VOID:
+        return None
+    return types[name]
+
+
+# Wrapper names that do not follow from the function name.
+_NAMES = {
+    "Open": "open_device",
+    "Close": "close_device"}
+
+
+@functools.lru_cache(maxsize=None)
+def wrapper_name(suffix):
+    # Name of the wrapper of prefix_suffix.
+
+    name = _NAMES.get(suffix)
+    if name is None:
+        name = re.sub(r"(?<!^)([A-Z])", r"_\1", suffix).lower()
+    return name
+
+
+def argtypes(parameters):
+    # The argtypes of resolved parameters, after the serial number and channel.
+
+    result = []
+    for kind, _, ctype, _ in parameters:
+        if kind == IN:
+            result.append(POINTER(ctype) if issubclass(ctype, Structure) else ctype)
+        elif kind == OUT:
+            result.append(POINTER(ctype))
+        elif kind == TEXT:
+            result.append(ctype)
+        else:
+            result.extend((POINTER(c_char), ctype))
+    return result
+
+
+def _serial(serial_number):
+    # The serial number as an argument for a char pointer.  bytes and buffers
+    # are passed as they are; ints and strs are encoded, without creating a
+    # buffer as encode_serial does.
+
+    if type(serial_number) is str:
+        return serial_number.encode()
+    if isinstance(serial_number, (bytes, Array)):
+        return serial_number
+    return str(serial_number).encode()
+
+
+def _text(value):
+    return value if isinstance(value, (bytes, Array)) or value is None else str(value).encode()
+
+
+def _result(output):
+    if isinstance(output, Structure):
+        return output
+    if isinstance(output, Array):
+        return output.value.decode(errors="replace")
+    return output.value
+
+
+def _passthrough(function, convention):
+    # Every argument is passed on as given.
+    if convention == STATUS:
+        def wrapper(serial_number, *args):
+            error = (function.function or function.resolve())(_serial(serial_number), *args)
+            if error != 0:
+                raise KinesisException(error)
+    elif convention == VOID:
+        def wrapper(serial_number, *args):
+            (function.function or function.resolve())(_serial(serial_number), *args)
+    else:
+        def wrapper(serial_number, *args):
+            return (function.function or function.resolve())(_serial(serial_number), *args)
+    return wrapper
+
+
+def _one_output(function, convention, ctype):
+    # The arguments are passed on as given, followed by a pointer to the output.
+    structure = issubclass(ctype, Structure)
+    if convention == STATUS:
+        def wrapper(serial_number, *args):
+            output = ctype()
+            error = (function.function or function.resolve())(_serial(serial_number), *args, byref(output))
+            if error != 0:
+                raise KinesisException(error)
+            return output if structure else output.value
+    elif convention == "c_bool":
+        def wrapper(serial_number, *args):
+            output = ctype()
+            if (function.function or function.resolve())(_serial(serial_number), *args, byref(output)):
+                return output if structure else output.value
+            return None
+    elif convention == VOID:
+        def wrapper(serial_number, *args):
+            output = ctype()
+            (function.function or function.resolve())(_serial(serial_number), *args, byref(output))
+            return output if structure else output.value
+    else:
+        def wrapper(serial_number, *args):
+            output = ctype()
+            result = (function.function or function.resolve())(_serial(serial_number), *args, byref(output))
+            return result, output if structure else output.value
+    return wrapper
+
+
+def _general(function, convention, parameters, fixed):
+    # Any mix of parameters: the arguments are built parameter by parameter.
+    outputs = sum(kind in (OUT, BUFFER) for kind, _, _, _ in parameters)
+    count = fixed + sum(kind in (IN, TEXT) for kind, _, _, _ in parameters)
+    status = convention == STATUS
+    boolean = convention == "c_bool"
+    value = not (status or boolean or convention == VOID)
+
+    def wrapper(serial_number, *args):
+        if len(args) != count:
+            raise TypeError("%s takes %d arguments (%d given)" % (function.name, count + 1, len(args) + 1))
+        call = [_serial(serial_number)]
+        call.extend(args[:fixed])
+        inputs = iter(args[fixed:])
+        results = []
+        for kind, _, ctype, size in parameters:
+            if kind == IN:
+                call.append(next(inputs))
+            elif kind == TEXT:
+                call.append(_text(next(inputs)))
+            elif kind == OUT:
+                output = ctype()
+                results.append(output)
+                call.append(byref(output))
+            else:
+                output = create_string_buffer(size)
+                results.append(output)
+                call.extend((output, size))
+        result = (function.function or function.resolve())(*call)
+        if status:
+            if result != 0:
+                raise KinesisException(result)
+        elif not outputs:
+            return None if convention == VOID else result
+        elif boolean and not result:
+            return None
+        if not outputs:
+            return None
+        if value:
+            return (result,) + tuple(_result(output) for output in results)
+        if outputs == 1:
+            return _result(results[0])
+        return tuple(_result(output) for output in results)
+
+    return wrapper
+
+
+def make_wrapper(function, convention, parameters, channel=False):
+    # A wrapper for function, a LazyFunction with its types set, following a
+    # return convention.  parameters are resolved.
+
+    kinds = [kind for kind, _, _, _ in parameters]
+    inputs = kinds.count(IN)
+    if kinds == [IN] * inputs:
+        return _passthrough(function, convention)
+    if kinds == [IN] * inputs + [OUT]:
+        return _one_output(function, convention, parameters[-1].ctype)
+    return _general(function, convention, parameters, 1 if channel else 0)
+
+
+# argtypes, shared by the functions that have the same ones.
+_argtypes = {}
+
+# The return convention of every function bound, by prefix_suffix, and the
+# names of those taking a serial number first and of those taking a channel
+# after it.  tlk.devicemanager adds its TLI_ functions.
+conventions = {}
+serial_functions = set()
+channel_functions = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(names):
+    # Signatures are immutable, so wrappers taking the same arguments share one.
+    return inspect.Signature([inspect.Parameter(name, inspect.Parameter.POSITIONAL_ONLY) for name in names])
+
+
+def bind(namespace, lib, prefix, table, channel_type=None, device_functions=(), tag=""):
+    # Define the functions of a table in a module namespace (its globals()):
+    # the LazyFunction prefix_suffix of lib and its wrapper.  On multi-channel
+    # controllers (channel_type given) every function takes a channel after
+    # the serial number, except those named in device_functions.  tag is
+    # appended to the wrapper names, for dlls exporting a function under two
+    # prefixes.
+
+    module = namespace["__name__"]
+    leading = (POINTER(c_char),)
+    for suffix, convention, comment, specs in table:
+        name = "%s_%s" % (prefix, suffix)
+        channel = channel_type is not None and suffix not in device_functions
+        parameters = tuple(parameter(spec) for spec in specs)
+
+        function = LazyFunction(lib, name)
+        function.restype = restype(convention)
+        arguments = leading + ((channel_type,) if channel else ()) + tuple(argtypes(parameters))
+        function.argtypes = _argtypes.setdefault(arguments, arguments)
+        conventions[name] = convention
+        serial_functions.add(name)
+        if channel:
+            channel_functions.add(name)
+        if library.eager_binding:
+            function.resolve()
+        setattr(lib, name, function)
+        namespace[name] = function
+
+        wrapper = make_wrapper(function, convention, parameters, channel)
+        wrapper.__name__ = wrapper.__qualname__ = wrapper_name(suffix) + tag
+        wrapper.__module__ = module
+        wrapper.__doc__ = comment
+        names = ("serial_number", "channel") if channel else ("serial_number",)
+        wrapper.__signature__ = _signature(names + tuple(name for kind, name, _, _ in parameters if kind in (IN, TEXT)))
+        namespace[wrapper.__name__] = wrapper
@@ -0,0 +1,151 @@
+"""Preallocated arguments for calling one device's functions in a loop.
+
+The module level wrappers encode the serial number and create their output
+buffers on every call.  A CallContext does that once: it keeps the encoded
+serial number, the channel and one set of output buffers per function, and
+hands out getters that call straight into the dll with them.
+
+    context = CallContext(kcubedcservo.lib, "KVS", "27000001")
+    get_position = context.get_position
+    while polling:
+        position = get_position()
+
+Functions whose only arguments are the serial number (and channel) return the
+dll's return value.  The others fill their POINTER arguments; a nonzero return
+raises KinesisException and the outputs are returned, as a tuple when there is
+more than one.  Structures are returned as the context's own buffer, which is
+overwritten by the next call of the same getter, so copy them if they are kept.
+A context is not thread safe.  Getters taken from it keep the function they
+were made with; those it hands out as attributes are made again after
+tlk.instrument is enabled or disabled.
+"""
+from ctypes import Structure, byref, c_short
+
+from .definitions.kinesisexception import KinesisException
+from .library import LazyFunction, encode_serial, keeps_functions
+
+
+# The getters called in status and position loops.
+GETTERS = (
+    "get_position",
+    "get_status_bits",
+    "get_position_counter",
+    "get_encoder_counter",
+    "get_vel_params",
+    "get_vel_params_block",
+    "get_jog_step_size",
+    "get_jog_vel_params",
+    "get_jog_mode",
+    "get_homing_velocity",
+    "get_homing_params_block",
+    "get_backlash",
+    "get_move_absolute_position",
+    "get_move_relative_distance",
+    "get_soft_limit_mode",
+    "get_motor_travel_limits",
+    "get_stage_axis_min_pos",
+    "get_stage_axis_max_pos",
+    "message_queue_size",
+    "polling_duration")
+
+
+def _suffix(name):
+    return "".join(part.title() for part in name.split("_"))
+
+
+class CallContext(object):
+    """Encoded serial number, channel and output buffers of one device.
+
+    lib and prefix are those of the device module, e.g. kcubedcservo.lib and
+    "KVS".  channel is given for the channels of multi-channel controllers,
+    as channel_type (c_short for most of them).
+    """
+
+    def __init__(self, lib, prefix, serial_number, channel=None, channel_type=c_short):
+        self.lib = lib
+        self.prefix = prefix
+        self.serial_number = encode_serial(serial_number)
+        if channel is None:
+            self.channel = None
+            self.args = (self.serial_number,)
+        else:
+            self.channel = channel_type(channel)
+            self.args = (self.serial_number, self.channel)
+        keeps_functions(self)
+
+    def function(self, suffix):
+        """The resolved foreign function prefix_suffix."""
+        function = getattr(self.lib, "%s_%s" % (self.prefix, suffix))
+        if isinstance(function, LazyFunction):
+            function = function.function or function.resolve()
+        return function
+
+    def rebind(self):
+        """Forget the getters made on first use, so that they are made with the current functions."""
+        for name in GETTERS:
+            self.__dict__.pop(name, None)
+
+    def call(self, suffix, *args):
+        """Call prefix_suffix with the serial number, channel and args."""
+        return self.function(suffix)(*(self.args + args))
+
+    def getter(self, suffix, *inputs):
+        """A function of no arguments calling prefix_suffix with preallocated buffers.
+
+        inputs are the arguments passed before the outputs on every call.
+        """
+        function = self.function(suffix)
+        args = self.args + inputs
+        outputs = [argtype._type_() for argtype in (function.argtypes or ())[len(args):]]
+
+        if not outputs:
+            def get():
+                return function(*args)
+            return get
+
+        args = args + tuple(byref(output) for output in outputs)
+        if len(outputs) == 1:
+            output = outputs[0]
+            if isinstance(output, Structure):
+                def get():
+                    error = function(*args)
+                    if error != 0:
+                        raise KinesisException(error)
+                    return output
+            else:
+                def get():
+                    error = function(*args)
+                    if error != 0:
+                        raise KinesisException(error)
+                    return output.value
+            return get
+
+        if len(outputs) == 2 and not any(isinstance(output, Structure) for output in outputs):
+            first, second = outputs
+
+            def get():
+                error = function(*args)
+                if error != 0:
+                    raise KinesisException(error)
+                return first.value, second.value
+            return get
+
+        def get():
+            error = function(*args)
+            if error != 0:
+                raise KinesisException(error)
+            return tuple(output if isinstance(output, Structure) else output.value for output in outputs)
+        return get
+
+    def __getattr__(self, name):
+        if name not in GETTERS:
+            raise AttributeError(name)
+        get = self.getter(_suffix(name))
+        setattr(self, name, get)
+        return get
+
+    def __repr__(self):
+        if self.channel is None:
+            return "<CallContext %s %s>" % (self.prefix, self.serial_number.value.decode())
+        return "<CallContext %s %s channel %d>" % (
+            self.prefix, self.serial_number.value.decode(), self.channel.value)
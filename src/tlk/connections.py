@@ -0,0 +1,136 @@
+"""Opening, configuring and closing many devices at once.
+
+Open can take hundreds of milliseconds per device while the dll searches USB,
+and the dll functions release the GIL while they run, so a ConnectionPool
+opens devices on a bounded pool of threads instead of one after another:
+
+    with ConnectionPool(workers=8) as pool:
+        pool.open([KCubeDCServo(serial) for serial in serials], configure=load_settings)
+        ...
+    # every device opened is closed again, in parallel
+
+Open and configure are retried, after a delay doubling on every attempt, when
+they fail with one of retry_codes, the errors the dlls report for a device
+that does not answer or is busy (TL_NO_RESPONSE and TL_CMD_TEMP_UNAVAILABLE).
+The pool keeps the devices it opened until they are closed.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .definitions.kinesisexception import KinesisException
+
+# TL_NO_RESPONSE and TL_CMD_TEMP_UNAVAILABLE.
+RETRY_CODES = (33, 47)
+
+
+def load_settings(device):
+    # Load the stored settings of a device, or of every channel of a
+    # multi-channel controller.
+
+    if device.Channel is None:
+        targets = [device]
+    else:
+        targets = [device.channel(number) for number in range(1, device.get_num_channels() + 1)]
+    for target in targets:
+        if not target.load_settings():
+            raise RuntimeError("%r did not load its settings" % target)
+
+
+def retry(function, args=(), retries=3, delay=0.1, codes=RETRY_CODES):
+    """Call function(*args), again up to retries times while it raises KinesisException of one of codes."""
+    for attempt in range(retries + 1):
+        try:
+            return function(*args)
+        except KinesisException as exception:
+            if attempt == retries or exception.args[0] not in codes:
+                raise
+        time.sleep(delay * 2 ** attempt)
+
+
+class ConnectionPool(object):
+    """Opens and closes devices on up to workers threads, keeping those that are open."""
+
+    def __init__(self, workers=8, retries=3, delay=0.1, retry_codes=RETRY_CODES):
+        self.retries = retries
+        self.delay = delay
+        self.retry_codes = retry_codes
+        self.devices = []
+        self.errors = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tlk-connect")
+
+    def _retry(self, function, *args):
+        return retry(function, args, self.retries, self.delay, self.retry_codes)
+
+    def _open(self, device, configure):
+        self._retry(device.open_device)
+        try:
+            if configure is not None:
+                self._retry(configure, device)
+        except Exception:
+            device.close_device()
+            raise
+        with self._lock:
+            self.devices.append(device)
+        return device
+
+    def _close(self, device):
+        with self._lock:
+            if device in self.devices:
+                self.devices.remove(device)
+        device.close_device()
+
+    def _run(self, function, devices, *args):
+        # Run function for every device; errors are kept in self.errors, by
+        # device, and the first one is raised once all have finished.
+        futures = [(device, self._executor.submit(function, device, *args)) for device in devices]
+        errors = {}
+        for device, future in futures:
+            exception = future.exception()
+            if exception is not None:
+                errors[device] = exception
+        self.errors = errors
+        if errors:
+            raise next(iter(errors.values()))
+
+    def open(self, devices, configure=None):
+        """Open devices in parallel, then call configure(device) for each.
+
+        A device whose configure fails is closed again.  Once every device is
+        done the first error is raised; all of them are in errors, by device.
+        """
+        devices = [device for device in devices if device not in self]
+        self._run(self._open, devices, configure)
+        return devices
+
+    def close(self, devices=None):
+        """Close devices, all those open by default, in parallel."""
+        with self._lock:
+            devices = list(self.devices if devices is None else devices)
+        self._run(self._close, devices)
+
+    def shutdown(self):
+        """Close every device and stop the threads."""
+        try:
+            self.close()
+        finally:
+            self._executor.shutdown()
+
+    def __contains__(self, device):
+        return device in self.devices
+
+    def __len__(self):
+        return len(self.devices)
+
+    def __iter__(self):
+        return iter(list(self.devices))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def __repr__(self):
+        return "<ConnectionPool %d devices open>" % len(self.devices)
@@ -1,48 +1,43 @@
-from ctypes import c_uint
-
-
-class EnumerationType(type(c_uint)):
-    def __new__(metacls, name, bases, dict):
-        if "_members_" not in dict:
-            _members_ = {}
-            for key, value in dict.items():
-                if not key.startswith("_"):
-                    _members_[key] = value
-            dict["_members_"] = _members_
-        cls = type(c_uint).__new__(metacls, name, bases, dict)
-        for key, value in cls._members_.items():
-            globals()[key] = value
-        return cls
-
-    def __contains__(self, value):
-        return value in self._members_.values()
-
-    def __repr__(self):
-        return "<Enumeration %s>" % self.__name__
-
-
-class Enumeration(c_uint):
-    __metaclass__ = EnumerationType
-    _members_ = {}
-
-    def __init__(self, value):
-        for k, v in self._members_.items():
-            if v == value:
-                self.name = k
-                break
-        else:
-            raise ValueError("No enumeration member with value %r" % value)
-        c_uint.__init__(self, value)
+"""Enumerations of the Kinesis headers, as IntEnum classes.
+
+The members are ints, so they are passed to the dll functions and compared
+like the plain values, with nothing to convert; Enumeration(value) finds the
+member of a value in the class's value map.  Every enumeration knows the
+ctypes type the dll takes it as, and its from_param converts a member or
+value to an instance of that type, kept for the next call with the same
+value, so an enumeration can also be given as an argtype.
+"""
+from enum import IntEnum
+
+# Every enumeration made with enumeration(), by name.
+ENUMERATIONS = {}
+
+
+class Enumeration(IntEnum):
+    """Base class of the enumerations; ctype is set for each of them."""
 
     @classmethod
     def from_param(cls, param):
-        if isinstance(param, Enumeration):
-            if param.__class__ != cls:
-                raise ValueError("Cannot mix enumeration members")
-            else:
-                return param
-        else:
-            return cls(param)
-
-    def __repr__(self):
-        return "<member %s=%d of %r>" % (self.name, self.value, self.__class__)
+        """The ctype instance passed for param, a member or value of the enumeration."""
+        try:
+            return cls._parameters[param]
+        except (KeyError, TypeError):
+            # Not converted yet, or a ctypes instance.
+            pass
+        member = cls(getattr(param, "value", param))
+        parameter = cls._parameters[member] = cls.ctype(member)
+        return parameter
+
+
+def enumeration(namespace, name, ctype, members):
+    """Create the Enumeration name of (member, value) members, taken by the dll as ctype.
+
+    Its members, aliases included, are added to namespace, a module's globals(),
+    as the header defines them at file scope.
+    """
+    cls = Enumeration(name, members, module=namespace["__name__"], qualname=name)
+    cls.ctype = ctype
+    cls._parameters = {}
+    ENUMERATIONS[name] = cls
+    namespace.update(cls.__members__)
+    return cls
@@ -1,117 +1,138 @@
 from ctypes import c_byte, c_int16, c_long, c_short, c_uint16, c_ushort
 
+from .enumeration import enumeration
+
 BNT_BNCTriggerModes = c_long
-NT_BNCModeTrigger = c_long(0x0000)
-NT_BNCModeLVOut = c_long(0xFFFF)
+enumeration(globals(), "BNT_BNCTriggerModes", BNT_BNCTriggerModes, (
+    ("NT_BNCModeTrigger", 0x0000),
+    ("NT_BNCModeLVOut", 0xFFFF)))
 
 BNT_CurrentLimit = c_long
-NT_CurrentLimit_100mA = c_long(0x00)
-NT_CurrentLimit_250mA = c_long(0x01)
-NT_CurrentLimit_500mA = c_long(0x02)
+enumeration(globals(), "BNT_CurrentLimit", BNT_CurrentLimit, (
+    ("NT_CurrentLimit_100mA", 0x00),
+    ("NT_CurrentLimit_250mA", 0x01),
+    ("NT_CurrentLimit_500mA", 0x02)))
 
 BNT_FeedbackSignalSelection = c_long
-NT_FeedbackSignalDC = c_long(0x0000)
-NT_FeedbackSignalAC = c_long(0xFFFF)
+enumeration(globals(), "BNT_FeedbackSignalSelection", BNT_FeedbackSignalSelection, (
+    ("NT_FeedbackSignalDC", 0x0000),
+    ("NT_FeedbackSignalAC", 0xFFFF)))
 
 BNT_OutputLowPassFilter = c_long
-NT_OutputFilter_10Hz = c_long(0x0)
-NT_OutputFilter_100Hz = c_long(0x1)
-NT_OutputFilter_5kHz = c_long(0x2)
-NT_OutputFilter_None = c_long(0x3)
+enumeration(globals(), "BNT_OutputLowPassFilter", BNT_OutputLowPassFilter, (
+    ("NT_OutputFilter_10Hz", 0x0),
+    ("NT_OutputFilter_100Hz", 0x1),
+    ("NT_OutputFilter_5kHz", 0x2),
+    ("NT_OutputFilter_None", 0x3)))
 
 ChannelEnableModes = c_int16
-ChannelNone = c_int16(0x00)
-Channel1Only = c_int16(0x01)
-Channel2Only = c_int16(0x02)
-Channel3Only = c_int16(0x03)
-Channel4Only = c_int16(0x04)
-Channels1and2 = c_int16(0x05)
-Channels3and4 = c_int16(0x06)
+enumeration(globals(), "ChannelEnableModes", ChannelEnableModes, (
+    ("ChannelNone", 0x00),
+    ("Channel1Only", 0x01),
+    ("Channel2Only", 0x02),
+    ("Channel3Only", 0x03),
+    ("Channel4Only", 0x04),
+    ("Channels1and2", 0x05),
+    ("Channels3and4", 0x06)))
 
 FF_IOModes = c_long
-FF_ToggleOnPositiveEdge = c_long(0x01)
-FF_SetPositionOnPositiveEdge = c_long(0x02)
-FF_OutputHighAtSetPosition = c_long(0x04)
-FF_OutputHighWhemMoving = c_long(0x08)
+enumeration(globals(), "FF_IOModes", FF_IOModes, (
+    ("FF_ToggleOnPositiveEdge", 0x01),
+    ("FF_SetPositionOnPositiveEdge", 0x02),
+    ("FF_OutputHighAtSetPosition", 0x04),
+    ("FF_OutputHighWhemMoving", 0x08)))
 
 FF_Positions = c_short
 
 FF_SignalModes = c_long
-FF_InputButton = c_long(0x01)
-FF_InputLogic = c_long(0x02)
-FF_InputSwap = c_long(0x04)
-FF_OutputLevel = c_long(0x10)
-FF_OutputPulse = c_long(0x20)
-FF_OutputSwap = c_long(0x40)
+enumeration(globals(), "FF_SignalModes", FF_SignalModes, (
+    ("FF_InputButton", 0x01),
+    ("FF_InputLogic", 0x02),
+    ("FF_InputSwap", 0x04),
+    ("FF_OutputLevel", 0x10),
+    ("FF_OutputPulse", 0x20),
+    ("FF_OutputSwap", 0x40)))
 
 HubAnalogueModes = c_short
+# Values not known, placeholders.
 analogCh1 = c_short()
 analogCh2 = c_short()
 externaSignalSMA = c_short()
 
 KIM_Channels = c_uint16
-Channel1 = c_uint16(1)
-Channel2 = c_uint16(2)
-Channel3 = c_uint16(2)
-Channel4 = c_uint16(4)
+enumeration(globals(), "KIM_Channels", KIM_Channels, (
+    ("Channel1", 1),
+    ("Channel2", 2),
+    ("Channel3", 3),
+    ("Channel4", 4)))
 
 KIM_DirectionSense = c_int16
-Dir_Disabled = c_int16(0x0)
-Dir_Forward = c_int16(0x01)
-Dir_Reverse = c_int16(0x02)
+enumeration(globals(), "KIM_DirectionSense", KIM_DirectionSense, (
+    ("Dir_Disabled", 0x0),
+    ("Dir_Forward", 0x01),
+    ("Dir_Reverse", 0x02)))
 
 KIM_FBSignalMode = c_int16
-FB_LimitSwitch = c_int16(0x01)
-FB_Encoder = c_int16(0x02)
+enumeration(globals(), "KIM_FBSignalMode", KIM_FBSignalMode, (
+    ("FB_LimitSwitch", 0x01),
+    ("FB_Encoder", 0x02)))
 
 KIM_JogMode = c_uint16
-JogContinuous = c_uint16(0x01)
-JogStep = c_uint16(0x02)
+enumeration(globals(), "KIM_JogMode", KIM_JogMode, (
+    ("JogContinuous", 0x01),
+    ("JogStep", 0x02)))
 
 KIM_JoysticModes = c_int16
-JS_Velocity = c_int16(0x01)
-JS_Jog = c_int16(0x02)
-JS_GotoPosition = c_int16(0x03)
+enumeration(globals(), "KIM_JoysticModes", KIM_JoysticModes, (
+    ("JS_Velocity", 0x01),
+    ("JS_Jog", 0x02),
+    ("JS_GotoPosition", 0x03)))
 
 KIM_JoystickModes = c_short
 
 KIM_LimitSwitchModes = c_int16
-Ignore = c_int16(0x01)
-SwitchMakes = c_int16(0x02)
-SwitchBreaks = c_int16(0x03)
-SwitchMakes_HomeOnly = c_int16(0x04)
-SwitchBreaks_HomeOnly = c_int16(0x05)
+enumeration(globals(), "KIM_LimitSwitchModes", KIM_LimitSwitchModes, (
+    ("Ignore", 0x01),
+    ("SwitchMakes", 0x02),
+    ("SwitchBreaks", 0x03),
+    ("SwitchMakes_HomeOnly", 0x04),
+    ("SwitchBreaks_HomeOnly", 0x05)))
 
 KIM_Stages = c_ushort
-Undefined_stage = c_ushort(0)
-PIA_stage = c_ushort(1)
-PDR_Stage = c_ushort(2)
+enumeration(globals(), "KIM_Stages", KIM_Stages, (
+    ("Undefined_stage", 0),
+    ("PIA_stage", 1),
+    ("PDR_Stage", 2)))
 
 KIM_TravelDirection = c_byte
-Forward = c_byte(0x01)
-Reverse = c_byte(0x02)
+enumeration(globals(), "KIM_TravelDirection", KIM_TravelDirection, (
+    ("Forward", 0x01),
+    ("Reverse", 0x02)))
 
 KIM_TrigModes = c_int16
-Trig_Disabled = c_int16(0x00)
-Trig_In_GPI = c_int16(0x01)
-Trig_InRelativeMove = c_int16(0x02)
-Trig_InAbsoluteMove = c_int16(0x03)
-Trig_InResetCount = c_int16(0x04)
-Trig_Out_GP0 = c_int16(0x0A)
-Trig_Out_InMotion = c_int16(0x0B)
-Trig_Out_AtMaxVelocity = c_int16(0x0C)
-Trig_Out_PosStepFwd = c_int16(0x0D)
-Trig_Out_PosStepRev = c_int16(0x0E)
-Trig_Out_PosStepBoth = c_int16(0x0F)
-Trig_Out_AtFwdLimit = c_int16(0x10)
-Trig_Out_AtRevLimit = c_int16(0x11)
-Trig_Out_AtEitherLimit = c_int16(0x12)
+enumeration(globals(), "KIM_TrigModes", KIM_TrigModes, (
+    ("Trig_Disabled", 0x00),
+    ("Trig_In_GPI", 0x01),
+    ("Trig_InRelativeMove", 0x02),
+    ("Trig_InAbsoluteMove", 0x03),
+    ("Trig_InResetCount", 0x04),
+    ("Trig_Out_GP0", 0x0A),
+    ("Trig_Out_InMotion", 0x0B),
+    ("Trig_Out_AtMaxVelocity", 0x0C),
+    ("Trig_Out_PosStepFwd", 0x0D),
+    ("Trig_Out_PosStepRev", 0x0E),
+    ("Trig_Out_PosStepBoth", 0x0F),
+    ("Trig_Out_AtFwdLimit", 0x10),
+    ("Trig_Out_AtRevLimit", 0x11),
+    ("Trig_Out_AtEitherLimit", 0x12)))
 
 KIM_TrigPolarities = c_int16
-Trig_High = c_int16(0x01)
-Trig_Low = c_int16(0x02)
+enumeration(globals(), "KIM_TrigPolarities", KIM_TrigPolarities, (
+    ("Trig_High", 0x01),
+    ("Trig_Low", 0x02)))
 
 KLDTriggerMode = c_short
+# Values not known, placeholders.
 disabled = c_short()
 input = c_short()
 output = c_short()
@@ -122,44 +143,51 @@ highStability = c_short()
 lowStability = c_short()
 
 KLD_RAMPUP = c_int16
-KLD_RampUpImmediate = c_int16(0)
-KLD_RampUpRamped = c_int16(1)
+enumeration(globals(), "KLD_RAMPUP", KLD_RAMPUP, (
+    ("KLD_RampUpImmediate", 0),
+    ("KLD_RampUpRamped", 1)))
 
 KLD_TrigPolarity = c_ushort
-KLD_TrigPol_High = c_ushort(0x01)
-KLD_TrigPol_Low = c_ushort(0x02)
+enumeration(globals(), "KLD_TrigPolarity", KLD_TrigPolarity, (
+    ("KLD_TrigPol_High", 0x01),
+    ("KLD_TrigPol_Low", 0x02)))
 
 KLD_TriggerMode = c_ushort
-KLD_Disabled = c_ushort(0)
-KLD_Output = c_ushort(0x0a)
-KLD_LaserOn = c_ushort(0x0b)
-KLD_InterlockEnabled = c_ushort(0x0c)
-KLD_SetPointChange = c_ushort(0x0d)
-KLD_HighStability = c_ushort(0x0e)
-KLD_LowStability = c_ushort(0x0f)
-KLD_Input = c_ushort(1)
+enumeration(globals(), "KLD_TriggerMode", KLD_TriggerMode, (
+    ("KLD_Disabled", 0),
+    ("KLD_Output", 0x0a),
+    ("KLD_LaserOn", 0x0b),
+    ("KLD_InterlockEnabled", 0x0c),
+    ("KLD_SetPointChange", 0x0d),
+    ("KLD_HighStability", 0x0e),
+    ("KLD_LowStability", 0x0f),
+    ("KLD_Input", 1)))
 
 KLS_OpMode = c_ushort
-KLS_ConstantPower = c_ushort(0)
-KLS_ConstantCurrent = c_ushort(1)
+enumeration(globals(), "KLS_OpMode", KLS_OpMode, (
+    ("KLS_ConstantPower", 0),
+    ("KLS_ConstantCurrent", 1)))
 
 KLS_Polarity = c_short
 
 KLS_TrigPolarity = c_ushort
-KLS_TrigPol_High = c_ushort(0x01)
-KLS_TrigPol_Low = c_ushort(0x02)
+enumeration(globals(), "KLS_TrigPolarity", KLS_TrigPolarity, (
+    ("KLS_TrigPol_High", 0x01),
+    ("KLS_TrigPol_Low", 0x02)))
 
 KLS_TriggerMode = c_short
-KLS_Disabled = c_short(0)
-KLS_Output = c_short(0x0a)
-KLS_LaserOn = c_short(0x0b)
-KLS_InterlockEnabled = c_short(0x0c)
-KLS_SetPointChange = c_short(0x0d)
-KLS_HighStability = c_short(0x0e)
-KLS_LowStability = c_short(0x0f)
-KLS_Input = c_short(1)
+enumeration(globals(), "KLS_TriggerMode", KLS_TriggerMode, (
+    ("KLS_Disabled", 0),
+    ("KLS_Output", 0x0a),
+    ("KLS_LaserOn", 0x0b),
+    ("KLS_InterlockEnabled", 0x0c),
+    ("KLS_SetPointChange", 0x0d),
+    ("KLS_HighStability", 0x0e),
+    ("KLS_LowStability", 0x0f),
+    ("KLS_Input", 1)))
 
 KMOT_TriggerPortMode = c_short
+# Values not known, placeholders.
 triggerDisabled = c_short()
 inputGeneralPurposeLogic = c_short()
 inputMoveRelative = c_short()
@@ -173,29 +201,34 @@ outputPredefinedPositionSteps = c_short()
 outputTBDMode = c_short()
 
 KMOT_TriggerPortPolarity = c_short
+# Values not known, placeholders.
 outputHigh = c_short()
 ouptutLow = c_short()
 
 KMOT_WheelDirectionSense = c_short
 
 KMOT_WheelMode = c_short
+# Values not known, placeholders.
 constantVelocity = c_short()
 jog = c_short()
 moveAbsolute = c_short()
 
 KNA_Channels = c_long
-KNA_ChannelUndefined = c_long(0x00)
-KNA_Channel1 = c_long(0x01)
-KNA_Channel2 = c_long(0x02)
+enumeration(globals(), "KNA_Channels", KNA_Channels, (
+    ("KNA_ChannelUndefined", 0x00),
+    ("KNA_Channel1", 0x01),
+    ("KNA_Channel2", 0x02)))
 
 KNA_FeedbackModeTypes = c_short
-PZ_ControlModeUndefined = c_short(0)
-PZ_OpenLoop = c_short(1)
-PZ_CloseLoop = c_short(2)
-PZ_OpenLoopSmooth = c_short(3)
-PZ_CloseLoopSmooth = c_short(4)
+enumeration(globals(), "KNA_FeedbackModeTypes", KNA_FeedbackModeTypes, (
+    ("PZ_ControlModeUndefined", 0),
+    ("PZ_OpenLoop", 1),
+    ("PZ_CloseLoop", 2),
+    ("PZ_OpenLoopSmooth", 3),
+    ("PZ_CloseLoopSmooth", 4)))
 
 KNA_FeedbackSource = c_short
+# Values not known, placeholders.
 tiaValue = c_short()
 bnc1VRange = c_short()
 bnc2VRange = c_short()
@@ -203,22 +236,27 @@ bnc5VRange = c_short()
 bnc10VRange = c_short()
 
 KNA_HighOutputVoltageRoute = c_short
+# Values not known, placeholders.
 default = c_short()
 extinSMA = c_short()
 extoutSMA = c_short()
 enableInputboost = c_short()
 
 KNA_HighVoltageRange = c_short
+# Values not known, placeholders.
 default75V = c_short()
 high150V = c_short()
 
 KNA_LowOutputVoltageRoute = c_short
+# Values not known, placeholders.
 outputIO1connector = c_short()
 
 KNA_LowVoltageRange = c_short
+# Values not known, placeholders.
 v10V = c_short()
 
 KNA_TIARange = c_short
+# Values not known, placeholders.
 i5nA = c_short()
 i16nA = c_short()
 i50nA = c_short()
@@ -236,6 +274,7 @@ i5mA = c_short()
 KNA_TriggerPolarity = c_short
 
 KNA_TriggerPortMode = c_short
+# Values not known, placeholders.
 disabled = c_short()
 inputLatching = c_short()
 inputTracking = c_short()
@@ -244,15 +283,18 @@ output = c_short()
 outputTracking = c_short()
 
 KNA_TriggerPortPolarity = c_short
+# Values not known, placeholders.
 outputHigh = c_short()
 OutputLow = c_short()
 
 KNA_WheelAdjustRate = c_short
+# Values not known, placeholders.
 lowVoltageChangeRate = c_short()
 mediumVoltageChangeRate = c_short()
 highVoltageChangeRate = c_short()
 
 KPC_HubAnalogueModes = c_short
+# Values not known, placeholders.
 inputDisabled = c_short()
 allHubBays = c_short()
 adjacentHubBays = c_short()
@@ -263,6 +305,7 @@ KPC_IOSettings = c_short
 KPC_MonitorOutputMode = c_short
 
 KPC_TriggerPortMode = c_short
+# Values not known, placeholders.
 disabled = c_short()
 inputGeneralPurpose = c_short()
 inputRelative = c_short()
@@ -270,10 +313,12 @@ inputAbsolute = c_short()
 outputGeneralPurpose = c_short()
 
 KPC_TriggerPortPolarity = c_short
+# Values not known, placeholders.
 highWhenSet = c_short()
 lowWhenSet = c_short()
 
 KPZ_TriggerPortMode = c_short
+# Values not known, placeholders.
 ddisabled = c_short()
 inputGeneralPurpose = c_short()
 inputRelative = c_short()
@@ -281,50 +326,59 @@ inputAbsolute = c_short()
 outputGeneralPurpose = c_short()
 
 KPZ_TriggerPortPolarity = c_short
+# Values not known, placeholders.
 highWhenSet = c_short()
 lowWhenSet = c_short()
 
 KPZ_WheelChangeRate = c_int16
-KPZ_WM_High = c_int16(0x01)
-KPZ_WM_Medium = c_int16(0x02)
-KPZ_WM_Low = c_int16(0x03)
+enumeration(globals(), "KPZ_WheelChangeRate", KPZ_WheelChangeRate, (
+    ("KPZ_WM_High", 0x01),
+    ("KPZ_WM_Medium", 0x02),
+    ("KPZ_WM_Low", 0x03)))
 
 KPZ_WheelDirectionSense = c_int16
-KPZ_WM_Positive = c_int16(0x01)
-KPZ_WM_Negative = c_int16(0x02)
+enumeration(globals(), "KPZ_WheelDirectionSense", KPZ_WheelDirectionSense, (
+    ("KPZ_WM_Positive", 0x01),
+    ("KPZ_WM_Negative", 0x02)))
 
 KPZ_WheelMode = c_int16
-KPZ_WM_MoveAtVoltage = c_int16(0x01)
-KPZ_WM_JogVoltage = c_int16(0x02)
-KPZ_WM_SetVoltage = c_int16(0x03)
+enumeration(globals(), "KPZ_WheelMode", KPZ_WheelMode, (
+    ("KPZ_WM_MoveAtVoltage", 0x01),
+    ("KPZ_WM_JogVoltage", 0x02),
+    ("KPZ_WM_SetVoltage", 0x03)))
 
 KSC_TriggerPolarity = c_short
 
 KSC_TriggerPortMode = c_int16
-KSC_TrigDisabled = c_int16(0x00)
-KSC_TrigIn_GPI = c_int16(0x01)
-KSC_TrigOut_GPO = c_int16(0x0A)
+enumeration(globals(), "KSC_TriggerPortMode", KSC_TriggerPortMode, (
+    ("KSC_TrigDisabled", 0x00),
+    ("KSC_TrigIn_GPI", 0x01),
+    ("KSC_TrigOut_GPO", 0x0A)))
 
 KSC_TriggerPortPolarity = c_int16
-KSC_TrigPolarityHigh = c_int16(0x01)
-KSC_TrigPolarityLow = c_int16(0x02)
+enumeration(globals(), "KSC_TriggerPortPolarity", KSC_TriggerPortPolarity, (
+    ("KSC_TrigPolarityHigh", 0x01),
+    ("KSC_TrigPolarityLow", 0x02)))
 
 KSG_TriggerPortMode = c_int16
-KSG_TrigDisabled = c_int16(0x00)
-KSG_TrigIn_GPI = c_int16(0x01)
-KSG_TrigOut_GPO = c_int16(0x0A)
-KSG_TrigOut_LessThanLowerLimit = c_int16(0x0B)
-KSG_TrigOut_MoreThanLowerLimit = c_int16(0x0C)
-KSG_TrigOut_LessThanUpperLimit = c_int16(0x0D)
-KSG_TrigOut_MoreThanUpperLimit = c_int16(0x0E)
-KSG_TrigOut_BetweenLimits = c_int16(0x0F)
-KSG_TrigOut_OutsideLimits = c_int16(0x10)
+enumeration(globals(), "KSG_TriggerPortMode", KSG_TriggerPortMode, (
+    ("KSG_TrigDisabled", 0x00),
+    ("KSG_TrigIn_GPI", 0x01),
+    ("KSG_TrigOut_GPO", 0x0A),
+    ("KSG_TrigOut_LessThanLowerLimit", 0x0B),
+    ("KSG_TrigOut_MoreThanLowerLimit", 0x0C),
+    ("KSG_TrigOut_LessThanUpperLimit", 0x0D),
+    ("KSG_TrigOut_MoreThanUpperLimit", 0x0E),
+    ("KSG_TrigOut_BetweenLimits", 0x0F),
+    ("KSG_TrigOut_OutsideLimits", 0x10)))
 
 KSG_TriggerPortPolarity = c_int16
-KSG_TrigPolarityHigh = c_int16(0x01)
-KSG_TrigPolarityLow = c_int16(0x02)
+enumeration(globals(), "KSG_TriggerPortPolarity", KSG_TriggerPortPolarity, (
+    ("KSG_TrigPolarityHigh", 0x01),
+    ("KSG_TrigPolarityLow", 0x02)))
 
 KST_Stages = c_short
+# Values not known, placeholders.
 ZST6 = c_short()
 ZST13 = c_short()
 ZST25 = c_short()
@@ -340,61 +394,69 @@ PLS_XHiRes = c_short()
 FW103 = c_short()
 
 LD_DisplayUnits = c_ushort
-LD_ILim = c_ushort(0x01)
-LD_ILD = c_ushort(0x02)
-LD_IPD = c_ushort(0x03)
-LD_PLD = c_ushort(0x04)
+enumeration(globals(), "LD_DisplayUnits", LD_DisplayUnits, (
+    ("LD_ILim", 0x01),
+    ("LD_ILD", 0x02),
+    ("LD_IPD", 0x03),
+    ("LD_PLD", 0x04)))
 
 LD_InputSourceFlags = c_ushort
-LD_SoftwareOnly = c_ushort(0)
-LD_SoftwareOnly = c_ushort(0x01)
-LD_Potentiometer = c_ushort(0x01)
-LD_ExternalSignal = c_ushort(0x02)
-LD_Potentiometer = c_ushort(0x04)
-LD_WheelAndSoftware = c_ushort(0x04)
+enumeration(globals(), "LD_InputSourceFlags", LD_InputSourceFlags, (
+    ("LD_SoftwareOnly", 0x01),
+    ("LD_ExternalSignal", 0x02),
+    ("LD_Potentiometer", 0x04),
+    ("LD_WheelAndSoftware", 0x04)))
 
 LD_POLARITY = c_int16
-LD_CathodeGrounded = c_int16(1)
-LD_AnodeGrounded = c_int16(2)
+enumeration(globals(), "LD_POLARITY", LD_POLARITY, (
+    ("LD_CathodeGrounded", 1),
+    ("LD_AnodeGrounded", 2)))
 
 LD_TIA_RANGES = c_int16
-LD_TIA_10uA = c_int16(1)
-LD_TIA_1_10uA = c_int16(1)
-LD_TIA_100uA = c_int16(2)
-LD_TIA_2_100uA = c_int16(2)
-LD_TIA_1mA = c_int16(4)
-LD_TIA_3_1mA = c_int16(4)
-LD_TIA_10mA = c_int16(8)
-LD_TIA_4_10mA = c_int16(8)
+enumeration(globals(), "LD_TIA_RANGES", LD_TIA_RANGES, (
+    ("LD_TIA_10uA", 1),
+    ("LD_TIA_1_10uA", 1),
+    ("LD_TIA_100uA", 2),
+    ("LD_TIA_2_100uA", 2),
+    ("LD_TIA_1mA", 4),
+    ("LD_TIA_3_1mA", 4),
+    ("LD_TIA_10mA", 8),
+    ("LD_TIA_4_10mA", 8)))
 
 LS_DisplayUnits = c_ushort
-LS_mAmps = c_ushort(0x01)
-LS_mWatts = c_ushort(0x02)
-LS_mDb = c_ushort(0x03)
+enumeration(globals(), "LS_DisplayUnits", LS_DisplayUnits, (
+    ("LS_mAmps", 0x01),
+    ("LS_mWatts", 0x02),
+    ("LS_mDb", 0x03)))
 
 LS_InputSourceFlags = c_ushort
-LS_SoftwareOnly = c_ushort(0)
-LS_ExternalSignal = c_ushort(0x01)
-LS_Potentiometer = c_ushort(0x04)
-LS_WheelAndSoftware = c_ushort(0x04)
+enumeration(globals(), "LS_InputSourceFlags", LS_InputSourceFlags, (
+    ("LS_SoftwareOnly", 0),
+    ("LS_ExternalSignal", 0x01),
+    ("LS_Potentiometer", 0x04),
+    ("LS_WheelAndSoftware", 0x04)))
 
 MOD_AuxIOPortMode = c_short
+# Values not known, placeholders.
 SW = c_short()
 ENC = c_short()
 
 MOD_IOPortMode = c_short
+# Values not known, placeholders.
 digitalInput = c_short()
 digitalOutput = c_short()
 analogInput = c_short()
 analogOutput = c_short()
 
 MOD_IOPortSource = c_short
+# Values not known, placeholders.
 software = c_short()
 motorCh1 = c_short()
 motorCh2 = c_short()
 motorCh3 = c_short()
 
 MOD_Monitor_Variable = c_short
+# Values not known, placeholders.
 positionError = c_short()
 position = c_short()
 motorPhaseACurrent = c_short()
@@ -403,29 +465,35 @@ motorPhaseCCurrent = c_short()
 motorCurrent = c_short()
 
 MOT_ButtonModes = c_short
+# Values not known, placeholders.
 joggingMode = c_short()
 presentMode = c_short()
 
 MOT_CurrentLoopPhases = c_long
+# Values not known, placeholders.
 phaseA = c_long()
 phaseB = c_long()
 phaseAandB = c_long()
 
 MOT_DirectionSense = c_short
+# Values not known, placeholders.
 normal = c_short()
 backwards = c_short()
 
 MOT_HomeLimitSwitchDirection = c_short
+# Values not known, placeholders.
 undefined = c_short()
 forward = c_short()
 reverse = c_short()
 
 MOT_JogModes = c_short
+# Values not known, placeholders.
 undefined = c_short()
 continuousJog = c_short()
 jogOneStep = c_short()
 
 MOT_LimitSwitchModes = c_short
+# Values not known, placeholders.
 undefined = c_short()
 ignore = c_short()
 makesOnContact = c_short()
@@ -440,6 +508,7 @@ makesOnContactWhenHomingSwapped = c_short()
 breaksOnContactWhenHomingSwapped = c_short()
 
 MOT_LimitSwitchSWModes = c_short
+# Values not known, placeholders.
 undefined = c_short()
 ignore = c_short()
 stopImmediately = c_short()
@@ -449,11 +518,13 @@ stopImmediatelyRotational = c_short()
 stopProfiledRotational = c_short()
 
 MOT_LimitsSoftwareApproachPolicy = c_short
+# Values not known, placeholders.
 disallowIllegalMoves = c_short()
 allowPartialMoves = c_short()
 allowAllMoves = c_short()
 
 MOT_MotorTypes = c_long
+# Values not known, placeholders.
 notAMotor = c_long()
 dcMotor = c_long()
 stepperMotor = c_long()
@@ -461,30 +532,36 @@ brushlessMotor = c_long()
 customMotor = c_long()
 
 MOT_MovementDirections = c_short
+# Values not known, placeholders.
 quickest = c_short()
 forwards = c_short()
 reverse = c_short()
 
 MOT_MovementModes = c_short
+# Values not known, placeholders.
 linearRange = c_short()
 rotationalUnlimited = c_short()
 rotationalWrapping = c_short()
 
 MOT_PID_LoopMode = c_long
+# Values not known, placeholders.
 disabled = c_long()
 openLoop = c_long()
 closedLoop = c_long()
 
 MOT_RasterScanMoveCmd = c_short
+# Values not known, placeholders.
 start = c_short()
 pause = c_short()
 stopDisable = c_short()
 
 MOT_RasterScanMovePattern = c_long
+# Values not known, placeholders.
 flyback = c_long()
 fowardReverse = c_long()
 
 MOT_RasterScanMoveTriggerMode = c_long
+# Values not known, placeholders.
 software = c_long()
 xStep = c_long()
 yStep = c_long()
@@ -492,21 +569,25 @@ xyScan = c_long()
 onOff = c_long()
 
 MOT_StopModes = c_short
+# Values not known, placeholders.
 undefined = c_short()
 immediate = c_short()
 profiled = c_short()
 
 MOT_TravelDirection = c_short
+# Values not known, placeholders.
 undefined = c_short()
 fowards = c_short()
 reverse = c_short()
 
 MOT_TravelModes = c_short
+# Values not known, placeholders.
 undefined = c_short()
 linear = c_short()
 rotational = c_short()
 
 MOT_TriggerInputConfigModes = c_short
+# Values not known, placeholders.
 triggerInDisabled = c_short()
 triggerInGeneralPurpose = c_short()
 triggerInRelative = c_short()
@@ -515,12 +596,14 @@ triggerInHome = c_short()
 triggerInStop = c_short()
 
 MOT_TriggerInputSource = c_short
+# Values not known, placeholders.
 software = c_short()
 port1 = c_short()
 port2 = c_short()
 port3 = c_short()
 
 MOT_TriggerOutputConfigModes = c_short
+# Values not known, placeholders.
 triggerOutDisabled = c_short()
 triggerOutGeneralPurpose = c_short()
 triggerOutInMotion = c_short()
@@ -533,43 +616,51 @@ triggerOutAtBackwardsLimit = c_short()
 triggerOutAtLimit = c_short()
 
 MOT_TriggerPolarity = c_short
+# Values not known, placeholders.
 high = c_short()
 low = c_short()
 
 MOT_TriggerState = c_short
+# Values not known, placeholders.
 arm = c_short()
 cancel = c_short()
 
 MOT_VelocityProfileModes = c_long
+# Values not known, placeholders.
 trapezoidal = c_long()
 sCurve = c_long()
 
 MPC_IOModes = c_long
-MPC_ToggleOnPositiveEdge = c_long(0x01)
-MPC_SetPositionOnPositiveEdge = c_long(0x02)
-MPC_OutputHighAtSetPosition = c_long(0x04)
-MPC_OutputHighWhemMoving = c_long(0x08)
+enumeration(globals(), "MPC_IOModes", MPC_IOModes, (
+    ("MPC_ToggleOnPositiveEdge", 0x01),
+    ("MPC_SetPositionOnPositiveEdge", 0x02),
+    ("MPC_OutputHighAtSetPosition", 0x04),
+    ("MPC_OutputHighWhemMoving", 0x08)))
 
 MPC_SignalModes = c_long
-MPC_InputButton = c_long(0x01)
-MPC_InputLogic = c_long(0x02)
-MPC_InputSwap = c_long(0x04)
-MPC_OutputLevel = c_long(0x10)
-MPC_OutputPulse = c_long(0x20)
-MPC_OutputSwap = c_long(0x40)
+enumeration(globals(), "MPC_SignalModes", MPC_SignalModes, (
+    ("MPC_InputButton", 0x01),
+    ("MPC_InputLogic", 0x02),
+    ("MPC_InputSwap", 0x04),
+    ("MPC_OutputLevel", 0x10),
+    ("MPC_OutputPulse", 0x20),
+    ("MPC_OutputSwap", 0x40)))
 
 NT_CircleAdjustment = c_long
+# Values not known, placeholders.
 linear = c_long()
 log = c_long()
 square = c_long()
 cube = c_long()
 
 NT_CircleDiameterMode = c_long
+# Values not known, placeholders.
 fixed = c_long()
 absPower = c_long()
 LUT = c_long()
 
 NT_ControlMode = c_long
+# Values not known, placeholders.
 undefined = c_long()
 openLoop = c_long()
 closedLoop = c_long()
@@ -577,6 +668,7 @@ openLoopSmoothed = c_long()
 closedLoopSmoothed = c_long()
 
 NT_FeedbackSource = c_long
+# Values not known, placeholders.
 undefined = c_long()
 tia = c_long()
 bnc1V = c_long()
@@ -585,6 +677,7 @@ bnc5V = c_long()
 bnc10V = c_long()
 
 NT_LowPassFrequency = c_long
+# Values not known, placeholders.
 disabled = c_long()
 f1Hz = c_long()
 f3Hz = c_long()
@@ -593,6 +686,7 @@ f30Hz = c_long()
 f100Hz = c_long()
 
 NT_Mode = c_long
+# Values not known, placeholders.
 undefined = c_long()
 piezo = c_long()
 latched = c_long()
@@ -601,17 +695,20 @@ horizontalTracking = c_long()
 verticalTracking = c_long()
 
 NT_OddOrEven = c_short
+# Values not known, placeholders.
 allTIARanges = c_short()
 onlyOdd = c_short()
 onlyEven = c_short()
 
 NT_OutputVoltageRoute = c_long
+# Values not known, placeholders.
 smaOnly = c_long()
 smaAndHub = c_long()
 
 NT_SignalState = c_short
 
 NT_TIARange = c_long
+# Values not known, placeholders.
 i5nA = c_long()
 i16nA = c_long()
 i50nA = c_long()
@@ -627,16 +724,19 @@ i1p66mA = c_long()
 i5mA = c_long()
 
 NT_TIARangeMode = c_short
+# Values not known, placeholders.
 automaticCurrent = c_short()
 manualCurrent = c_short()
 automaticSupplied = c_short()
 
 NT_UnderOrOver = c_long
+# Values not known, placeholders.
 inRange = c_long()
 underRange = c_long()
 overRange = c_long()
 
 NT_VoltageRange = c_long
+# Values not known, placeholders.
 v5V = c_long()
 v10V = c_long()
 
@@ -657,68 +757,76 @@ PCC_NotchFilterChannel = c_long
 PCC_NotchFilterState = c_long
 
 PDXC2_TriggerModes = c_uint16
-Manual = c_uint16(0x00)
-AnalogRising = c_uint16(0x01)
-AnalogFalling = c_uint16(0x02)
-FixedStepRising = c_uint16(0x03)
-FixedStepFalling = c_uint16(0x04)
-TwoPositionRising = c_uint16(0x05)
-TwoPositionFalling = c_uint16(0x06)
+enumeration(globals(), "PDXC2_TriggerModes", PDXC2_TriggerModes, (
+    ("Manual", 0x00),
+    ("AnalogRising", 0x01),
+    ("AnalogFalling", 0x02),
+    ("FixedStepRising", 0x03),
+    ("FixedStepFalling", 0x04),
+    ("TwoPositionRising", 0x05),
+    ("TwoPositionFalling", 0x06)))
 
-POL_PaddleBits = None
+POL_PaddleBits = c_uint16
 
 POL_Paddles = c_short
 
 POL_PattleBits = c_short
 
 PPC_DerivFilterState = c_short
-DerivFilterOn = c_short(0x01)
-DerivFilterOff = c_short(0x02)
-DerivFilterOn = c_short(0x1)
-DerivFilterOff = c_short(0x2)
+enumeration(globals(), "PPC_DerivFilterState", PPC_DerivFilterState, (
+    ("DerivFilterOn", 0x1),
+    ("DerivFilterOff", 0x2)))
 
 PPC_DisplayIntensity = c_short
-Bright = c_short(0x01)
-Dim = c_short(0x02)
-Off = c_short(0x03)
+enumeration(globals(), "PPC_DisplayIntensity", PPC_DisplayIntensity, (
+    ("Bright", 0x01),
+    ("Dim", 0x02),
+    ("Off", 0x03)))
 
 PPC_FeedbackPolarity = c_long
-Inverted = c_long((c_ushort) - 1)
-Inverted = c_long(-1)
-NonInverted = c_long(0)
+enumeration(globals(), "PPC_FeedbackPolarity", PPC_FeedbackPolarity, (
+    ("Inverted", -1),
+    ("NonInverted", 0)))
 
 PPC_IOControlMode = c_short
-SWOnly = c_short(0x00)
-ExtBNC = c_short(0x01)
-Joystick = c_short(0x02)
-JoystickBnc = c_short(0x03)
+enumeration(globals(), "PPC_IOControlMode", PPC_IOControlMode, (
+    ("SWOnly", 0x00),
+    ("ExtBNC", 0x01),
+    ("Joystick", 0x02),
+    ("JoystickBnc", 0x03)))
 
 PPC_IOFeedbackSourceDefinition = c_short
-StrainGauge = c_short(0x01)
-Capacitive = c_short(0x02)
-Optical = c_short(0x03)
+enumeration(globals(), "PPC_IOFeedbackSourceDefinition", PPC_IOFeedbackSourceDefinition, (
+    ("StrainGauge", 0x01),
+    ("Capacitive", 0x02),
+    ("Optical", 0x03)))
 
 PPC_IOOutputBandwidth = c_short
-OP_Unfiltered = c_short(0x01)
-OP_200Hz = c_short(0x02)
+enumeration(globals(), "PPC_IOOutputBandwidth", PPC_IOOutputBandwidth, (
+    ("OP_Unfiltered", 0x01),
+    ("OP_200Hz", 0x02)))
 
 PPC_IOOutputMode = c_short
-HV = c_short(0x01)
-PosRaw = c_short(0x02)
-PosCorrected = c_short(0x03)
+enumeration(globals(), "PPC_IOOutputMode", PPC_IOOutputMode, (
+    ("HV", 0x01),
+    ("PosRaw", 0x02),
+    ("PosCorrected", 0x03)))
 
 PPC_NotchFilterChannel = c_short
-NotchFilter1 = c_short(0x01)
-NotchFilter2 = c_short(0x02)
-NotchFilterBoth = c_short(0x03)
+enumeration(globals(), "PPC_NotchFilterChannel", PPC_NotchFilterChannel, (
+    ("NotchFilter1", 0x01),
+    ("NotchFilter2", 0x02),
+    ("NotchFilterBoth", 0x03)))
 
 PPC_NotchFilterState = c_short
-NotchFilterOn = c_short(0x01)
-NotchFilterOff = c_short(0x02)
+enumeration(globals(), "PPC_NotchFilterState", PPC_NotchFilterState, (
+    ("NotchFilterOn", 0x01),
+    ("NotchFilterOff", 0x02)))
 
 PZ_AmpOutParameters = c_short
 
 PZ_ControlModeTypes = c_short
+# Values not known, placeholders.
 undefined = c_short()
 openLoop = c_short()
 closedLoop = c_short()
@@ -726,6 +834,7 @@ openLoopSmoothed = c_short()
 closedLoopSmoothed = c_short()
 
 PZ_InputSourceFlags = c_short
+# Values not known, placeholders.
 softwareOnly = c_short()
 externalSignal = c_short()
 potentiometer = c_short()
@@ -734,6 +843,7 @@ all = c_short()
 PZ_JogModes = c_long
 
 PZ_OutputLUTModes = c_short
+# Values not known, placeholders.
 continuous = c_short()
 fixed = c_short()
 outputTrigEnabled = c_short()
@@ -743,93 +853,96 @@ inputTrigSenseHigh = c_short()
 outputGated = c_short()
 outputTrigRepeated = c_short()
 
-PZ_StageAxisParameters = None
-
-PolarizerParameters = None
-
 QD_FilterEnable = c_long
-QD_Undefined = c_long(0)
-QD_Enabled = c_long(1)
-QD_Disabled = c_long(2)
+enumeration(globals(), "QD_FilterEnable", QD_FilterEnable, (
+    ("QD_Undefined", 0),
+    ("QD_Enabled", 1),
+    ("QD_Disabled", 2)))
 
 QD_KPA_TrigModes = c_long
-QD_Trig_Disabled = c_long(0x00)
-QD_TrigIn_GPI = c_long(0x01)
-QD_TrigIn_LoopOpenClose = c_long(0x02)
-KD_TrigOut_GPO = c_long(0x0A)
-KD_TrigOut_Sum = c_long(0x0B)
-KD_TrigOut_Diff = c_long(0x0C)
-KD_TrigOut_SumDiff = c_long(0x0D)
+enumeration(globals(), "QD_KPA_TrigModes", QD_KPA_TrigModes, (
+    ("QD_Trig_Disabled", 0x00),
+    ("QD_TrigIn_GPI", 0x01),
+    ("QD_TrigIn_LoopOpenClose", 0x02),
+    ("KD_TrigOut_GPO", 0x0A),
+    ("KD_TrigOut_Sum", 0x0B),
+    ("KD_TrigOut_Diff", 0x0C),
+    ("KD_TrigOut_SumDiff", 0x0D)))
 
 QD_KPA_TrigPolarities = c_long
-GD_Trig_High = c_long(0x01)
-GD_Trig_Low = c_long(0x02)
+enumeration(globals(), "QD_KPA_TrigPolarities", QD_KPA_TrigPolarities, (
+    ("GD_Trig_High", 0x01),
+    ("GD_Trig_Low", 0x02)))
 
 QD_LowVoltageRoute = c_short
-QD_RouteUndefined = c_short(0)
-QD_SMAOnly = c_short(1)
-QD_HubAndSMA = c_short(2)
+enumeration(globals(), "QD_LowVoltageRoute", QD_LowVoltageRoute, (
+    ("QD_RouteUndefined", 0),
+    ("QD_SMAOnly", 1),
+    ("QD_HubAndSMA", 2)))
 
 QD_OpenLoopHoldValues = c_short
-QD_HoldOnZero = c_short(1)
-QD_HoldOnLastValue = c_short(2)
+enumeration(globals(), "QD_OpenLoopHoldValues", QD_OpenLoopHoldValues, (
+    ("QD_HoldOnZero", 1),
+    ("QD_HoldOnLastValue", 2)))
 
 QD_OperatingMode = c_short
-QD_ModeUndefined = c_short(0)
-QD_Monitor = c_short(1)
-QD_OpenLoop = c_short(2)
-QD_ClosedLoop = c_short(3)
-QD_AutoOpenClosedLoop = c_short(4)
+enumeration(globals(), "QD_OperatingMode", QD_OperatingMode, (
+    ("QD_ModeUndefined", 0),
+    ("QD_Monitor", 1),
+    ("QD_OpenLoop", 2),
+    ("QD_ClosedLoop", 3),
+    ("QD_AutoOpenClosedLoop", 4)))
 
 SC_OperatingModes = c_byte
-SC_Manual = c_byte(0x01)
-SC_Single = c_byte(0x02)
-SC_Auto = c_byte(0x03)
-SC_Triggered = c_byte(0x04)
+enumeration(globals(), "SC_OperatingModes", SC_OperatingModes, (
+    ("SC_Manual", 0x01),
+    ("SC_Single", 0x02),
+    ("SC_Auto", 0x03),
+    ("SC_Triggered", 0x04)))
 
 SC_OperatingStates = c_byte
-SC_Active = c_byte(0x01)
-SC_Inactive = c_byte(0x02)
+enumeration(globals(), "SC_OperatingStates", SC_OperatingStates, (
+    ("SC_Active", 0x01),
+    ("SC_Inactive", 0x02)))
 
 SC_SolenoidStates = c_byte
-SC_SolenoidOpen = c_byte(0x01)
-SC_SolenoidClosed = c_byte(0x02)
+enumeration(globals(), "SC_SolenoidStates", SC_SolenoidStates, (
+    ("SC_SolenoidOpen", 0x01),
+    ("SC_SolenoidClosed", 0x02)))
 
 TC_DisplayModes = c_ushort
-TC_ActualTemperature = c_ushort(0x00)
-TC_TargetTemperature = c_ushort(0x01)
-TC_TempDifference = c_ushort(0x02)
-TC_Current = c_ushort(0x03)
+enumeration(globals(), "TC_DisplayModes", TC_DisplayModes, (
+    ("TC_ActualTemperature", 0x00),
+    ("TC_TargetTemperature", 0x01),
+    ("TC_TempDifference", 0x02),
+    ("TC_Current", 0x03)))
 
 TC_SensorTypes = c_ushort
-TC_Transducer = c_ushort(0x00)
-TC_TH20kOhm = c_ushort(0x01)
-TC_TH200kOhm = c_ushort(0x02)
-
-TIM_ButtonParameters = None
-
-TIM_ButtonsMode = None
-
-TIM_Channels = None
+enumeration(globals(), "TC_SensorTypes", TC_SensorTypes, (
+    ("TC_Transducer", 0x00),
+    ("TC_TH20kOhm", 0x01),
+    ("TC_TH200kOhm", 0x02)))
 
-TIM_Direction = None
+TIM_ButtonsMode = c_uint16
 
-TIM_DriveOPParameters = None
+TIM_Channels = c_uint16
 
-TIM_JogMode = None
+TIM_Direction = c_byte
 
-TIM_JogParameters = None
+TIM_JogMode = c_uint16
 
 TSG_DisplayModes = c_long
 
 TSG_Display_Modes = c_short
-TSG_Undefined = c_short(0)
-TSG_Position = c_short(1)
-TSG_Voltage = c_short(2)
-TSG_Force = c_short(3)
+enumeration(globals(), "TSG_Display_Modes", TSG_Display_Modes, (
+    ("TSG_Undefined", 0),
+    ("TSG_Position", 1),
+    ("TSG_Voltage", 2),
+    ("TSG_Force", 3)))
 
 TSG_Hub_Analogue_Modes = c_short
-TSG_HubChannel1 = c_short(1)
-TSG_HubChannel2 = c_short(2)
+enumeration(globals(), "TSG_Hub_Analogue_Modes", TSG_Hub_Analogue_Modes, (
+    ("TSG_HubChannel1", 1),
+    ("TSG_HubChannel2", 2)))
 
-TST_Stages = None
+TST_Stages = c_short
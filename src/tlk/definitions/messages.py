@@ -0,0 +1,28 @@
+# Message types and IDs posted to a device message queue, as read back with
+# get_next_message and wait_for_message.
+
+# messageType
+GenericDevice = 0
+GenericPiezo = 1
+GenericMotor = 2
+GenericDCMotor = 3
+GenericSimpleMotor = 4
+RackDevice = 5
+Laser = 6
+TECCtlr = 7
+Quad = 8
+NanoTrak = 9
+Specialized = 10
+Solenoid = 11
+
+# messageID of GenericDevice messages
+SettingsInitialized = 0
+SettingsUpdated = 1
+Error = 2
+Close = 3
+
+# messageID of GenericMotor messages
+Homed = 0
+Moved = 1
+Stopped = 2
+LimitUpdated = 3
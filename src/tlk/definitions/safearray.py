@@ -1,13 +1,34 @@
 
+from array import array
 from ctypes import (
-    Structure, c_ushort, c_ulong, c_void_p, c_int, c_double, byref, WinError,
-    windll, POINTER, oledll, c_long, c_uint, memmove, c_byte, c_short,
-    c_float, c_ubyte)
-from comtypes.typeinfo import SAFEARRAYBOUND
-from comtypes.automation import VARIANT, VARTYPE, BSTR
-from comtypes.automation import (
-    VT_VARIANT, VT_R4, VT_R8, VT_I1, VT_I2, VT_I4, VT_INT, VT_UI1,
-    VT_UI2, VT_UI4, VT_UINT, VT_BSTR)
+    Structure, c_ushort, c_ulong, c_void_p, c_int, c_double, byref,
+    POINTER, c_long, c_uint, memmove, c_byte, c_short, c_float, c_ubyte)
+try:
+    from ctypes import WinError, oledll, windll
+except ImportError:
+    # Not on Windows: SafeArray can still be used in argtypes, but the
+    # oleaut32 helpers below are not available.
+    WinError = oledll = windll = None
+try:
+    from comtypes.typeinfo import SAFEARRAYBOUND
+    from comtypes.automation import VARIANT, VARTYPE, BSTR
+    from comtypes.automation import (
+        VT_VARIANT, VT_R4, VT_R8, VT_I1, VT_I2, VT_I4, VT_INT, VT_UI1,
+        VT_UI2, VT_UI4, VT_UINT, VT_BSTR)
+except ImportError:
+    # comtypes only imports on Windows.
+    VARIANT = BSTR = None
+    VARTYPE = c_ushort
+    VT_I2, VT_I4, VT_R4, VT_R8, VT_BSTR, VT_VARIANT = 2, 3, 4, 5, 8, 12
+    VT_I1, VT_UI1, VT_UI2, VT_UI4, VT_INT, VT_UINT = 16, 17, 18, 19, 22, 23
+
+    class SAFEARRAYBOUND(Structure):
+        _fields_ = [("cElements", c_ulong),
+                    ("lLbound", c_long)]
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class SafeArray(Structure):
@@ -33,12 +54,17 @@ class SafeArray(Structure):
         return data.value
 
     def __iter__(self):
+        if _get_vartype(byref(self)) in _VT2TYPECODE:
+            return iter(UnpackSafeArrayData(byref(self)))
+        return self._iter_elements()
+
+    def _iter_elements(self):
         ix = c_int()
         data = c_double()
         get = SafeArrayGetElement
         while True:
             if get(byref(self), byref(ix), byref(data)):
-                raise StopIteration
+                return
             yield data.value
             ix.value += 1
 
@@ -58,36 +84,37 @@ class SafeArray(Structure):
 # BTW: A C program has the same behaviour.
 
 
-SafeArrayCreateVectorEx = windll.oleaut32.SafeArrayCreateVectorEx
-SafeArrayCreateVectorEx.restype = POINTER(SafeArray)
+if windll is not None:
+    SafeArrayCreateVectorEx = windll.oleaut32.SafeArrayCreateVectorEx
+    SafeArrayCreateVectorEx.restype = POINTER(SafeArray)
 
-SafeArrayPutElement = oledll.oleaut32.SafeArrayPutElement
-SafeArrayPutElement.argtypes = (c_void_p, POINTER(c_long), c_void_p)
+    SafeArrayPutElement = oledll.oleaut32.SafeArrayPutElement
+    SafeArrayPutElement.argtypes = (c_void_p, POINTER(c_long), c_void_p)
 
-SafeArrayGetElement = oledll.oleaut32.SafeArrayGetElement
-SafeArrayGetElement.argtypes = (c_void_p, POINTER(c_long), c_void_p)
+    SafeArrayGetElement = oledll.oleaut32.SafeArrayGetElement
+    SafeArrayGetElement.argtypes = (c_void_p, POINTER(c_long), c_void_p)
 
-SafeArrayAccessData = oledll.oleaut32.SafeArrayAccessData
-SafeArrayAccessData.argtypes = (c_void_p, POINTER(c_void_p))
+    SafeArrayAccessData = oledll.oleaut32.SafeArrayAccessData
+    SafeArrayAccessData.argtypes = (c_void_p, POINTER(c_void_p))
 
-SafeArrayUnaccessData = oledll.oleaut32.SafeArrayUnaccessData
-SafeArrayUnaccessData.argtypes = (c_void_p,)
+    SafeArrayUnaccessData = oledll.oleaut32.SafeArrayUnaccessData
+    SafeArrayUnaccessData.argtypes = (c_void_p,)
 
-SafeArrayGetVartype = oledll.oleaut32.SafeArrayGetVartype
-SafeArrayGetVartype.argtypes = (c_void_p, POINTER(VARTYPE))
+    SafeArrayGetVartype = oledll.oleaut32.SafeArrayGetVartype
+    SafeArrayGetVartype.argtypes = (c_void_p, POINTER(VARTYPE))
 
-SafeArrayCreate = windll.oleaut32.SafeArrayCreate
-SafeArrayCreate.argtypes = (VARTYPE, c_uint, POINTER(SAFEARRAYBOUND))
-SafeArrayCreate.restype = POINTER(SafeArray)
+    SafeArrayCreate = windll.oleaut32.SafeArrayCreate
+    SafeArrayCreate.argtypes = (VARTYPE, c_uint, POINTER(SAFEARRAYBOUND))
+    SafeArrayCreate.restype = POINTER(SafeArray)
 
-SafeArrayGetUBound = oledll.oleaut32.SafeArrayGetUBound
-SafeArrayGetUBound.argtypes = (c_void_p, c_uint, POINTER(c_long))
+    SafeArrayGetUBound = oledll.oleaut32.SafeArrayGetUBound
+    SafeArrayGetUBound.argtypes = (c_void_p, c_uint, POINTER(c_long))
 
-SafeArrayGetLBound = oledll.oleaut32.SafeArrayGetLBound
-SafeArrayGetLBound.argtypes = (c_void_p, c_uint, POINTER(c_long))
+    SafeArrayGetLBound = oledll.oleaut32.SafeArrayGetLBound
+    SafeArrayGetLBound.argtypes = (c_void_p, c_uint, POINTER(c_long))
 
-SafeArrayGetDim = oledll.oleaut32.SafeArrayGetDim
-SafeArrayGetDim.restype = c_uint
+    SafeArrayGetDim = oledll.oleaut32.SafeArrayGetDim
+    SafeArrayGetDim.restype = c_uint
 
 ################################################################
 
@@ -159,11 +186,31 @@ _VT2CTYPE = {
     VT_VARIANT: VARIANT}
 
 
-def _get_datatype(psa):
-    # Return the ctypes data type corresponding to the SAFEARRAY's typecode.
+# array typecodes of the numeric vartypes, which can be copied out in bulk.
+# VT_I4 and VT_UI4 are always 4 bytes, whatever the size of a C long.
+_VT2TYPECODE = {
+    VT_I1: "b",
+    VT_I2: "h",
+    VT_I4: "i",
+    VT_INT: "i",
+    VT_R4: "f",
+    VT_R8: "d",
+    VT_UI1: "B",
+    VT_UI2: "H",
+    VT_UI4: "I",
+    VT_UINT: "I"}
+
+
+def _get_vartype(psa):
+    # Return the SAFEARRAY's typecode.
     vt = VARTYPE()
     SafeArrayGetVartype(psa, byref(vt))
-    return _VT2CTYPE[vt.value]
+    return vt.value
+
+
+def _get_datatype(psa):
+    # Return the ctypes data type corresponding to the SAFEARRAY's typecode.
+    return _VT2CTYPE[_get_vartype(psa)]
 
 
 def _get_ubound(psa, dim):
@@ -180,8 +227,92 @@ def _get_lbound(psa, dim):
     return lb.value
 
 
+def _get_shape(psa):
+    # Return the number of elements in each dimension of a safearray
+    return tuple(_get_ubound(psa, d) - _get_lbound(psa, d) + 1 for d in range(SafeArrayGetDim(psa)))
+
+
+def _get_nested(data, shape, dim, offset, stride):
+    # Nested tuples of the elements in storage order, where the first
+    # dimension varies fastest, with the first dimension outermost.
+    count = shape[dim]
+    if dim + 1 == len(shape):
+        return tuple(data[offset + i * stride] for i in range(count))
+    return tuple(
+        _get_nested(data, shape, dim + 1, offset + i * stride, stride * count)
+        for i in range(count))
+
+
+class SafeArrayData(object):
+    """Direct access to the elements of a numeric SAFEARRAY.
+
+    The array is locked with SafeArrayAccessData on entry and unlocked on exit;
+    in between, view is a flat memoryview over the SAFEARRAY's own memory, in
+    storage order (first dimension varying fastest), and shape holds the
+    number of elements in each dimension.  The view must not be used after the
+    block ends.
+
+        with SafeArrayData(psa) as data:
+            total = sum(data.view)
+    """
+
+    def __init__(self, psa):
+        vt = _get_vartype(psa)
+        if vt not in _VT2TYPECODE:
+            raise TypeError("SAFEARRAY of vartype %d is not numeric" % vt)
+        self.psa = psa
+        self.typecode = _VT2TYPECODE[vt]
+        self.shape = _get_shape(psa)
+        self.view = None
+
+    def __enter__(self):
+        count = 1
+        for n in self.shape:
+            count *= n
+        ptr = c_void_p()
+        SafeArrayAccessData(self.psa, byref(ptr))
+        size = count * array(self.typecode).itemsize
+        if not size or not ptr.value:
+            # An empty SAFEARRAY has no data.
+            self.view = memoryview(array(self.typecode))
+        else:
+            self.view = memoryview((c_ubyte * size).from_address(ptr.value)).cast("B").cast(self.typecode)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.view.release()
+        self.view = None
+        SafeArrayUnaccessData(self.psa)
+
+
+def UnpackSafeArrayData(psa, as_numpy=False):
+    """Copy the elements of a numeric SAFEARRAY out with a single memmove.
+
+    Returns a flat array.array in storage order (first dimension varying
+    fastest), or with as_numpy a NumPy array of the SAFEARRAY's shape.
+    """
+    with SafeArrayData(psa) as data:
+        elements = array(data.typecode)
+        elements.frombytes(data.view.cast("B"))
+        shape = data.shape
+    if as_numpy:
+        if numpy is None:
+            raise ImportError("as_numpy requires numpy")
+        return numpy.frombuffer(elements, dtype=elements.typecode).reshape(shape, order="F")
+    return elements
+
+
 def UnpackSafeArray(psa):
     """Unpack a SAFEARRAY into a Python tuple."""
+    if _get_vartype(psa) in _VT2TYPECODE:
+        elements = UnpackSafeArrayData(psa)
+        return _get_nested(elements, _get_shape(psa), 0, 0, 1)
+    return _unpack_elements(psa)
+
+
+def _unpack_elements(psa):
+    # Unpack a SAFEARRAY one SafeArrayGetElement call at a time, the only way
+    # to read BSTR and VARIANT arrays.
     dim = SafeArrayGetDim(psa)
     lowerbounds = [_get_lbound(psa, d) for d in range(dim)]
     indexes = (c_long * dim)(*lowerbounds)
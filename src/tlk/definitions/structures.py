@@ -3,6 +3,7 @@ from ctypes import (
     c_bool,
     c_byte,
     c_char,
+    c_double,
     c_float,
     c_int,
     c_int16,
@@ -105,6 +106,8 @@ from .enumerations import (
     QD_KPA_TrigPolarities,
     QD_LowVoltageRoute,
     QD_OpenLoopHoldValues,
+    TIM_ButtonsMode,
+    TIM_JogMode,
     TSG_DisplayModes,
     TSG_Hub_Analogue_Modes)
 
@@ -1061,6 +1064,39 @@ class PZ_LUTWaveParameters(Structure):
     ]
 
 
+class PZ_StageAxisParameters(Structure):
+    _fields_ = [
+        ("stageID", c_long),
+        ("axisID", c_long),
+        ("partNumber", 16 * c_char),
+        ("serialNumber", c_ulong),
+        ("countsPerUnit", c_ulong),
+        ("minPosition", c_int),
+        ("maxPosition", c_int),
+        ("maxAcceleration", c_int),
+        ("maxDecceleration", c_int),
+        ("maxVelocity", c_int),
+        ("reserved1", c_long),
+        ("reserved2", c_long),
+        ("reserved3", c_long),
+        ("reserved4", c_long),
+        ("reserved5", c_ulong),
+        ("reserved6", c_ulong),
+        ("reserved7", c_ulong),
+        ("reserved8", c_ulong),
+    ]
+
+
+class PolarizerParameters(Structure):
+    _fields_ = [
+        ("Velocity", c_ushort),
+        ("HomePosition", c_double),
+        ("JogSize1", c_double),
+        ("JogSize2", c_double),
+        ("JogSize3", c_double),
+    ]
+
+
 class QD_ClosedLoopPosition(Structure):
     _fields_ = [
         ("x", c_int16),
@@ -1181,6 +1217,32 @@ class TC_LoopParameters(Structure):
     ]
 
 
+class TIM_ButtonParameters(Structure):
+    _fields_ = [
+        ("buttonMode", TIM_ButtonsMode),
+        ("position1", c_int32),
+        ("position2", c_int32),
+        ("reserved", 2 * c_int16),
+    ]
+
+
+class TIM_DriveOPParameters(Structure):
+    _fields_ = [
+        ("maxVoltage", c_int16),
+        ("stepRate", c_int32),
+        ("stepAcceleration", c_int32),
+    ]
+
+
+class TIM_JogParameters(Structure):
+    _fields_ = [
+        ("jogMode", TIM_JogMode),
+        ("jogStepSize", c_int32),
+        ("jogStepRate", c_int32),
+        ("jogStepAcceleration", c_int32),
+    ]
+
+
 class TLI_DeviceInfo(Structure):
     _fields_ = [
         ("typeID", c_ulong),
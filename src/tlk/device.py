@@ -0,0 +1,175 @@
+"""Device classes binding a device module's functions to one serial number.
+
+Every device module ends with a Device subclass, e.g. kcubedcservo.KCubeDCServo.
+Its methods are the module's functions with the serial number filled in; the
+serial number is encoded once, when the object is created, and the same buffer
+is passed on every call:
+
+    stage = KCubeDCServo("27000001")
+    stage.open_device()
+    stage.home()
+
+On multi-channel controllers the functions taking a channel are methods of the
+channel objects instead, e.g. BenchtopBrushlessMotor("73000001").channel(2).home().
+A device object holds nothing but its serial number and the channel objects
+made so far, so any number of them can be kept around.
+"""
+import functools
+import inspect
+import sys
+
+from .callcontext import CallContext
+from .library import encode_serial
+from .messagebridge import MessageBridge
+from .moves import MoveDispatcher
+
+
+class Device(object):
+    """A device, addressed by its serial number."""
+
+    __slots__ = ("serial_number", "_channels", "_context", "_bridge", "_moves")
+
+    # Set for every device module by bind_functions.
+    module = None
+    prefix = None
+    # ctypes type of the channel argument on multi-channel controllers, whose
+    # channel functions are methods of Channel; None if there are no channels.
+    channel_type = None
+    Channel = None
+
+    def __init__(self, serial_number):
+        self.serial_number = encode_serial(serial_number)
+        self._channels = {}
+        self._context = None
+        self._bridge = None
+        self._moves = None
+
+    @property
+    def serial(self):
+        """The serial number, as a str."""
+        return self.serial_number.value.decode()
+
+    @property
+    def context(self):
+        """A CallContext for calling the device's getters in a loop."""
+        if self._context is None:
+            self._context = CallContext(self.module.lib, self.prefix, self.serial_number)
+        return self._context
+
+    @property
+    def bridge(self):
+        """A MessageBridge delivering the device's messages; start it to receive them."""
+        if self._bridge is None:
+            self._bridge = MessageBridge(self.module.lib, self.prefix, self.serial_number)
+        return self._bridge
+
+    @property
+    def moves(self):
+        """A MoveDispatcher, whose moves return futures completed when they end."""
+        if self._moves is None:
+            self._moves = MoveDispatcher(self)
+        return self._moves
+
+    def channel(self, number):
+        """The channel object for a channel number, counting from 1."""
+        channel = self._channels.get(number)
+        if channel is None:
+            if self.Channel is None:
+                raise TypeError("%s has no channels" % type(self).__name__)
+            channel = self._channels[number] = self.Channel(self, number)
+        return channel
+
+    def __getitem__(self, number):
+        return self.channel(number)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.serial == self.serial
+
+    def __hash__(self):
+        return hash((type(self), self.serial))
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.serial)
+
+
+class Channel(object):
+    """One channel of a multi-channel controller."""
+
+    __slots__ = ("device", "number", "serial_number", "_context", "_bridge", "_moves")
+
+    def __init__(self, device, number):
+        self.device = device
+        self.number = number
+        self.serial_number = device.serial_number
+        self._context = None
+        self._bridge = None
+        self._moves = None
+
+    @property
+    def context(self):
+        """A CallContext for calling the channel's getters in a loop."""
+        if self._context is None:
+            device = self.device
+            self._context = CallContext(
+                device.module.lib, device.prefix, self.serial_number, self.number, device.channel_type)
+        return self._context
+
+    @property
+    def bridge(self):
+        """A MessageBridge delivering the channel's messages; start it to receive them."""
+        if self._bridge is None:
+            device = self.device
+            self._bridge = MessageBridge(
+                device.module.lib, device.prefix, self.serial_number, self.number, device.channel_type)
+        return self._bridge
+
+    @property
+    def moves(self):
+        """A MoveDispatcher, whose moves return futures completed when they end."""
+        if self._moves is None:
+            self._moves = MoveDispatcher(self)
+        return self._moves
+
+    def __repr__(self):
+        return "%r.channel(%d)" % (self.device, self.number)
+
+
+def _device_method(function):
+    @functools.wraps(function)
+    def method(self, *args):
+        return function(self.serial_number, *args)
+    return method
+
+
+def _channel_method(function):
+    @functools.wraps(function)
+    def method(self, *args):
+        return function(self.serial_number, self.number, *args)
+    return method
+
+
+def bind_functions(cls, namespace):
+    # Add the functions of a device module to its Device subclass.  namespace
+    # is the module's globals(); every function defined in the module whose
+    # first argument is serial_number becomes a method.
+
+    cls.module = sys.modules[namespace["__name__"]]
+    channel_methods = {}
+    for name, function in list(namespace.items()):
+        if not inspect.isfunction(function) or function.__module__ != namespace["__name__"]:
+            continue
+        signature = getattr(function, "__signature__", None) or inspect.signature(function)
+        parameters = list(signature.parameters)
+        if parameters[:1] != ["serial_number"]:
+            continue
+        if cls.channel_type is not None and parameters[1:2] == ["channel"]:
+            if not hasattr(Channel, name):
+                channel_methods[name] = _channel_method(function)
+        elif not hasattr(Device, name):
+            setattr(cls, name, _device_method(function))
+    if cls.channel_type is not None:
+        channel_methods["__slots__"] = ()
+        channel_methods["__doc__"] = "One channel of a %s." % cls.__name__
+        channel_methods["__module__"] = namespace["__name__"]
+        cls.Channel = type(cls.__name__ + "Channel", (Channel,), channel_methods)
+    return cls
@@ -0,0 +1,348 @@
+"""Device discovery through Thorlabs.MotionControl.DeviceManager.dll.
+
+Every device module delegates its TLI_ functions to this module, so they are
+bound once per process instead of once per module.  inventory keeps the
+TLI_DeviceInfo of every connected device, indexed by serial number and type ID;
+it is built on first use and only rebuilt after invalidate() or refresh().
+"""
+import threading
+from ctypes import (
+    POINTER,
+    byref,
+    c_char,
+    c_char_p,
+    c_int,
+    c_short,
+    c_ulong,
+    c_void_p,
+    create_string_buffer)
+from . import binding
+from .definitions.safearray import SafeArray, UnpackSafeArray
+from .definitions.structures import TLI_DeviceInfo
+from .definitions.kinesisexception import KinesisException
+from .library import LazyLibrary
+
+
+lib = LazyLibrary("Thorlabs.MotionControl.DeviceManager.dll")
+
+# Characters per entry in the comma separated device lists, serial number
+# plus separator with room to spare.
+_LIST_ENTRY_SIZE = 16
+
+
+def _serial_number(serial_number):
+    if isinstance(serial_number, str):
+        serial_number = serial_number.encode()
+    return serial_number
+
+
+def _split_list(buffer):
+    return [serial_number for serial_number in buffer.value.decode().split(",") if serial_number]
+
+
+def _list_buffer():
+    return create_string_buffer(max(get_device_list_size(), 1) * _LIST_ENTRY_SIZE + 1)
+
+
+TLI_BuildDeviceList = lib.TLI_BuildDeviceList
+TLI_BuildDeviceList.restype = c_short
+TLI_BuildDeviceList.argtypes = []
+
+
+def build_device_list():
+    # Build the DeviceList.
+
+    output = TLI_BuildDeviceList()
+    if output != 0:
+        raise KinesisException(output)
+
+
+TLI_CreateManualDeviceEntry = lib.TLI_CreateManualDeviceEntry
+TLI_CreateManualDeviceEntry.restype = c_short
+TLI_CreateManualDeviceEntry.argtypes = [c_char_p]
+
+
+def create_manual_device_entry(serial_number):
+    # Creates a manual device configuration entry.
+
+    output = TLI_CreateManualDeviceEntry(_serial_number(serial_number))
+    if output != 0:
+        raise KinesisException(output)
+
+
+TLI_DeleteManualDeviceEntry = lib.TLI_DeleteManualDeviceEntry
+TLI_DeleteManualDeviceEntry.restype = c_short
+TLI_DeleteManualDeviceEntry.argtypes = [c_char_p]
+
+
+def delete_manual_device_entry(serial_number):
+    # Deletes a manual device configuration entry.
+
+    output = TLI_DeleteManualDeviceEntry(_serial_number(serial_number))
+    if output != 0:
+        raise KinesisException(output)
+
+
+TLI_GetDeviceInfo = lib.TLI_GetDeviceInfo
+TLI_GetDeviceInfo.restype = c_short
+TLI_GetDeviceInfo.argtypes = [c_char_p, POINTER(TLI_DeviceInfo)]
+
+
+def get_device_info(serial_number):
+    # Get the device information from the USB port.
+
+    info = TLI_DeviceInfo()
+
+    output = TLI_GetDeviceInfo(_serial_number(serial_number), byref(info))
+    if output != 0:
+        raise KinesisException(output)
+
+    return info
+
+
+TLI_GetDeviceList = lib.TLI_GetDeviceList
+TLI_GetDeviceList.restype = c_short
+TLI_GetDeviceList.argtypes = [POINTER(POINTER(SafeArray))]
+
+
+def get_device_list():
+    # Get the entire contents of the device list.
+
+    serial_numbers = POINTER(SafeArray)()
+
+    output = TLI_GetDeviceList(byref(serial_numbers))
+    if output != 0:
+        raise KinesisException(output)
+
+    return list(UnpackSafeArray(serial_numbers))
+
+
+TLI_GetDeviceListByType = lib.TLI_GetDeviceListByType
+TLI_GetDeviceListByType.restype = c_short
+TLI_GetDeviceListByType.argtypes = [POINTER(POINTER(SafeArray)), c_int]
+
+
+def get_device_list_by_type(type_id):
+    # Get the contents of the device list which match the supplied typeID.
+
+    serial_numbers = POINTER(SafeArray)()
+
+    output = TLI_GetDeviceListByType(byref(serial_numbers), type_id)
+    if output != 0:
+        raise KinesisException(output)
+
+    return list(UnpackSafeArray(serial_numbers))
+
+
+TLI_GetDeviceListByTypeExt = lib.TLI_GetDeviceListByTypeExt
+TLI_GetDeviceListByTypeExt.restype = c_short
+TLI_GetDeviceListByTypeExt.argtypes = [POINTER(c_char), c_ulong, c_int]
+
+
+def get_device_list_by_type_ext(type_id):
+    # Get the contents of the device list which match the supplied typeID.
+
+    buffer = _list_buffer()
+
+    output = TLI_GetDeviceListByTypeExt(buffer, len(buffer), type_id)
+    if output != 0:
+        raise KinesisException(output)
+
+    return _split_list(buffer)
+
+
+TLI_GetDeviceListByTypes = lib.TLI_GetDeviceListByTypes
+TLI_GetDeviceListByTypes.restype = c_short
+TLI_GetDeviceListByTypes.argtypes = [POINTER(POINTER(SafeArray)), POINTER(c_int), c_int]
+
+
+def get_device_list_by_types(type_ids):
+    # Get the contents of the device list which match the supplied typeIDs.
+
+    serial_numbers = POINTER(SafeArray)()
+    type_ids = (c_int * len(type_ids))(*type_ids)
+
+    output = TLI_GetDeviceListByTypes(byref(serial_numbers), type_ids, len(type_ids))
+    if output != 0:
+        raise KinesisException(output)
+
+    return list(UnpackSafeArray(serial_numbers))
+
+
+TLI_GetDeviceListByTypesExt = lib.TLI_GetDeviceListByTypesExt
+TLI_GetDeviceListByTypesExt.restype = c_short
+TLI_GetDeviceListByTypesExt.argtypes = [POINTER(c_char), c_ulong, POINTER(c_int), c_int]
+
+
+def get_device_list_by_types_ext(type_ids):
+    # Get the contents of the device list which match the supplied typeIDs.
+
+    buffer = _list_buffer()
+    type_ids = (c_int * len(type_ids))(*type_ids)
+
+    output = TLI_GetDeviceListByTypesExt(buffer, len(buffer), type_ids, len(type_ids))
+    if output != 0:
+        raise KinesisException(output)
+
+    return _split_list(buffer)
+
+
+TLI_GetDeviceListExt = lib.TLI_GetDeviceListExt
+TLI_GetDeviceListExt.restype = c_short
+TLI_GetDeviceListExt.argtypes = [POINTER(c_char), c_ulong]
+
+
+def get_device_list_ext():
+    # Get the entire contents of the device list.
+
+    buffer = _list_buffer()
+
+    output = TLI_GetDeviceListExt(buffer, len(buffer))
+    if output != 0:
+        raise KinesisException(output)
+
+    return _split_list(buffer)
+
+
+TLI_GetDeviceListSize = lib.TLI_GetDeviceListSize
+TLI_GetDeviceListSize.restype = c_short
+TLI_GetDeviceListSize.argtypes = []
+
+
+def get_device_list_size():
+    # Gets the device list size.
+
+    output = TLI_GetDeviceListSize()
+
+    return output
+
+
+TLI_InitializeSimulations = lib.TLI_InitializeSimulations
+TLI_InitializeSimulations.restype = c_void_p
+TLI_InitializeSimulations.argtypes = []
+
+
+def initialize_simulations():
+    # Initialize a connection to the Simulation Manager, which must already be running.
+
+    TLI_InitializeSimulations()
+
+
+TLI_ScanEthernetRange = lib.TLI_ScanEthernetRange
+TLI_ScanEthernetRange.restype = c_short
+TLI_ScanEthernetRange.argtypes = [c_char_p, c_char_p, c_int, c_int, POINTER(c_char), c_ulong]
+
+
+def scan_ethernet_range(start_ip_address, end_ip_address, port_number, open_timeout, size_of_buffer=4096):
+    # Scans a range of addresses and returns a list of the ip addresses of Thorlabs devices found.
+
+    buffer = create_string_buffer(size_of_buffer)
+
+    output = TLI_ScanEthernetRange(
+        _serial_number(start_ip_address),
+        _serial_number(end_ip_address),
+        port_number,
+        open_timeout,
+        buffer,
+        len(buffer))
+    if output != 0:
+        raise KinesisException(output)
+
+    return _split_list(buffer)
+
+
+TLI_UninitializeSimulations = lib.TLI_UninitializeSimulations
+TLI_UninitializeSimulations.restype = c_void_p
+TLI_UninitializeSimulations.argtypes = []
+
+
+def uninitialize_simulations():
+    # Uninitialize a connection to the Simulation Manager, which must already be running.
+
+    TLI_UninitializeSimulations()
+
+
+# The return conventions of the functions above and those taking a serial
+# number, as tlk.binding keeps them for the device modules.
+binding.conventions.update(dict.fromkeys((
+    "TLI_BuildDeviceList",
+    "TLI_CreateManualDeviceEntry",
+    "TLI_DeleteManualDeviceEntry",
+    "TLI_GetDeviceInfo",
+    "TLI_GetDeviceList",
+    "TLI_GetDeviceListByType",
+    "TLI_GetDeviceListByTypeExt",
+    "TLI_GetDeviceListByTypes",
+    "TLI_GetDeviceListByTypesExt",
+    "TLI_GetDeviceListExt",
+    "TLI_ScanEthernetRange"), binding.STATUS))
+binding.conventions.update(
+    TLI_GetDeviceListSize="c_short", TLI_InitializeSimulations=binding.VOID, TLI_UninitializeSimulations=binding.VOID)
+binding.serial_functions.update(("TLI_CreateManualDeviceEntry", "TLI_DeleteManualDeviceEntry", "TLI_GetDeviceInfo"))
+
+
+class DeviceInventory(object):
+    """Cached TLI_DeviceInfo of every device in the device list.
+
+    The list is built with build_device_list the first time it is needed and
+    kept until invalidate() is called, so any number of modules and callers can
+    look devices up without rescanning USB.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (by serial number, by type ID), replaced as a whole.
+        self._cache = None
+
+    def refresh(self):
+        """Rebuild the device list and reread every device's information.
+
+        Returns the TLI_DeviceInfo by serial number and lists of them by type ID.
+        """
+        with self._lock:
+            build_device_list()
+            by_serial = {}
+            by_type = {}
+            for serial_number in get_device_list_ext():
+                info = get_device_info(serial_number)
+                by_serial[serial_number] = info
+                by_type.setdefault(info.typeID, []).append(info)
+            self._cache = by_serial, by_type
+        return by_serial, by_type
+
+    def invalidate(self):
+        """Forget the cached list; the next lookup rebuilds it."""
+        with self._lock:
+            self._cache = None
+
+    def _indexes(self):
+        indexes = self._cache
+        if indexes is None:
+            indexes = self.refresh()
+        return indexes
+
+    def get(self, serial_number):
+        """TLI_DeviceInfo of a device, or None if it is not in the list."""
+        return self._indexes()[0].get(str(serial_number))
+
+    def by_type(self, type_id):
+        """TLI_DeviceInfo of every device with the given type ID."""
+        return list(self._indexes()[1].get(type_id, ()))
+
+    def serial_numbers(self, type_id=None):
+        """Serial numbers of every device, or of every device of one type."""
+        if type_id is None:
+            return list(self._indexes()[0])
+        return [info.serialNo.decode() for info in self.by_type(type_id)]
+
+    def __contains__(self, serial_number):
+        return str(serial_number) in self._indexes()[0]
+
+    def __iter__(self):
+        return iter(list(self._indexes()[0].values()))
+
+    def __len__(self):
+        return len(self._indexes()[0])
+
+
+inventory = DeviceInventory()
@@ -0,0 +1,169 @@
+"""Serialized access to devices shared between threads.
+
+The device functions take no locks, so two threads talking to one controller
+can interleave their calls, e.g. one thread's RequestPosition between
+another's RequestPosition and GetPosition.  A Dispatcher wraps a device or
+channel object and runs each of its methods under the lock of the device's
+serial number, shared by every Dispatcher of that device and its channels, so
+calls to one device are serialized while different devices are used in
+parallel:
+
+    stage = Dispatcher(KCubeDCServo("27000001"))
+    stage.move_to_position(10000)       # from any thread
+    with stage.exclusive():             # several calls with no other in between
+        stage.request_position()
+        position = stage.get_position()
+
+The lock is an RLock, taken and released by the wrapper itself, which only
+calls into the DeviceLock when the lock is held by another thread; an
+uncontended call still costs an acquire, a release and the wrapper's own
+call.  Code written against a Dispatcher that ends up running in one thread
+only can drop even that with Dispatcher(device, threadsafe=False), which
+returns the device's methods unwrapped and takes no lock in exclusive().
+Every lock counts its acquisitions, the ones that had to wait and the time
+spent waiting; statistics() returns them by serial number.
+"""
+import functools
+import threading
+import time
+
+_locks = {}
+_locks_lock = threading.Lock()
+
+
+class DeviceLock(object):
+    """The lock of one device, with contention statistics."""
+
+    __slots__ = ("serial", "acquisitions", "contended", "wait_time", "max_wait", "_lock")
+
+    def __init__(self, serial):
+        self.serial = serial
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self._lock = threading.RLock()
+
+    def acquire(self):
+        """Take the lock, waiting for the thread holding it if there is one."""
+        if not self._lock.acquire(False):
+            self._wait()
+        self.acquisitions += 1
+
+    def _wait(self):
+        # Take the lock held by another thread, counting the wait.
+        start = time.perf_counter()
+        self._lock.acquire()
+        wait = time.perf_counter() - start
+        self.contended += 1
+        self.wait_time += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def release(self):
+        self._lock.release()
+
+    __enter__ = acquire
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+    def stats(self):
+        """Acquisitions, contended acquisitions and the total and longest wait in seconds."""
+        return {"acquisitions": self.acquisitions, "contended": self.contended,
+                "wait_time": self.wait_time, "max_wait": self.max_wait}
+
+    def reset(self):
+        """Zero the statistics."""
+        with self:
+            self.acquisitions = self.contended = 0
+            self.wait_time = self.max_wait = 0.0
+
+    def __repr__(self):
+        return "<DeviceLock %s, %d/%d contended>" % (self.serial, self.contended, self.acquisitions)
+
+
+def device_lock(serial):
+    """The DeviceLock of a serial number, created on first use."""
+    serial = serial.value.decode() if hasattr(serial, "value") else str(serial)
+    lock = _locks.get(serial)
+    if lock is None:
+        with _locks_lock:
+            lock = _locks.setdefault(serial, DeviceLock(serial))
+    return lock
+
+
+def statistics():
+    """The stats() of every device lock, by serial number."""
+    return dict((serial, lock.stats()) for serial, lock in list(_locks.items()))
+
+
+def _locked(lock, function):
+    # DeviceLock.acquire and release inlined: the RLock's own methods are
+    # called directly, and DeviceLock only when the call has to wait.
+    rlock = lock._lock
+    acquire = rlock.acquire
+    release = rlock.release
+    wait = lock._wait
+
+    @functools.wraps(function)
+    def method(*args):
+        if not acquire(False):
+            wait()
+        lock.acquisitions += 1
+        try:
+            return function(*args)
+        finally:
+            release()
+    return method
+
+
+class _Unlocked(object):
+    # The exclusive() of a Dispatcher that is not thread safe.
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_UNLOCKED = _Unlocked()
+
+
+class Dispatcher(object):
+    """A device or channel object whose methods run under the device's lock.
+
+    With threadsafe false, for use from one thread, the methods are the
+    device's own and nothing is locked.
+    """
+
+    def __init__(self, target, threadsafe=True):
+        self.target = target
+        self.threadsafe = threadsafe
+        self.lock = device_lock(target.serial_number)
+
+    def __getattr__(self, name):
+        # Methods are wrapped on first use and kept on the instance.
+        attribute = getattr(self.target, name)
+        if not callable(attribute):
+            return attribute
+        method = _locked(self.lock, attribute) if self.threadsafe else attribute
+        setattr(self, name, method)
+        return method
+
+    def exclusive(self):
+        """The device lock, to hold over several calls: with dispatcher.exclusive(): ..."""
+        return self.lock if self.threadsafe else _UNLOCKED
+
+    def channel(self, number):
+        """A Dispatcher of a channel, sharing this device's lock."""
+        return Dispatcher(self.target.channel(number), self.threadsafe)
+
+    def __getitem__(self, number):
+        return self.channel(number)
+
+    def __repr__(self):
+        if not self.threadsafe:
+            return "Dispatcher(%r, threadsafe=False)" % (self.target,)
+        return "Dispatcher(%r)" % (self.target,)
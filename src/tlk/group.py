@@ -0,0 +1,127 @@
+"""Coordinated moves of motors on different controllers.
+
+A MoveGroup moves motors of any motor modules together: the devices of
+single-channel controllers (KCubeDCServo, KCubeStepperMotor, ...) and channels of
+multi-channel ones (BenchtopBrushlessMotor(...).channel(1)).  move_to stages
+everything first: positions in real units are converted to device units and
+set with set_move_absolute_position, and the futures of the moves are set up
+on each member's MoveDispatcher.  Only then are the move_absolute calls made,
+back to back from one thread, so that the members start as close together as
+the dll calls allow:
+
+    group = MoveGroup([KCubeDCServo("27000001"), KCubeStepperMotor("26000001"), rack.channel(2)])
+    move = group.move_to((12.5, 3.0, 40.0))
+    move.skew                   # seconds between the first and the last move_absolute call
+    move.wait(timeout=30.0)     # when every member reports Moved
+
+The members must be open.
+"""
+import time
+from concurrent.futures import TimeoutError, wait
+
+from .definitions.messages import Moved
+
+
+def _module_channel(target):
+    # The device module and channel number (None for single-channel
+    # controllers) of a device or channel object.
+    device = getattr(target, "device", None)
+    if device is not None:
+        return device.module, target.number
+    return target.module, None
+
+
+class GroupMove(object):
+    """A move of a MoveGroup: its futures and the times its move_absolute calls were made."""
+
+    def __init__(self, members, futures, calls):
+        self.members = members
+        self.futures = futures
+        # perf_counter_ns at the start and end of every member's move_absolute call.
+        self.calls = calls
+
+    @property
+    def skew(self):
+        """Seconds from the start of the first move_absolute call to the start of the last."""
+        starts = [start for start, _ in self.calls]
+        return (max(starts) - min(starts)) / 1e9
+
+    @property
+    def issue_time(self):
+        """Seconds from the start of the first move_absolute call to the end of the last."""
+        return (max(end for _, end in self.calls) - min(start for start, _ in self.calls)) / 1e9
+
+    def offsets(self):
+        """Seconds from the first call's start to each member's, in member order."""
+        first = min(start for start, _ in self.calls)
+        return [(start - first) / 1e9 for start, _ in self.calls]
+
+    def done(self):
+        return all(future.done() for future in self.futures)
+
+    def wait(self, timeout=None):
+        """Wait until every member has ended its move; returns their messages.
+
+        Raises concurrent.futures.TimeoutError if they have not by timeout.
+        """
+        _, pending = wait(self.futures, timeout)
+        if pending:
+            raise TimeoutError("%d of %d members still moving" % (len(pending), len(self.futures)))
+        return [future.result() for future in self.futures]
+
+    def __repr__(self):
+        return "<GroupMove of %d members, skew %.1f us>" % (len(self.members), self.skew * 1e6)
+
+
+class MoveGroup(object):
+    """Device and channel objects of any motor modules, moved together."""
+
+    def __init__(self, members):
+        self.members = list(members)
+        self._units = [_module_channel(member) for member in self.members]
+
+    def device_units(self, positions):
+        """Positions in real units as device units, one per member."""
+        if len(positions) != len(self.members):
+            raise ValueError("%d positions for %d members" % (len(positions), len(self.members)))
+        return [module.units.to_device_units(member.serial_number, position, channel=channel)
+                for member, (module, channel), position in zip(self.members, self._units, positions)]
+
+    def move_to(self, positions, device_units=False):
+        """Stage every member's position, then start every member; returns a GroupMove.
+
+        positions are in real units, or in device units if device_units is true.
+        """
+        if not device_units:
+            positions = self.device_units(positions)
+        elif len(positions) != len(self.members):
+            raise ValueError("%d positions for %d members" % (len(positions), len(self.members)))
+        for member, position in zip(self.members, positions):
+            member.set_move_absolute_position(position)
+        futures = [member.moves.expect(Moved) for member in self.members]
+        calls = [member.move_absolute for member in self.members]
+        times = []
+        clock = time.perf_counter_ns
+        try:
+            for call in calls:
+                start = clock()
+                call()
+                times.append((start, clock()))
+        except BaseException:
+            # Members not started will not end a move; their futures must not
+            # take the message of a later one.
+            for member, future in zip(self.members[len(times):], futures[len(times):]):
+                member.moves.discard(future)
+            raise
+        return GroupMove(self.members, futures, times)
+
+    def stop(self):
+        """Stop every member with its velocity profile."""
+        for member in self.members:
+            member.stop_profiled()
+
+    def __len__(self):
+        return len(self.members)
+
+    def __repr__(self):
+        return "MoveGroup(%r)" % (self.members,)
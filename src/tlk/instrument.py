@@ -0,0 +1,254 @@
+"""Call counts and latencies of the dll functions.
+
+Every dll function of every module is called through a LazyFunction of
+tlk.library.  enable() replaces the foreign function each of them calls with
+one that times the call, so the wrappers, the device manager functions and
+the getters of device contexts, message bridges and samplers are all
+measured; disable() puts the foreign functions back, so there is no cost at
+all when instrumentation is off.  Both have the objects keeping functions of
+their own take them again (tlk.library.rebind); only getters a caller took
+from a CallContext itself keep the function they were made with.
+
+    instrument.enable()
+    ...                                  # run the control loop
+    instrument.disable()
+    instrument.dump("calls.json")
+
+For every function, and every serial number it was called with (under "" for
+the device manager functions taking none), the snapshot has the number of
+calls, the calls that failed (a nonzero return of a function returning an
+error code, or an exception), the total, mean, minimum and maximum time and
+percentiles from a histogram of log-linear buckets, as HdrHistogram keeps
+them: 2 ** SUB_BITS buckets per power of two of nanoseconds (times under
+2 ** (SUB_BITS + 1) ns have a bucket each), so a percentile is within 1/64 of
+the time measured.
+"""
+import json
+import threading
+import time
+
+from . import binding, library
+
+SUB_BITS = 6
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# Stats of every function called while enabled, by function name.
+functions = {}
+_functions_lock = threading.Lock()
+
+
+def _bucket(nanoseconds):
+    # Index of the bucket of a time: the exponent, then the SUB_BITS bits
+    # after the leading one, which adds 2 ** SUB_BITS to the shifted time and
+    # so follows on from the indices of the exponent below.
+    exponent = nanoseconds.bit_length() - SUB_BITS - 1
+    if exponent <= 0:
+        return nanoseconds
+    return (exponent << SUB_BITS) + (nanoseconds >> exponent)
+
+
+def _bucket_limit(index):
+    # The largest time in a bucket.
+    exponent = (index >> SUB_BITS) - 1
+    if exponent <= 0:
+        return index
+    return (((index & ((1 << SUB_BITS) - 1)) + (1 << SUB_BITS) + 1) << exponent) - 1
+
+
+class Histogram(object):
+    """Counts of call times in nanoseconds, in log-linear buckets, and of failed calls."""
+
+    __slots__ = ("counts", "count", "total", "min", "max", "errors")
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = 1 << 63
+        self.max = 0
+        self.errors = 0
+
+    def record(self, nanoseconds, failed=False):
+        index = _bucket(nanoseconds)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += nanoseconds
+        if nanoseconds < self.min:
+            self.min = nanoseconds
+        if nanoseconds > self.max:
+            self.max = nanoseconds
+        if failed:
+            self.errors += 1
+
+    def merge(self, other):
+        """Add the counts of another histogram."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.errors += other.errors
+
+    def percentile(self, percent):
+        """The time in nanoseconds that percent of the times recorded do not exceed."""
+        if not self.count:
+            return 0
+        rank = max(1, int(round(self.count * percent / 100.0)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_limit(index), self.max)
+        return self.max
+
+    def snapshot(self):
+        """The statistics as a dict, times in microseconds."""
+        calls = self.count
+        result = {"calls": calls, "errors": self.errors,
+                  "total_us": self.total / 1e3,
+                  "mean_us": self.total / 1e3 / calls if calls else 0.0,
+                  "min_us": self.min / 1e3 if calls else 0.0,
+                  "max_us": self.max / 1e3}
+        for percent in PERCENTILES:
+            result["p%g_us" % percent] = self.percentile(percent) / 1e3
+        return result
+
+
+class FunctionStats(object):
+    """The Histograms of one function, by serial number."""
+
+    __slots__ = ("name", "serials", "lock")
+
+    def __init__(self, name):
+        self.name = name
+        # Keyed by the serial number as passed, decoded by snapshot.
+        self.serials = {}
+        self.lock = threading.Lock()
+
+    def record(self, serial, nanoseconds, failed):
+        with self.lock:
+            histogram = self.serials.get(serial)
+            if histogram is None:
+                histogram = self.serials[serial] = Histogram()
+            histogram.record(nanoseconds, failed)
+
+    def histogram(self):
+        """The Histogram of every call, to any device."""
+        total = Histogram()
+        with self.lock:
+            for histogram in self.serials.values():
+                total.merge(histogram)
+        return total
+
+    def snapshot(self):
+        """The statistics of every call, with those of each serial number under "serials"."""
+        result = self.histogram().snapshot()
+        with self.lock:
+            serials = list(self.serials.items())
+        result["serials"] = dict(sorted(
+            ((serial.decode(errors="replace") if serial else "", histogram.snapshot())
+             for serial, histogram in serials), key=lambda item: item[0]))
+        return result
+
+
+def _stats(name):
+    stats = functions.get(name)
+    if stats is None:
+        with _functions_lock:
+            stats = functions.setdefault(name, FunctionStats(name))
+    return stats
+
+
+def _serial(args):
+    # The serial number a function was called with, as bytes or a char buffer.
+    serial = args[0]
+    return serial if type(serial) is bytes else getattr(serial, "value", None)
+
+
+def _timed(lazy_function, function):
+    # The foreign function of a LazyFunction wrapped to record its calls, by
+    # serial number for those taking one first.
+    record = _stats(lazy_function.name).record
+    status = binding.conventions.get(lazy_function.name) == binding.STATUS
+    keyed = lazy_function.name in binding.serial_functions
+    clock = time.perf_counter_ns
+
+    def timed(*args):
+        start = clock()
+        try:
+            result = function(*args)
+        except BaseException:
+            record(_serial(args) if keyed else None, clock() - start, True)
+            raise
+        elapsed = clock() - start
+        record(_serial(args) if keyed else None, elapsed, status and result != 0)
+        return result
+
+    timed.wrapped = function
+    timed.__name__ = lazy_function.name
+    timed.argtypes = getattr(function, "argtypes", None)
+    timed.restype = getattr(function, "restype", None)
+    return timed
+
+
+def _lazy_functions():
+    for lib in library._libraries:
+        for value in list(vars(lib).values()):
+            if isinstance(value, library.LazyFunction):
+                yield value
+
+
+def enable():
+    """Time every dll function, those resolved already and those resolved later."""
+    library.instrument = _timed
+    for lazy_function in _lazy_functions():
+        function = lazy_function.function
+        if function is not None and not hasattr(function, "wrapped"):
+            lazy_function.function = _timed(lazy_function, function)
+    library.rebind()
+
+
+def disable():
+    """Call the foreign functions directly again; the statistics are kept."""
+    library.instrument = None
+    for lazy_function in _lazy_functions():
+        function = lazy_function.function
+        if function is not None and hasattr(function, "wrapped"):
+            lazy_function.function = function.wrapped
+    library.rebind()
+
+
+def enabled():
+    """Whether the dll functions are being timed."""
+    return library.instrument is _timed
+
+
+def reset():
+    """Forget the statistics."""
+    with _functions_lock:
+        for stats in functions.values():
+            with stats.lock:
+                stats.serials.clear()
+
+
+def snapshot():
+    """The statistics of every function called, by name, as a dict that converts to JSON."""
+    return dict((name, stats.snapshot()) for name, stats in sorted(list(functions.items())) if stats.serials)
+
+
+def dump(path):
+    """Write snapshot() to a JSON file."""
+    with open(path, "w") as file:
+        json.dump(snapshot(), file, indent=1)
+
+
+def report(limit=20):
+    """A table of the functions taking the most time in total, as a str."""
+    lines = ["%-40s %10s %8s %12s %10s %10s" % ("function", "calls", "errors", "total ms", "p50 us", "p99 us")]
+    rows = sorted(snapshot().items(), key=lambda item: -item[1]["total_us"])[:limit]
+    for name, stats in rows:
+        lines.append("%-40s %10d %8d %12.3f %10.2f %10.2f" % (
+            name, stats["calls"], stats["errors"], stats["total_us"] / 1e3, stats["p50_us"], stats["p99_us"]))
+    return "\n".join(lines)
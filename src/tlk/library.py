@@ -0,0 +1,186 @@
+"""Deferred loading of the Kinesis dlls.
+
+Device modules create a LazyLibrary instead of calling cdll.LoadLibrary at
+import time.  Looking up a symbol on a LazyLibrary returns a LazyFunction which
+records its restype and argtypes, and only loads the dll and resolves the real
+foreign function the first time it is called.  The resolved function is cached
+on the LazyFunction, so later calls go straight to ctypes.
+
+Libraries are loaded through the active backend: "kinesis" loads the Thorlabs
+dlls from lib_path, "simulated" loads the in-process simulator from
+tlk.simulator.  The initial backend is taken from the TLK_BACKEND environment
+variable and can be changed at any time with set_backend.
+"""
+import os
+import weakref
+from ctypes import Array, c_int, cdll, create_string_buffer
+
+
+lib_path = "C:/Program Files/Thorlabs/Kinesis/"
+
+# Resolve every symbol as soon as it is looked up, restoring the behaviour of
+# loading the dlls at import time.  Must be set before importing device modules.
+eager_binding = False
+
+# Called as instrument(lazy_function, function) with every foreign function
+# resolved, returning what the LazyFunction calls; set by tlk.instrument.
+instrument = None
+
+# Objects keeping resolved foreign functions of their own (CallContext,
+# MessageBridge, Sampler), whose rebind() is called by rebind().
+_keepers = weakref.WeakSet()
+
+backends = {}
+backend = os.environ.get("TLK_BACKEND", "kinesis")
+
+_handles = {}
+_libraries = []
+
+
+def register_backend(name, loader):
+    # Make a backend available to set_backend.  loader is called with a dll
+    # file name and returns an object whose attributes are the dll functions.
+
+    backends[name] = loader
+
+
+def set_backend(name):
+    # Switch every library, loaded or not, to another backend.
+
+    global backend
+    if name not in backends:
+        raise ValueError("Unknown tlk backend %r" % name)
+    backend = name
+    for library in _libraries:
+        library.reset()
+
+
+def keeps_functions(keeper):
+    # Have rebind() call keeper.rebind() while keeper is alive.
+
+    _keepers.add(keeper)
+
+
+def rebind():
+    # Make every keeper of resolved functions take them from their
+    # LazyFunctions again, after these were replaced.
+
+    for keeper in list(_keepers):
+        keeper.rebind()
+
+
+def get_backend():
+    # Name of the backend libraries are loaded from.
+
+    return backend
+
+
+def load_library(name):
+    # Load a Kinesis dll, sharing one handle between every module that uses it.
+
+    key = (backend, name)
+    handle = _handles.get(key)
+    if handle is None:
+        loader = backends.get(backend)
+        if loader is None:
+            raise ValueError("Unknown tlk backend %r" % backend)
+        handle = _handles[key] = loader(name)
+
+    return handle
+
+
+def encode_serial(serial_number):
+    # Serial number as the char buffer the dlls take.  Serial numbers may be
+    # given as int, str or bytes; buffers are passed through unchanged.
+
+    if isinstance(serial_number, Array):
+        return serial_number
+    if not isinstance(serial_number, bytes):
+        serial_number = str(serial_number).encode()
+    return create_string_buffer(serial_number)
+
+
+def _load_kinesis(name):
+    return cdll.LoadLibrary(lib_path + name)
+
+
+def _load_simulated(name):
+    from .simulator import SimulatedLibrary
+    return SimulatedLibrary(name)
+
+
+register_backend("kinesis", _load_kinesis)
+register_backend("simulated", _load_simulated)
+
+
+class LazyFunction(object):
+    """Stand-in for a foreign function that is resolved on its first call."""
+
+    __slots__ = ("library", "name", "restype", "argtypes", "errcheck", "function")
+
+    def __init__(self, library, name):
+        self.library = library
+        self.name = name
+        self.restype = c_int
+        self.argtypes = None
+        self.errcheck = None
+        self.function = None
+
+    def resolve(self):
+        """Look up the symbol in the loaded dll and apply the recorded types."""
+        function = getattr(self.library.load(), self.name)
+        function.restype = self.restype
+        if self.argtypes is not None:
+            function.argtypes = self.argtypes
+        if self.errcheck is not None:
+            function.errcheck = self.errcheck
+        if instrument is not None:
+            function = instrument(self, function)
+        self.function = function
+        return function
+
+    def __call__(self, *args):
+        function = self.function
+        if function is None:
+            function = self.resolve()
+        return function(*args)
+
+    def __repr__(self):
+        return "<LazyFunction %s of %r>" % (self.name, self.library)
+
+
+class LazyLibrary(object):
+    """A Kinesis dll that is only loaded once one of its functions is called."""
+
+    def __init__(self, name):
+        self._name = name
+        self._handle = None
+        _libraries.append(self)
+        if eager_binding:
+            self.load()
+
+    def load(self):
+        """Load the dll if it is not loaded yet and return its handle."""
+        handle = self._handle
+        if handle is None:
+            handle = self._handle = load_library(self._name)
+        return handle
+
+    def reset(self):
+        """Forget the loaded dll and every resolved function."""
+        self._handle = None
+        for value in vars(self).values():
+            if isinstance(value, LazyFunction):
+                value.function = None
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if eager_binding:
+            return getattr(self.load(), name)
+        function = LazyFunction(self, name)
+        setattr(self, name, function)
+        return function
+
+    def __repr__(self):
+        return "<LazyLibrary %s>" % self._name
@@ -0,0 +1,226 @@
+"""Binary logs of fixed-width records, read back through memory maps.
+
+A log is a directory of streams.  Every record of a stream has the same
+layout: the time (a double, seconds since the epoch by default), the index of
+the device's serial number in the stream's device list, the channel (0 when
+there is none), and a value, which is a ctypes scalar type or one of the
+structures of tlk.definitions.structures:
+
+    writer = LogWriter("run1", "readings", "NT_TIAReading")
+    writer.append("22000001", 0, reading)
+    writer.close()
+
+    reader = LogReader("run1", "readings")
+    records = reader.select(start, stop, serial="22000001")
+    records["value"]["absoluteReading"]
+
+The records are appended to chunk files, readings.000000.bin,
+readings.000001.bin, ..., of chunk_records records each, as raw bytes with no
+header; readings.json describes the stream: its value type, record size and
+device list.  LogReader maps the chunks with numpy.memmap and takes time
+ranges with a binary search of the times, so only the pages that are read are
+loaded; records are assumed to be appended in time order.  A chunk cut short,
+e.g. when the writer was killed, is read up to its last whole record.
+"""
+import functools
+import json
+import os
+import time
+from ctypes import Structure, c_double, c_uint16, sizeof
+
+from . import binding
+from .records import dtype
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def record_type(value_type):
+    """The record Structure of a stream of value_type values."""
+    return type("Record", (Structure,), {"_fields_": [
+        ("time", c_double),
+        ("device", c_uint16),
+        ("channel", c_uint16),
+        ("value", value_type)]})
+
+
+def _chunk_path(directory, stream, index):
+    return os.path.join(directory, "%s.%06d.bin" % (stream, index))
+
+
+class LogWriter(object):
+    """Appends records of one stream, buffering batch records per write.
+
+    value_type is the name of a ctypes type or structure, as in the function
+    tables of tlk.binding.  An existing stream is appended to, after its last
+    whole record, if it has the same value type.
+    """
+
+    def __init__(self, directory, stream, value_type, chunk_records=1 << 20, batch=4096, clock=time.time):
+        self.directory = directory
+        self.stream = stream
+        self.value_type = value_type
+        self.Record = record_type(binding.types[value_type])
+        self.size = sizeof(self.Record)
+        self.chunk_records = chunk_records
+        self.clock = clock
+        self.devices = []
+        self._indices = {}
+        self._batch = (self.Record * batch)()
+        self._bytes = memoryview(self._batch).cast("B")
+        self._count = 0
+        os.makedirs(directory, exist_ok=True)
+        self._meta_path = os.path.join(directory, stream + ".json")
+        chunk = 0
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path) as meta:
+                meta = json.load(meta)
+            if meta["value_type"] != value_type or meta["record_size"] != self.size:
+                raise ValueError("stream %s holds %s records" % (stream, meta["value_type"]))
+            for serial in meta["devices"]:
+                self._device(serial)
+            while os.path.exists(_chunk_path(directory, stream, chunk + 1)):
+                chunk += 1
+        self._chunk = chunk
+        self._file = None
+        self._open(chunk)
+        self._write_meta()
+
+    def _open(self, chunk):
+        path = _chunk_path(self.directory, self.stream, chunk)
+        self._file = open(path, "ab")
+        written = self._file.tell()
+        whole = written - written % self.size
+        if whole != written:
+            self._file.truncate(whole)
+            self._file.seek(whole)
+        self._in_chunk = whole // self.size
+
+    def _device(self, serial):
+        index = self._indices[serial] = len(self.devices)
+        self.devices.append(serial)
+        return index
+
+    def _write_meta(self):
+        meta = {"version": VERSION, "value_type": self.value_type, "record_size": self.size,
+                "chunk_records": self.chunk_records, "devices": self.devices}
+        with open(self._meta_path + ".new", "w") as file:
+            json.dump(meta, file)
+        os.replace(self._meta_path + ".new", self._meta_path)
+
+    def append(self, serial, channel, value, timestamp=None):
+        """Add a record of value, a number or structure, for a device and channel."""
+        serial = str(serial)
+        device = self._indices.get(serial)
+        if device is None:
+            device = self._device(serial)
+            self._write_meta()
+        record = self._batch[self._count]
+        record.time = self.clock() if timestamp is None else timestamp
+        record.device = device
+        record.channel = channel
+        record.value = value
+        self._count += 1
+        if self._count == len(self._batch):
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records."""
+        start = 0
+        while start < self._count:
+            space = self.chunk_records - self._in_chunk
+            if space == 0:
+                self._file.close()
+                self._chunk += 1
+                self._open(self._chunk)
+                continue
+            records = min(space, self._count - start)
+            self._file.write(self._bytes[start * self.size:(start + records) * self.size])
+            self._in_chunk += records
+            start += records
+        self._count = 0
+        self._file.flush()
+
+    def close(self):
+        """Write the buffered records and close the chunk."""
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return "<LogWriter %s/%s %s>" % (self.directory, self.stream, self.value_type)
+
+
+class LogReader(object):
+    """The records of one stream, mapped from its chunk files; requires numpy."""
+
+    def __init__(self, directory, stream):
+        if numpy is None:
+            raise ImportError("numpy is needed to read logs")
+        with open(os.path.join(directory, stream + ".json")) as meta:
+            meta = json.load(meta)
+        self.directory = directory
+        self.stream = stream
+        self.value_type = meta["value_type"]
+        self.devices = meta["devices"]
+        self.dtype = dtype(record_type(binding.types[self.value_type]))
+        if self.dtype.itemsize != meta["record_size"]:
+            raise ValueError("records of %s are %d bytes here, %d in the log" % (
+                stream, self.dtype.itemsize, meta["record_size"]))
+        self.chunks = []
+        index = 0
+        while os.path.exists(_chunk_path(directory, stream, index)):
+            path = _chunk_path(directory, stream, index)
+            records = os.path.getsize(path) // self.dtype.itemsize
+            if records:
+                self.chunks.append(numpy.memmap(path, self.dtype, "r", shape=(records,)))
+            index += 1
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self.chunks)
+
+    def device(self, serial):
+        """The device index of a serial number."""
+        return self.devices.index(str(serial))
+
+    def select(self, start=None, stop=None, serial=None, channel=None):
+        """The records with start <= time < stop, of one device and channel if given.
+
+        A time range within one chunk, for all devices, is a view of the map;
+        otherwise the records selected are copied.
+        """
+        parts = []
+        for chunk in self.chunks:
+            times = chunk["time"]
+            if start is not None and times[-1] < start or stop is not None and times[0] >= stop:
+                continue
+            first = 0 if start is None else numpy.searchsorted(times, start, "left")
+            last = len(chunk) if stop is None else numpy.searchsorted(times, stop, "left")
+            parts.append(chunk[first:last])
+        if not parts:
+            return numpy.zeros(0, self.dtype)
+        records = parts[0] if len(parts) == 1 else numpy.concatenate(parts)
+        if serial is not None or channel is not None:
+            keep = numpy.ones(len(records), bool)
+            if serial is not None:
+                keep &= records["device"] == self.device(serial)
+            if channel is not None:
+                keep &= records["channel"] == channel
+            records = records[keep]
+        return records
+
+    def __repr__(self):
+        return "<LogReader %s/%s %s, %d records>" % (self.directory, self.stream, self.value_type, len(self))
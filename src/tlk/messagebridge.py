@@ -0,0 +1,171 @@
+"""Device messages delivered by the dll's message callback instead of polling.
+
+A device posts a message to its queue when a move ends, homing completes, its
+settings change and so on.  Rather than spinning on get_next_message or tying
+up a thread in wait_for_message, a MessageBridge registers a callback with
+RegisterMessageCallback.  The dll calls it from its own thread whenever a
+message is queued; the callback drains the queue with GetNextMessage into a
+deque and wakes whoever is waiting, threads through a Condition and asyncio
+tasks through their event loop:
+
+    bridge = MessageBridge(kcubedcservo.lib, "KVS", "27000001")
+    bridge.start()
+    kcubedcservo.home("27000001")
+    message = bridge.wait(timeout=30.0)        # from a thread
+    message = await bridge.next_message()      # from a coroutine
+
+Appending to and popping from a deque are atomic, so consumers take messages
+without a lock; draining holds the condition's lock, so that messages read by
+the dll's thread and by threads calling drain keep their order.  Functions in
+listeners are called with every message as it is drained, on the draining
+thread; they must return quickly.  A message for which a listener returns
+True is taken by it, and not added to messages.  Listeners can be added and
+removed from any thread while messages are drained.
+"""
+import asyncio
+import threading
+import time
+from collections import deque, namedtuple
+from ctypes import CFUNCTYPE, byref, c_short, c_uint16, c_uint32
+
+from .callcontext import CallContext
+from .definitions.kinesisexception import KinesisException
+from .library import keeps_functions
+
+
+# void (*functionPointer)(), as taken by RegisterMessageCallback.
+MESSAGE_CALLBACK = CFUNCTYPE(None)
+
+# A message read from a device's queue, see tlk.definitions.messages.
+Message = namedtuple("Message", "type id data")
+
+
+class MessageBridge(object):
+    """The messages of one device, or one channel of a multi-channel controller.
+
+    lib and prefix are those of the device module, channel and channel_type
+    as for CallContext.
+    """
+
+    def __init__(self, lib, prefix, serial_number, channel=None, channel_type=c_short):
+        self.context = CallContext(lib, prefix, serial_number, channel, channel_type)
+        self.messages = deque()
+        self.condition = threading.Condition()
+        self.listeners = []
+        self._waiters = deque()
+        self._callback = MESSAGE_CALLBACK(self.drain)
+        self._get_next_message = None
+        self.started = False
+        keeps_functions(self)
+
+    def start(self):
+        """Register the callback, and take the messages queued so far."""
+        self._get_next_message = self.context.function("GetNextMessage")
+        self._register(self._callback)
+        self.started = True
+        self.drain()
+
+    def rebind(self):
+        if self._get_next_message is not None:
+            self._get_next_message = self.context.function("GetNextMessage")
+
+    def stop(self):
+        """Unregister the callback.  Messages already taken stay in messages."""
+        if self.started:
+            self._register(None)
+            self.started = False
+
+    def _register(self, callback):
+        function = self.context.function("RegisterMessageCallback")
+        error = function(*(self.context.args + (callback,)))
+        if function.restype is c_short and error != 0:
+            raise KinesisException(error)
+
+    def drain(self):
+        """Move every message in the device's queue to messages.
+
+        This is the callback; it can also be called to pick up messages
+        without one, e.g. before start.
+        """
+        get_next_message = self._get_next_message or self.context.function("GetNextMessage")
+        message_type = c_uint16()
+        message_id = c_uint16()
+        message_data = c_uint32()
+        args = self.context.args + (byref(message_type), byref(message_id), byref(message_data))
+        with self.condition:
+            received = []
+            while get_next_message(*args):
+                received.append(Message(message_type.value, message_id.value, message_data.value))
+            if not received:
+                return
+            # A copy, as other threads add and remove listeners.
+            listeners = tuple(self.listeners)
+            for message in received:
+                taken = False
+                for listener in listeners:
+                    taken = listener(message) or taken
+                if not taken:
+                    self.messages.append(message)
+            self.condition.notify_all()
+        while self._waiters:
+            try:
+                loop, future = self._waiters.popleft()
+            except IndexError:
+                break
+            loop.call_soon_threadsafe(_wake, future)
+
+    def get(self):
+        """The oldest message taken, or None if there is none."""
+        try:
+            return self.messages.popleft()
+        except IndexError:
+            return None
+
+    def wait(self, timeout=None):
+        """The oldest message, waiting up to timeout seconds in all for one; None on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while True:
+                message = self.get()
+                if message is not None:
+                    return message
+                # Wakeups with no message left, e.g. taken by a listener or
+                # another thread, wait for what remains of the timeout.
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0 or not self.condition.wait(remaining):
+                    return self.get()
+
+    async def next_message(self):
+        """The oldest message, waiting for one without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            message = self.get()
+            if message is not None:
+                return message
+            future = loop.create_future()
+            waiter = (loop, future)
+            self._waiters.append(waiter)
+            # A message drained after the get above but before the waiter was
+            # added would not wake it.
+            if self.messages:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+                continue
+            await future
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __repr__(self):
+        return "<MessageBridge of %r, %d messages>" % (self.context, len(self.messages))
+
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
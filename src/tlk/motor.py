@@ -0,0 +1,737 @@
+"""The motor controllers' functions, as one table.
+
+The twelve motor modules (benchtopbrushlessmotor, kcubedcservo, tcubesteppermotor
+and the rest) wrap the same motion API under different prefixes.  Rather than
+each carrying its own copy, their functions are listed once here, grouped into
+capabilities: "motor" is what every motor controller has (moves, position,
+status, velocity and jog parameters), the other groups what only some have.
+FAMILIES gives each module its prefix, channel type and capabilities, and
+bind_motor defines the module's functions from them when it is imported, with
+tlk.binding.  Every motor family therefore calls its moves, position and status
+getters through the same few wrappers.
+
+    from tlk import kcubedcservo
+    kcubedcservo.move_to_position("27000001", 20000)
+    position = kcubedcservo.get_position("27000001")
+"""
+import functools
+
+from .binding import bind, types
+from .units import UnitConverter
+
+
+# Functions grouped by the motor controllers that have them.  Each entry is
+# (suffix, return convention, comment, parameters), see tlk.binding.
+CAPABILITIES = {
+    "motor": (
+        ("CanHome", "c_bool", "Can the device perform a Home.", ()),
+        ("CanMoveWithoutHomingFirst", "c_bool", "Can this device be moved without Homing.", ()),
+        ("DisableChannel", "status", "Disable the channel so that motor can be moved by hand.", ()),
+        ("EnableChannel", "status", "Enable channel for computer control.", ()),
+        ("EnableLastMsgTimer", "void", "Enables the last message monitoring timer.", (
+            ("in", "enable", "c_bool"), ("in", "last_msg_timeout", "c_int32"))),
+        ("GetBacklash", "c_long", "Get the backlash distance setting (used to control hysteresis).", ()),
+        ("GetDeviceUnitFromRealValue", "status", "Converts a real world unit to a device unit.", (
+            ("in", "real_unit", "c_double"), ("out", "device_unit", "c_int"), ("in", "unit_type", "c_int"))),
+        ("GetHomingParamsBlock", "status", "Get the homing parameters.", (
+            ("out", "homing_params", "MOT_HomingParameters"),)),
+        ("GetHomingVelocity", "c_uint", "Gets the homing velocity.", ()),
+        ("GetJogMode", "status", "Gets the jog mode.", (
+            ("out", "mode", "MOT_JogModes"), ("out", "stop_mode", "MOT_StopModes"))),
+        ("GetJogParamsBlock", "status", "Get the jog parameters.", (("out", "jog_params", "MOT_JogParameters"),)),
+        ("GetJogStepSize", "c_uint", "Gets the distance to move when jogging.", ()),
+        ("GetJogVelParams", "status", "Gets the jog velocity parameters.", (
+            ("out", "acceleration", "c_int"), ("out", "max_velocity", "c_int"))),
+        ("GetMotorTravelLimits", "status",
+         "Gets the absolute minimum and maximum travel range constants for the current stage.", (
+             ("out", "min_position", "c_double"), ("out", "max_position", "c_double"))),
+        ("GetMotorTravelMode", "MOT_TravelModes", "Get the motor travel mode.", ()),
+        ("GetMotorVelocityLimits", "status",
+         "Gets the absolute maximum velocity and acceleration constants for the current stage.", (
+             ("out", "max_velocity", "c_double"), ("out", "max_acceleration", "c_double"))),
+        ("GetMoveAbsolutePosition", "c_int", "Gets the move absolute position.", ()),
+        ("GetMoveRelativeDistance", "c_int", "Gets the move relative distance.", ()),
+        ("GetNumberPositions", "c_int", "Get number of positions.", ()),
+        ("GetPosition", "c_int", "Get the current position.", ()),
+        ("GetPositionCounter", "c_long", "Get the Position Counter.", ()),
+        ("GetRealValueFromDeviceUnit", "status", "Converts a device unit to a real world unit.", (
+            ("in", "device_unit", "c_int"), ("out", "real_unit", "c_double"), ("in", "unit_type", "c_int"))),
+        ("GetSoftLimitMode", "MOT_LimitsSoftwareApproachPolicy", "Gets the software limits mode.", ()),
+        ("GetStageAxisMaxPos", "c_int", "Gets the DC Motor maximum stage position.", ()),
+        ("GetStageAxisMinPos", "c_int", "Gets the DC Motor minimum stage position.", ()),
+        ("GetStatusBits", "c_ulong", "Get the current status bits.", ()),
+        ("GetVelParams", "status", "Gets the move velocity parameters.", (
+            ("out", "acceleration", "c_int"), ("out", "max_velocity", "c_int"))),
+        ("GetVelParamsBlock", "status", "Get the move velocity parameters.", (
+            ("out", "velocity_params", "MOT_VelocityParameters"),)),
+        ("HasLastMsgTimerOverrun", "c_bool", "Queries if the time since the last message has exceeded the", ()),
+        ("Home", "status", "Home the device.", ()),
+        ("MoveAbsolute", "status", "Moves the device to the position defined in the SetMoveAbsolute command.", ()),
+        ("MoveAtVelocity", "status", "Start moving at the current velocity in the specified direction.", (
+            ("in", "direction", "MOT_TravelDirection"),)),
+        ("MoveJog", "status", "Perform a jog.", (("in", "jog_direction", "MOT_TravelDirection"),)),
+        ("MoveRelative", "status", "Move the motor by a relative amount.", (("in", "displacement", "c_int"),)),
+        ("MoveRelativeDistance", "status",
+         "Moves the device by a relative distancce defined by SetMoveRelativeDistance.", ()),
+        ("MoveToPosition", "status", "Move the device to the specified position (index).", (("in", "index", "c_int"),)),
+        ("NeedsHoming", "c_bool", "Does the device need to be Homed before a move can be performed.", ()),
+        ("PollingDuration", "c_long", "Gets the polling loop duration.", ()),
+        ("RequestPosition", "status", "Requests the current position.", ()),
+        ("RequestSettings", "status", "Requests that all settings are download from device.", ()),
+        ("RequestStatusBits", "status", "Request the status bits which identify the current motor state.", ()),
+        ("SetBacklash", "status", "Sets the backlash distance (used to control hysteresis).", (
+            ("in", "distance", "c_long"),)),
+        ("SetHomingParamsBlock", "status", "Set the homing parameters.", (
+            ("in", "homing_params", "MOT_HomingParameters"),)),
+        ("SetHomingVelocity", "status", "Sets the homing velocity.", (("in", "velocity", "c_uint"),)),
+        ("SetJogMode", "status", "Sets the jog mode.", (
+            ("in", "mode", "MOT_JogModes"), ("in", "stop_mode", "MOT_StopModes"))),
+        ("SetJogParamsBlock", "status", "Set the jog parameters.", (("in", "jog_params", "MOT_JogParameters"),)),
+        ("SetJogStepSize", "status", "Sets the distance to move on jogging.", (("in", "step_size", "c_uint"),)),
+        ("SetJogVelParams", "status", "Sets jog velocity parameters.", (
+            ("in", "acceleration", "c_int"), ("in", "max_velocity", "c_int"))),
+        ("SetLimitsSoftwareApproachPolicy", "void", "Sets the software limits mode.", (
+            ("in", "limits_software_approach_policy", "MOT_LimitsSoftwareApproachPolicy"),)),
+        ("SetMotorTravelLimits", "status",
+         "Sets the absolute minimum and maximum travel range constants for the current stage.", (
+             ("in", "min_position", "c_double"), ("in", "max_position", "c_double"))),
+        ("SetMotorTravelMode", "status", "Set the motor travel mode.", (("in", "travel_mode", "MOT_TravelModes"),)),
+        ("SetMotorVelocityLimits", "status",
+         "Sets the absolute maximum velocity and acceleration constants for the current stage.", (
+             ("in", "max_velocity", "c_double"), ("in", "max_acceleration", "c_double"))),
+        ("SetMoveAbsolutePosition", "status", "Sets the move absolute position.", (("in", "position", "c_int"),)),
+        ("SetMoveRelativeDistance", "status", "Sets the move relative distance.", (("in", "distance", "c_int"),)),
+        ("SetPositionCounter", "status", "Set the Position Counter.", (("in", "count", "c_long"),)),
+        ("SetStageAxisLimits", "status", "Sets the stage axis position limits.", (
+            ("in", "min_position", "c_int"), ("in", "max_position", "c_int"))),
+        ("SetVelParams", "status", "Sets the move velocity parameters.", (
+            ("in", "acceleration", "c_int"), ("in", "max_velocity", "c_int"))),
+        ("SetVelParamsBlock", "status", "Set the move velocity parameters.", (
+            ("in", "velocity_params", "MOT_VelocityParameters"),)),
+        ("StartPolling", "c_bool",
+         "Starts the internal polling loop which continuously requests position and status.", (
+             ("in", "milliseconds", "c_int"),)),
+        ("StopImmediate", "status", "Stop the current move immediately (with risk of losing track of position).", ()),
+        ("StopPolling", "void", "Stops the internal polling loop.", ()),
+        ("StopProfiled", "status", "Stop the current move using the current velocity profile.", ())),
+
+    "device": (
+        ("CheckConnection", "c_bool", "Check connection.", ()),
+        ("GetHardwareInfo", "status", "Gets the hardware information from the device.", (
+            ("buffer", "model_no", "c_ulong", 16), ("out", "type", "c_uint16"), ("out", "num_channels", "c_uint16"),
+            ("buffer", "notes", "c_ulong", 64), ("out", "firmware_version", "c_ulong"),
+            ("out", "hardware_version", "c_uint16"), ("out", "modification_state", "c_uint16"))),
+        ("GetHardwareInfoBlock", "status", "Gets the hardware information in a block.", (
+            ("out", "hardware_info", "TLI_HardwareInformation"),)),
+        ("GetNextMessage", "c_bool", "Get the next MessageQueue item.", (
+            ("out", "message_type", "c_uint16"), ("out", "message_id", "c_uint16"),
+            ("out", "message_data", "c_uint32"))),
+        ("GetSoftwareVersion", "c_ulong", "Gets version number of the device software.", ()),
+        ("LoadNamedSettings", "c_bool", "Update device with named settings.", (("text", "settings_name"),)),
+        ("LoadSettings", "c_bool", "Update device with stored settings.", ()),
+        ("MessageQueueSize", "c_int", "Gets the MessageQueue size.", ()),
+        ("Open", "status", "Open the device for communications.", ()),
+        ("PersistSettings", "c_bool", "Update device with stored settings.", ()),
+        ("RequestBacklash", "status", "Requests the backlash.", ()),
+        ("RequestHomingParams", "status", "Requests the homing parameters.", ()),
+        ("RequestJogParams", "status", "Requests the jog parameters.", ()),
+        ("RequestMoveAbsolutePosition", "status", "Requests the position of next absolute move.", ()),
+        ("RequestMoveRelativeDistance", "status", "Requests the relative move distance.", ()),
+        ("RequestVelParams", "status", "Requests the velocity parameters.", ()),
+        ("TimeSinceLastMsgReceived", "c_bool",
+         "Gets the time in milliseconds since tha last message was received from the device.", (
+             ("out", "last_update_time_ms", "c_int64"),)),
+        ("WaitForMessage", "c_bool", "Wait for next MessageQueue item.", (
+            ("out", "message_type", "c_uint16"), ("out", "message_id", "c_uint16"),
+            ("out", "message_data", "c_uint32")))),
+
+    "identify": (
+        ("Identify", "void", "Sends a command to the device to make it identify iteself.", ()),),
+
+    "identify_status": (
+        ("Identify", "status", "Sends a command to the device to make it identify iteself.", ()),),
+
+    "void_commands": (
+        ("ClearMessageQueue", "void", "Clears the device message queue.", ()),
+        ("Close", "void", "Disconnect and close the device.", ()),
+        ("RegisterMessageCallback", "void", "Registers a callback on the message queue.", (
+            ("in", "callback", "c_void_p"),)),
+        ("SetDirection", "void", "Sets the motor direction sense.", (("in", "reverse", "c_bool"),))),
+
+    "status_commands": (
+        ("ClearMessageQueue", "status", "Clears the device message queue.", ()),
+        ("Close", "status", "Disconnect and close the device.", ()),
+        ("RegisterMessageCallback", "status", "Registers a callback on the message queue.", (
+            ("in", "callback", "c_void_p"),))),
+
+    "status_direction": (
+        ("SetDirection", "status", "Sets the motor direction sense.", (("in", "reverse", "c_bool"),)),),
+
+    "encoder": (
+        ("GetEncoderCounter", "c_long", "Get the Encoder Counter.", ()),
+        ("ResumeMoveMessages", "status", "Resume suspended move messages.", ()),
+        ("SetEncoderCounter", "status", "Set the Encoder Counter values.", (("in", "count", "c_long"),)),
+        ("SuspendMoveMessages", "status", "Suspend automatic messages at ends of moves.", ())),
+
+    "request_encoder_counter": (
+        ("RequestEncoderCounter", "status", "Requests the encoder counter.", ()),),
+
+    "rotation_modes": (
+        ("ResetRotationModes", "status", "Reset the rotation modes for a rotational device.", ()),
+        ("SetRotationModes", "status", "Set the rotation modes for a rotational device.", (
+            ("in", "mode", "MOT_MovementModes"), ("in", "direction", "MOT_MovementDirections")))),
+
+    "motor_params": (
+        ("GetMotorParams", "status", "Gets the motor stage parameters.", (
+            ("out", "steps_per_rev", "c_long"), ("out", "gear_box_ratio", "c_long"), ("out", "pitch", "c_float"))),
+        ("GetMotorParamsExt", "status", "Gets the motor stage parameters.", (
+            ("out", "steps_per_rev", "c_double"), ("out", "gear_box_ratio", "c_double"),
+            ("out", "pitch", "c_double"))),
+        ("SetMotorParams", "status", "Sets the motor stage parameters.", (
+            ("in", "steps_per_rev", "c_long"), ("in", "gear_box_ratio", "c_long"), ("in", "pitch", "c_float"))),
+        ("SetMotorParamsExt", "status", "Sets the motor stage parameters.", (
+            ("in", "steps_per_rev", "c_double"), ("in", "gear_box_ratio", "c_double"), ("in", "pitch", "c_double")))),
+
+    "brushless": (
+        ("GetCurrentLoopParams", "status", "Gets the current loop parameters for moving to required position.", (
+            ("out", "current_loop_params", "MOT_BrushlessCurrentLoopParameters"),)),
+        ("GetElectricOutputParams", "status", "Gets the electric output parameters.", (
+            ("out", "electric_output_params", "MOT_BrushlessElectricOutputParameters"),)),
+        ("GetMotorParams", "status", "Get the motor parameters for the Brushless Votor.", (
+            ("out", "counts_per_unit", "c_long"),)),
+        ("GetMotorParamsExt", "status", "Get the motor parameters for the Brushless Votor.", (
+            ("out", "counts_per_unit", "c_double"),)),
+        ("GetPosLoopParams", "status", "Gets the position feedback loop parameters.", (
+            ("out", "position_loop_params", "MOT_BrushlessPositionLoopParameters"),)),
+        ("GetStageAxisParams", "status", "Gets the Brushless Motor stage axis parameters.", (
+            ("out", "stage_id", "c_long"), ("out", "axis_id", "c_long"), ("buffer", "part_number", "c_ulong", 16),
+            ("out", "serial_number", "c_ulong"), ("out", "counts_per_unit", "c_ulong"),
+            ("out", "min_position", "c_int"), ("out", "max_position", "c_int"), ("out", "max_acceleration", "c_int"),
+            ("out", "max_decceleration", "c_int"), ("out", "max_velocity", "c_int"))),
+        ("GetStageAxisParamsBlock", "status", "Gets the Brushless Motor stage axis parameters.", (
+            ("out", "stage_axis_params", "MOT_StageAxisParameters"),)),
+        ("GetVelocityProfileParams", "status", "Gets the velocity profile parameters.", (
+            ("out", "velocity_profile_params", "MOT_VelocityProfileParameters"),)),
+        ("OverrideHomeRequirement", "status", "Set to allow a device to be positioned without prior homing.", ()),
+        ("RequestCurrentLoopParams", "status",
+         "Requests the current loop parameters for moving to required position.", ()),
+        ("RequestElectricOutputParams", "status", "Requests the electric output parameters.", ()),
+        ("RequestPosLoopParams", "status", "Requests the position feedback loop parameters.", ()),
+        ("RequestStageAxisParams", "status", "Requests the stage axis parameters.", ()),
+        ("RequestVelocityProfileParams", "status", "Requests the velocity profile parameters.", ()),
+        ("SetCurrentLoopParams", "status", "Sets the current loop parameters for moving to required position.", (
+            ("in", "current_loop_params", "MOT_BrushlessCurrentLoopParameters"),)),
+        ("SetElectricOutputParams", "status", "Sets the electric output parameters.", (
+            ("in", "electric_output_params", "MOT_BrushlessElectricOutputParameters"),)),
+        ("SetMotorParams", "status", "Set the motor parameters for the Brushless Votor.", (
+            ("in", "counts_per_unit", "c_long"),)),
+        ("SetMotorParamsExt", "status", "Set the motor parameters for the Brushless Votor.", (
+            ("in", "counts_per_unit", "c_double"),)),
+        ("SetPosLoopParams", "status", "Sets the position feedback loop parameters.", (
+            ("in", "position_loop_params", "MOT_BrushlessPositionLoopParameters"),)),
+        ("SetVelocityProfileParams", "status", "Sets the velocity profile parameters.", (
+            ("in", "velocity_profile_params", "MOT_VelocityProfileParameters"),))),
+
+    "digital_outputs": (
+        ("GetDigitalOutputs", "c_byte", "Gets the digital output bits.", ()),
+        ("RequestDigitalOutputs", "status", "Requests the digital output bits.", ()),
+        ("SetDigitalOutputs", "status", "Sets the digital output bits.", (("in", "outputs_bits", "c_byte"),))),
+
+    "limit_switch": (
+        ("GetLimitSwitchParams", "status", "Gets the limit switch parameters.", (
+            ("out", "clockwise_hardware_limit", "MOT_LimitSwitchModes"),
+            ("out", "anticlockwise_hardware_limit", "MOT_LimitSwitchModes"), ("out", "clockwise_position", "c_uint"),
+            ("out", "anticlockwise_position", "c_uint"), ("out", "soft_limit_mode", "MOT_LimitSwitchSWModes"))),
+        ("GetLimitSwitchParamsBlock", "status", "Get the limit switch parameters.", (
+            ("out", "limit_switch_params", "MOT_LimitSwitchParameters"),)),
+        ("SetLimitSwitchParams", "status", "Sets the limit switch parameters.", (
+            ("in", "clockwise_hardware_limit", "MOT_LimitSwitchModes"),
+            ("in", "anticlockwise_hardware_limit", "MOT_LimitSwitchModes"), ("in", "clockwise_position", "c_uint"),
+            ("in", "anticlockwise_position", "c_uint"), ("in", "soft_limit_mode", "MOT_LimitSwitchSWModes"))),
+        ("SetLimitSwitchParamsBlock", "status", "Set the limit switch parameters.", (
+            ("in", "limit_switch_params", "MOT_LimitSwitchParameters"),))),
+
+    "request_limit_switch_params": (
+        ("RequestLimitSwitchParams", "status", "Requests the limit switch parameters.", ()),),
+
+    "trigger_switches": (
+        ("GetTriggerSwitches", "c_byte", "Gets the trigger switch bits.", ()),
+        ("SetTriggerSwitches", "status", "Sets the trigger switch bits.", (("in", "indicator_bits", "c_byte"),))),
+
+    "request_trigger_switches": (
+        ("RequestTriggerSwitches", "status", "Requests the trigger switch bits.", ()),),
+
+    "firmware_version": (
+        ("GetFirmwareVersion", "c_ulong", "Gets version number of the device firmware.", ()),),
+
+    "reset_stage_to_defaults": (
+        ("ResetStageToDefaults", "status", "Reset the stage settings to defaults.", ()),),
+
+    "calibration": (
+        ("GetCalibrationFile", "c_bool", "Get calibration file for this motor.", (
+            ("buffer", "filename", "c_short", 260),)),
+        ("IsCalibrationActive", "c_bool", "Is a calibration file active for this motor.", ()),
+        ("SetCalibrationFile", "void", "Set the calibration file for this motor.", (
+            ("text", "filename"), ("in", "enabled", "c_bool")))),
+
+    "led_switches": (
+        ("GetLEDswitches", "c_long", "Get the LED indicator bits on cube.", ()),
+        ("SetLEDswitches", "status", "Set the LED indicator bits on cube.", (("in", "ledswitches", "c_long"),))),
+
+    "request_led_switches": (
+        ("RequestLEDswitches", "status", "Request the LED indicator bits on cube.", ()),),
+
+    "trigger_config": (
+        ("GetTriggerConfigParams", "status", "Get the Trigger Configuration Parameters.", (
+            ("out", "trigger1_mode", "KMOT_TriggerPortMode"), ("out", "trigger1_polarity", "KMOT_TriggerPortPolarity"),
+            ("out", "trigger2_mode", "KMOT_TriggerPortMode"),
+            ("out", "trigger2_polarity", "KMOT_TriggerPortPolarity"))),
+        ("GetTriggerConfigParamsBlock", "status", "Gets the trigger configuration parameters block.", (
+            ("out", "trigger_config_params", "KMOT_TriggerConfig"),)),
+        ("RequestTriggerConfigParams", "status", "Requests the Trigger Configuration Parameters.", ()),
+        ("SetTriggerConfigParams", "status", "Set the Trigger Configuration Parameters.", (
+            ("in", "trigger1_mode", "KMOT_TriggerPortMode"), ("in", "trigger1_polarity", "KMOT_TriggerPortPolarity"),
+            ("in", "trigger2_mode", "KMOT_TriggerPortMode"), ("in", "trigger2_polarity", "KMOT_TriggerPortPolarity"))),
+        ("SetTriggerConfigParamsBlock", "status", "Sets the trigger configuration parameters block.", (
+            ("in", "trigger_config_params", "KMOT_TriggerConfig"),))),
+
+    "stepper_power": (
+        ("GetBowIndex", "c_short", "Gets the stepper motor bow index.", ()),
+        ("GetPowerParams", "status", "Gets the power parameters for the stepper motor.", (
+            ("out", "power_params", "MOT_PowerParameters"),)),
+        ("SetBowIndex", "status", "Sets the stepper motor bow index.", (("in", "bow_index", "c_short"),)),
+        ("SetPowerParams", "status", "Sets the power parameters for the stepper motor.", (
+            ("in", "power_params", "MOT_PowerParameters"),))),
+
+    "request_stepper_power": (
+        ("RequestBowIndex", "status", "Requests the stepper motor bow index.", ()),
+        ("RequestPowerParams", "status", "Requests the power parameters.", ())),
+
+    "hub_bay": (
+        ("GetHubBay", "c_char", "Gets the hub bay number this device is fitted to.", ()),),
+
+    "joystick": (
+        ("GetJoystickParams", "status", "Gets the joystick parameters.", (
+            ("out", "joystick_params", "MOT_JoystickParameters"),)),
+        ("SetJoystickParams", "status", "Sets the joystick parameters.", (
+            ("in", "joystick_params", "MOT_JoystickParameters"),))),
+
+    "request_joystick_params": (
+        ("RequestJoystickParams", "status", "Requests the joystick parameters.", ()),),
+
+    "track_settle": (
+        ("GetTrackSettleParams", "status",
+         "Gets the track settled parameters used to decide when settled at right position.", (
+             ("out", "settle_params", "MOT_BrushlessTrackSettleParameters"),)),
+        ("RequestTrackSettleParams", "status",
+         "Requests the track settled parameters used to decide when settled at right position.", ()),
+        ("SetTrackSettleParams", "status",
+         "Sets the track settled parameters used to decide when settled at right position.", (
+             ("in", "settle_params", "MOT_BrushlessTrackSettleParameters"),))),
+
+    "dc_pid": (
+        ("GetDCPIDParams", "status",
+         "Get the DC PID parameters for DC motors used in an algorithm involving calculus.", (
+             ("out", "dcproportional_integral_derivative_params", "MOT_DC_PIDParameters"),)),
+        ("RequestDCPIDParams", "status",
+         "Request the PID parameters for DC motors used in an algorithm involving calculus.", ()),
+        ("SetDCPIDParams", "status",
+         "Set the PID parameters for DC motors used in an algorithm involving calculus.", (
+             ("in", "dcproportional_integral_derivative_params", "MOT_DC_PIDParameters"),))),
+
+    "front_panel": (
+        ("CanDeviceLockFrontPanel", "c_bool", "Determine if the device front panel can be locked.", ()),
+        ("GetFrontPanelLocked", "c_bool", "Query if the device front panel locked.", ()),
+        ("RequestFrontPanelLocked", "status", "Ask the device if its front panel is locked.", ()),
+        ("SetFrontPanelLock", "status", "Sets the device front panel lock state.", (("in", "locked", "c_bool"),))),
+
+    "position_trigger": (
+        ("GetTriggerParamsParams", "status", "Get the Trigger Parameters Parameters.", (
+            ("out", "trigger_start_position_fwd", "c_int32"), ("out", "trigger_interval_fwd", "c_int32"),
+            ("out", "trigger_pulse_count_fwd", "c_int32"), ("out", "trigger_start_position_rev", "c_int32"),
+            ("out", "trigger_interval_rev", "c_int32"), ("out", "trigger_pulse_count_rev", "c_int32"),
+            ("out", "trigger_pulse_width", "c_int32"), ("out", "cycle_count", "c_int32"))),
+        ("GetTriggerParamsParamsBlock", "status", "Gets the trigger parameters block.", (
+            ("out", "trigger_params_params", "KMOT_TriggerParams"),)),
+        ("RequestPosTriggerParams", "status", "Requests the position trigger parameters.", ()),
+        ("SetTriggerParamsParams", "status", "Set the Trigger Parameters Parameters.", (
+            ("in", "trigger_start_position_fwd", "c_int32"), ("in", "trigger_interval_fwd", "c_int32"),
+            ("in", "trigger_pulse_count_fwd", "c_int32"), ("in", "trigger_start_position_rev", "c_int32"),
+            ("in", "trigger_interval_rev", "c_int32"), ("in", "trigger_pulse_count_rev", "c_int32"),
+            ("in", "trigger_pulse_width", "c_int32"), ("in", "cycle_count", "c_int32"))),
+        ("SetTriggerParamsParamsBlock", "status", "Sets the trigger parameters block.", (
+            ("in", "trigger_params_params", "KMOT_TriggerParams"),))),
+
+    "rack": (
+        ("GetNumChannels", "c_short", "Gets the number of channels in the device.", ()),
+        ("GetRackDigitalOutputs", "c_byte", "Gets the rack digital output bits.", ()),
+        ("GetRackStatusBits", "c_ulong", "Gets the Rack status bits.", ()),
+        ("IsChannelValid", "c_bool", "Verifies that the specified channel is valid.", ()),
+        ("MaxChannelCount", "c_int", "Gets the number of channels available to this device.", ()),
+        ("RequestRackDigitalOutputs", "status", "Requests the rack digital output bits.", ()),
+        ("RequestRackStatusBits", "status", "Requests the Rack status bits be downloaded.", ()),
+        ("SetRackDigitalOutputs", "status", "Sets the rack digital output bits.", (("in", "outputs_bits", "c_byte"),))),
+
+    "input_voltage": (
+        ("GetInputVoltage", "c_long", "Gets the analogue input voltage reading.", ()),
+        ("RequestInputVoltage", "status", "Requests the analogue input voltage reading.", ())),
+
+    "mmi": (
+        ("GetMMIParams", "status", "Get the MMI Parameters for the KCube Display Interface.", (
+            ("out", "wheel_mode", "KMOT_WheelMode"), ("out", "wheel_max_velocity", "c_int32"),
+            ("out", "wheel_acceleration", "c_int32"), ("out", "direction_sense", "KMOT_WheelDirectionSense"),
+            ("out", "preset_position1", "c_int32"), ("out", "preset_position2", "c_int32"),
+            ("out", "display_intensity", "c_int16"))),
+        ("GetMMIParamsBlock", "status", "Gets the MMI parameters for the device.", (
+            ("out", "mmi_params", "KMOT_MMIParams"),)),
+        ("GetMMIParamsExt", "status", "Get the MMI Parameters for the KCube Display Interface.", (
+            ("out", "wheel_mode", "KMOT_WheelMode"), ("out", "wheel_max_velocity", "c_int32"),
+            ("out", "wheel_acceleration", "c_int32"), ("out", "direction_sense", "KMOT_WheelDirectionSense"),
+            ("out", "preset_position1", "c_int32"), ("out", "preset_position2", "c_int32"),
+            ("out", "display_intensity", "c_int16"), ("out", "display_timeout", "c_int16"),
+            ("out", "display_dim_intensity", "c_int16"))),
+        ("SetMMIParams", "status", "Set the MMI Parameters for the KCube Display Interface.", (
+            ("in", "wheel_mode", "KMOT_WheelMode"), ("in", "wheel_max_velocity", "c_int32"),
+            ("in", "wheel_acceleration", "c_int32"), ("in", "direction_sense", "KMOT_WheelDirectionSense"),
+            ("in", "preset_position1", "c_int32"), ("in", "preset_position2", "c_int32"),
+            ("in", "display_intensity", "c_int16"))),
+        ("SetMMIParamsBlock", "status", "Sets the MMI parameters for the device.", (
+            ("in", "mmi_params", "KMOT_MMIParams"),)),
+        ("SetMMIParamsExt", "status", "Set the MMI Parameters for the KCube Display Interface.", (
+            ("in", "wheel_mode", "KMOT_WheelMode"), ("in", "wheel_max_velocity", "c_int32"),
+            ("in", "wheel_acceleration", "c_int32"), ("in", "direction_sense", "KMOT_WheelDirectionSense"),
+            ("in", "preset_position1", "c_int32"), ("in", "preset_position2", "c_int32"),
+            ("in", "display_intensity", "c_int16"), ("in", "display_timeout", "c_int16"),
+            ("in", "display_dim_intensity", "c_int16")))),
+
+    "request_mmi_params": (
+        ("RequestMMIparams", "status", "Requests the MMI Parameters for the Voice Coil Display Interface.", ()),),
+
+    "buttons": (
+        ("GetButtonParams", "status", "Gets the LTS button parameters.", (
+            ("out", "button_mode", "MOT_ButtonModes"), ("out", "left_button_position", "c_int"),
+            ("out", "right_button_position", "c_int"), ("out", "timeout", "c_short"))),
+        ("GetButtonParamsBlock", "status", "Get the button parameters.", (
+            ("out", "button_params", "MOT_ButtonParameters"),)),
+        ("GetPotentiometerParams", "status", "Gets the potentiometer parameters for the LTS.", (
+            ("in", "index", "c_short"), ("out", "threshold_deflection", "c_long"), ("out", "velocity", "c_ulong"))),
+        ("GetPotentiometerParamsBlock", "status", "Get the potentiometer parameters.", (
+            ("out", "potentiometer_steps", "MOT_PotentiometerSteps"),)),
+        ("RequestButtonParams", "status", "Requests the LTS button parameters.", ()),
+        ("RequestPotentiometerParams", "status", "Requests the potentiometer parameters.", ()),
+        ("SetButtonParams", "status", "Sets the LTS button parameters.", (
+            ("in", "button_mode", "MOT_ButtonModes"), ("in", "left_button_position", "c_int"),
+            ("in", "right_button_position", "c_int"))),
+        ("SetButtonParamsBlock", "status", "Set the button parameters.", (
+            ("in", "button_params", "MOT_ButtonParameters"),)),
+        ("SetPotentiometerParams", "status", "Sets the potentiometer parameters for the LTS.", (
+            ("in", "index", "c_short"), ("in", "threshold_deflection", "c_long"), ("in", "velocity", "c_ulong"))),
+        ("SetPotentiometerParamsBlock", "status", "Set the potentiometer parameters.", (
+            ("in", "potentiometer_steps", "MOT_PotentiometerSteps"),))),
+
+    "settled_current_loop": (
+        ("GetSettledCurrentLoopParams", "status",
+         "Gets the settled current loop parameters for holding at required position.", (
+             ("out", "current_loop_params", "MOT_BrushlessCurrentLoopParameters"),)),
+        ("RequestSettledCurrentLoopParams", "status",
+         "Requests the current loop parameters for holding at required position.", ()),
+        ("SetSettledCurrentLoopParams", "status",
+         "Sets the settled current loop parameters for holding at required position.", (
+             ("in", "current_loop_params", "MOT_BrushlessCurrentLoopParameters"),))),
+
+    "encoder_resolution": (
+        ("GetEncoderResolutionParams", "status", "Get the encoder resolution parameters.", (
+            ("out", "resolution_params", "MOT_EncoderResolutionParams"),)),
+        ("RequestEncoderResolutionParams", "status", "Requests the encoder resolution parameters.", ())),
+
+    "pid_loop_encoder": (
+        ("GetPIDLoopEncoderCoeff", "c_double", "Gets the Encoder PID loop encoder coefficient.", ()),
+        ("GetPIDLoopEncoderParams", "status", "Gets the Encoder PID loop parameters.", (
+            ("out", "params", "MOT_PIDLoopEncoderParams"),)),
+        ("RequestPIDLoopEncoderParams", "status", "Requests the Encoder PID loop parameters.", ()),
+        ("SetPIDLoopEncoderCoeff", "status", "Sets the Encoder PID loop encoder coefficient.", (
+            ("in", "coeff", "c_double"),)),
+        ("SetPIDLoopEncoderParams", "status", "Sets the Encoder PID loop parameters.", (
+            ("in", "params", "MOT_PIDLoopEncoderParams"),)),
+        ("UsesPIDLoopEncoding", "c_bool", "Determines if we can uses PID loop encoding.", ())),
+
+    "benchtop_brushless": (
+        ("GetAnalogMonitorConfigParams", "status", "Gets the Analog Monitor Config Parameters.", (
+            ("in", "monitor_no", "c_byte"), ("out", "motor_channel_no", "c_long"),
+            ("out", "monitor_var", "MOD_Monitor_Variable"), ("out", "scale", "c_long"), ("out", "offset", "c_long"))),
+        ("GetAnalogMonitorConfigParamsBlock", "status", "Gets the Analog Monitor Config Parameters.", (
+            ("in", "monitor_no", "c_byte"),
+            ("out", "analog_monitor_config_params", "MOD_AnalogMonitorConfigurationParameters"))),
+        ("GetAuxIOPortConfigParams", "status", "Gets the Aux IO Port Config Parameters.", (
+            ("in", "port_no", "c_byte"), ("out", "mode", "MOD_AuxIOPortMode"), ("out", "s_wstate", "c_long"))),
+        ("GetAuxIOPortConfigParamsBlock", "status", "Gets the Aux IO Port Config Parameters.", (
+            ("in", "port_no", "c_byte"),
+            ("out", "aux_ioport_configuration_params", "MOD_AuxIOPortConfigurationParameters"))),
+        ("GetIOPortConfigParams", "status", "Gets the IO Port Config Parameters.", (
+            ("in", "port_no", "c_byte"), ("out", "mode", "MOD_IOPortMode"), ("out", "source", "MOD_IOPortSource"))),
+        ("GetIOPortConfigParamsBlock", "status", "Gets the IO Port Config Parameters.", (
+            ("in", "port_no", "c_byte"), ("out", "ioport_configuration_params", "MOD_IOPortConfigurationParameters"))),
+        ("GetLCDMoveParams", "status", "Get the Parameters for Motion from the LCD Display Interface.", (
+            ("out", "knob_mode", "MOT_JogModes"), ("out", "jog_step_size", "c_int32"),
+            ("out", "jog_acceleration", "c_int32"), ("out", "jog_max_velocity", "c_int32"),
+            ("out", "stop_mode", "MOT_StopModes"), ("out", "preset_position1", "c_int32"),
+            ("out", "preset_position2", "c_int32"), ("out", "preset_position3", "c_int32"))),
+        ("GetLCDMoveParamsBlock", "status", "Gets the LCD parameters for the device.", (
+            ("out", "lcdparams", "MOT_LCDMoveParams"),)),
+        ("GetLCDParams", "status", "Get the LCD Parameters for the Benchtop Display Interface.", (
+            ("out", "jssensitivity", "c_int16"), ("out", "display_intensity", "c_int16"),
+            ("out", "display_timeout", "c_int16"), ("out", "display_dim_intensity", "c_int16"))),
+        ("GetLCDParamsBlock", "status", "Gets the LCD parameters for the device.", (
+            ("out", "lcdparams", "MOT_LCDParams"),)),
+        ("GetPositionTriggerState", "status", "Gets the Position Trigger state.", (
+            ("out", "trigger_state", "MOT_TriggerState"),)),
+        ("GetRasterScanMoveParams", "status", "Get the Raster Scan Move Parameters .", (
+            ("out", "raster_scan_move", "MOT_RasterScanMoveParams"),)),
+        ("GetTriggerIOConfigParams", "status", "Gets the IO Trigger Config Parameters.", (
+            ("out", "trigger_in_mode", "MOT_TriggerInputConfigModes"),
+            ("out", "trigger_in_polarity", "MOT_TriggerPolarity"), ("out", "input_source", "MOT_TriggerInputSource"),
+            ("out", "trigger_out_mode", "MOT_TriggerOutputConfigModes"),
+            ("out", "trigger_out_polarity", "MOT_TriggerPolarity"), ("out", "start_position_fwd", "c_long"),
+            ("out", "interval_fwd", "c_long"), ("out", "pulse_count_fwd", "c_long"),
+            ("out", "start_position_rev", "c_long"), ("out", "interval_rev", "c_long"),
+            ("out", "pulse_count_rev", "c_long"), ("out", "pulse_width", "c_long"), ("out", "cycle_count", "c_long"))),
+        ("GetTriggerIOConfigParamsBlock", "status", "Gets the IO Trigger Config Parameters.", (
+            ("out", "trigger_ioconfig_parameters", "MOT_TriggerIOConfigParameters"),)),
+        ("RasterScanMove", "status", "Starts a Raster Scan Move.", (("in", "move_cmd", "MOT_RasterScanMoveCmd"),)),
+        ("RegisterSynchronizedMoveCompleteCallback", "status",
+         "Registers a callback in the event of synchronized move ending.", (("in", "callback", "c_void_p"),)),
+        ("RequestAnalogMonitorConfigParams", "status", "Requests the Parameters for Analog Monitor config.", (
+            ("in", "monitor_no", "c_byte"),)),
+        ("RequestAuxIOPortConfigParams", "status", "Requests the Parameters for Aux IO Port config.", (
+            ("in", "port_no", "c_byte"),)),
+        ("RequestIOPortConfigParams", "status", "Requests the Parameters for IO Port config.", (
+            ("in", "port_no", "c_byte"),)),
+        ("RequestLCDMoveParams", "status", "Requests the Parameters for Motion from the LCD Display Interface.", ()),
+        ("RequestLCDParams", "status", "Requests the LCD Parameters for the Benchtop Display Interface.", ()),
+        ("RequestPositionTriggerState", "status", "Requests the Parameters for Position Trigger state.", ()),
+        ("RequestRasterScanMoveParams", "status", "requests the Raster Scan Move Parameters.", ()),
+        ("RequestTriggerIOConfigParams", "status", "Requests the Parameters for IO config Trigger.", ()),
+        ("SetAnalogMonitorConfigParams", "status", "Sets the Analog Monitor Config Parameters.", (
+            ("in", "monitor_no", "c_long"), ("in", "motor_channel_no", "c_long"),
+            ("in", "monitor_var", "MOD_Monitor_Variable"), ("in", "scale", "c_long"), ("in", "offset", "c_long"))),
+        ("SetAnalogMonitorConfigParamsBlock", "status", "Sets the IO Port Config Parameters.", (
+            ("in", "analog_monitor_configuration_parameters", "MOD_AnalogMonitorConfigurationParameters"),)),
+        ("SetAuxIOPortConfigParams", "status", "Sets the IO Port Config Parameters.", (
+            ("in", "port_nos", "c_long"), ("in", "mode", "MOD_AuxIOPortMode"), ("in", "s_wstate", "c_long"))),
+        ("SetAuxIOPortConfigParamsBlock", "status", "Sets the IO Port Config Parameters.", (
+            ("in", "aux_ioport_configuration_params", "MOD_AuxIOPortConfigurationSetParameters"),)),
+        ("SetIOPortConfigParams", "status", "Sets the IO Port Config Parameters.", (
+            ("in", "port_no", "c_long"), ("in", "mode", "MOD_IOPortMode"), ("in", "source", "MOD_IOPortSource"))),
+        ("SetIOPortConfigParamsBlock", "status", "Sets the IO Port Config Parameters.", (
+            ("in", "ioport_configuration_params", "MOD_IOPortConfigurationParameters"),)),
+        ("SetLCDMoveParams", "status", "Set the Parameters for Motion from the LCD Display Interface.", (
+            ("in", "knob_mode", "MOT_JogModes"), ("in", "jog_step_size", "c_int32"),
+            ("in", "jog_acceleration", "c_int32"), ("in", "jog_max_velocity", "c_int32"),
+            ("in", "stop_mode", "MOT_StopModes"), ("in", "preset_position1", "c_int32"),
+            ("in", "preset_position2", "c_int32"), ("in", "preset_position3", "c_int32"))),
+        ("SetLCDMoveParamsBlock", "status", "Sets the LCD parameters for the device.", (
+            ("in", "lcdparams", "MOT_LCDMoveParams"),)),
+        ("SetLCDParams", "status", "Set the LCD Parameters for the Benchtop Display Interface.", (
+            ("in", "jssensitivity", "c_int16"), ("in", "display_intensity", "c_int16"),
+            ("in", "display_timeout", "c_int16"), ("in", "display_dim_intensity", "c_int16"))),
+        ("SetLCDParamsBlock", "status", "Sets the LCD parameters for the device.", (
+            ("in", "lcdparams", "MOT_LCDParams"),)),
+        ("SetMultiChannelMoveArrayParams", "status", "Sets parameters for array of synchronized moves.", (
+            ("in", "array_id", "c_long"), ("in", "cycle_start_index", "c_long"), ("in", "cycle_end_index", "c_long"),
+            ("in", "repeat_count", "c_long"), ("in", "end_index", "c_long"), ("in", "deceleration", "c_ulong"))),
+        ("SetMultiChannelMoveArraySection", "status", "Sets section of array of synchronized moves.", (
+            ("in", "array_id", "c_long"), ("in", "channels_mask", "c_long"), ("in", "number_of_points", "c_long"),
+            ("in", "start_index", "c_long"), ("in", "time_positions", "c_void_p"))),
+        ("SetPositionTriggerState", "status", "Sets the Position Trigger state.", (
+            ("in", "trigger_state", "MOT_TriggerState"),)),
+        ("SetRasterScanMoveParams", "status", "Set the Raster Scan Move Parameters .", (
+            ("in", "raster_scan_move", "MOT_RasterScanMoveParams"),)),
+        ("SetTriggerIOConfigParams", "status", "Sets the IO Trigger Config Parameters.", (
+            ("in", "trigger_in_mode", "MOT_TriggerInputConfigModes"),
+            ("in", "trigger_in_polarity", "MOT_TriggerPolarity"), ("in", "input_source", "MOT_TriggerInputSource"),
+            ("in", "trigger_out_mode", "MOT_TriggerOutputConfigModes"),
+            ("in", "trigger_out_polarity", "MOT_TriggerPolarity"), ("in", "start_position_fwd", "c_long"),
+            ("in", "interval_fwd", "c_long"), ("in", "pulse_count_fwd", "c_long"),
+            ("in", "start_position_rev", "c_long"), ("in", "interval_rev", "c_long"),
+            ("in", "pulse_count_rev", "c_long"), ("in", "pulse_width", "c_long"), ("in", "cycle_count", "c_long"))),
+        ("SetTriggerIOConfigParamsBlock", "status", "Sets the IO Trigger Config Parameters.", (
+            ("in", "trigger_ioconfig_parameters", "MOT_TriggerIOConfigParameters"),)),
+        ("StartMultiChannelMoveArray", "status", "Starts array of synchronized moves.", (
+            ("in", "array_id", "c_long"), ("in", "channels_mask", "c_ulong"))),
+        ("StopImmediateSynchronously", "status",
+         "Stop the current vector move immediately (with risk of losing track of position).", (
+             ("in", "channels_mask", "c_ulong"),)),
+        ("StopProfiledSynchronously", "status", "Stop the current vector move using the current velocity profile.", (
+            ("in", "channels_mask", "c_ulong"),)),
+        ("VectorMoveToPosition", "status", "Move selected channels to the specified positions synchronously.", (
+            ("in", "channel_targets", "MOT_ChannelPosition"), ("in", "num_channel_targets", "c_int"),
+            ("in", "acceleration", "c_int"), ("in", "max_velocity", "c_int")))),
+
+    "trigger_params": (
+        ("GetTriggerParams", "status", "Gets the trigger parameters.", (
+            ("out", "trigger_start_position_fwd", "c_int32"), ("out", "trigger_interval_fwd", "c_int32"),
+            ("out", "trigger_pulse_count_fwd", "c_int32"), ("out", "trigger_start_position_rev", "c_int32"),
+            ("out", "trigger_interval_rev", "c_int32"), ("out", "trigger_pulse_count_rev", "c_int32"),
+            ("out", "trigger_pulse_width", "c_int32"), ("out", "cycle_count", "c_int32"))),
+        ("GetTriggerParamsBlock", "status", "Gets the trigger parameters block.", (
+            ("out", "trigger_params", "KMOT_TriggerParams"),)),
+        ("RequestTriggerParams", "status", "Requests the trigger parameters.", ()),
+        ("SetTriggerParams", "status", "Sets the trigger parameters.", (
+            ("in", "trigger_start_position_fwd", "c_int32"), ("in", "trigger_interval_fwd", "c_int32"),
+            ("in", "trigger_pulse_count_fwd", "c_int32"), ("in", "trigger_start_position_rev", "c_int32"),
+            ("in", "trigger_interval_rev", "c_int32"), ("in", "trigger_pulse_count_rev", "c_int32"),
+            ("in", "trigger_pulse_width", "c_int32"), ("in", "cycle_count", "c_int32"))),
+        ("SetTriggerParamsBlock", "status", "Sets the trigger parameters block.", (
+            ("in", "trigger_params", "KMOT_TriggerParams"),))),
+
+    "scan": (
+        ("GetScanParams", "status", "Gets the BVC Scan parameters.", (
+            ("out", "scan_parameters", "MOT_BVC_ScanParams"),)),
+        ("IsScanning", "c_bool", "Gets the Scanning state.", ()),
+        ("IsScanningEnabled", "c_bool", "get whether BVC is scanning.", ()),
+        ("RequestScanParams", "status", "Requests the BVC Scan parameters.", ()),
+        ("SetScanParams", "status", "Set the BVC Scan parameters.", (("in", "scan_parameters", "MOT_BVC_ScanParams"),)),
+        ("StartScanning", "status", "Starts a scanning.", ()),
+        ("StopScanning", "status", "Stops a scanning.", ())),
+
+    "request_status": (
+        ("RequestStatus", "status", "Request position and status bits.", ()),),
+
+    "kcube_stepper": (
+        ("RequestMMIParams", "status", "Requests the MMI Parameters for the KCube Display Interface.", ()),
+        ("SetStageType", "status", "Sets the stage type.", (("in", "stage_id", "KST_Stages"),))),
+
+    "tcube_stepper": (
+        ("SetStageType", "status", "Sets the stage type.", (("in", "stage_id", "TST_Stages"),)),)}
+
+# Prefix, channel type (None for single-channel controllers), capabilities and,
+# on multi-channel controllers, the functions that take no channel, of every
+# motor module.
+FAMILIES = {
+    "benchtopbrushlessmotor": (
+        "BMC", "c_short", (
+            "motor", "device", "identify", "status_commands", "status_direction", "encoder", "request_encoder_counter",
+            "rotation_modes", "brushless", "digital_outputs", "trigger_switches", "request_trigger_switches",
+            "firmware_version", "reset_stage_to_defaults", "joystick", "request_joystick_params", "track_settle",
+            "rack", "settled_current_loop", "benchtop_brushless"), (
+            "CheckConnection", "Close", "GetAnalogMonitorConfigParams", "GetAnalogMonitorConfigParamsBlock",
+            "GetAuxIOPortConfigParams", "GetAuxIOPortConfigParamsBlock", "GetIOPortConfigParams",
+            "GetIOPortConfigParamsBlock", "GetLCDParams", "GetLCDParamsBlock", "GetNumChannels",
+            "GetRackDigitalOutputs", "GetRackStatusBits", "GetRasterScanMoveParams", "GetSoftwareVersion", "Identify",
+            "MaxChannelCount", "Open", "RasterScanMove", "RegisterSynchronizedMoveCompleteCallback",
+            "RequestAnalogMonitorConfigParams", "RequestAuxIOPortConfigParams", "RequestIOPortConfigParams",
+            "RequestLCDParams", "RequestRackDigitalOutputs", "RequestRackStatusBits", "RequestRasterScanMoveParams",
+            "SetAnalogMonitorConfigParams", "SetAnalogMonitorConfigParamsBlock", "SetAuxIOPortConfigParams",
+            "SetAuxIOPortConfigParamsBlock", "SetIOPortConfigParams", "SetIOPortConfigParamsBlock", "SetLCDParams",
+            "SetLCDParamsBlock", "SetMultiChannelMoveArrayParams", "SetMultiChannelMoveArraySection",
+            "SetRackDigitalOutputs", "SetRasterScanMoveParams", "StartMultiChannelMoveArray",
+            "StopImmediateSynchronously", "StopProfiledSynchronously", "VectorMoveToPosition")),
+    "benchtopdcservo": (
+        "BDC", "c_short", (
+            "motor", "device", "identify_status", "status_commands", "status_direction", "encoder",
+            "request_encoder_counter", "rotation_modes", "motor_params", "digital_outputs", "limit_switch",
+            "request_limit_switch_params", "trigger_switches", "request_trigger_switches", "firmware_version",
+            "calibration", "trigger_config", "dc_pid", "rack", "input_voltage", "encoder_resolution",
+            "trigger_params"), (
+            "CheckConnection", "Close", "GetNumChannels", "GetRackDigitalOutputs", "GetRackStatusBits",
+            "GetSoftwareVersion", "Identify", "MaxChannelCount", "Open", "RequestRackDigitalOutputs",
+            "RequestRackStatusBits", "SetRackDigitalOutputs")),
+    "benchtopsteppermotor": (
+        "SBC", "c_short", (
+            "motor", "device", "identify", "status_commands", "status_direction", "encoder", "request_encoder_counter",
+            "rotation_modes", "motor_params", "digital_outputs", "limit_switch", "request_limit_switch_params",
+            "trigger_switches", "request_trigger_switches", "firmware_version", "calibration", "stepper_power",
+            "request_stepper_power", "joystick", "request_joystick_params", "rack", "input_voltage",
+            "pid_loop_encoder"), (
+            "CheckConnection", "Close", "GetNumChannels", "GetRackDigitalOutputs", "GetRackStatusBits",
+            "GetSoftwareVersion", "MaxChannelCount", "Open", "RequestRackDigitalOutputs", "RequestRackStatusBits",
+            "SetRackDigitalOutputs")),
+    "benchtopvoicecoil": (
+        "BVC", None, (
+            "motor", "device", "identify", "void_commands", "encoder", "request_encoder_counter", "rotation_modes",
+            "motor_params", "digital_outputs", "limit_switch", "request_limit_switch_params", "reset_stage_to_defaults",
+            "led_switches", "request_led_switches", "trigger_config", "hub_bay", "dc_pid", "front_panel",
+            "position_trigger", "mmi", "request_mmi_params", "scan"), ()),
+    "integratedsteppermotor": (
+        "ISC", None, (
+            "motor", "device", "identify", "void_commands", "rotation_modes", "motor_params", "limit_switch",
+            "request_limit_switch_params", "trigger_switches", "request_trigger_switches", "firmware_version",
+            "reset_stage_to_defaults", "calibration", "led_switches", "stepper_power", "request_stepper_power",
+            "buttons", "request_status"), ()),
+    "kcubebrushlessmotor": (
+        "BMC", "c_short", (
+            "motor", "device", "identify", "status_commands", "status_direction", "encoder", "request_encoder_counter",
+            "rotation_modes", "brushless", "digital_outputs", "trigger_switches", "request_trigger_switches",
+            "firmware_version", "reset_stage_to_defaults", "trigger_config", "track_settle", "front_panel",
+            "position_trigger", "mmi", "request_mmi_params"), (
+            "CanDeviceLockFrontPanel", "CheckConnection", "Close", "GetFrontPanelLocked", "GetMMIParams",
+            "GetMMIParamsBlock", "GetMMIParamsExt", "GetSoftwareVersion", "GetTriggerConfigParams",
+            "GetTriggerConfigParamsBlock", "GetTriggerParamsParams", "GetTriggerParamsParamsBlock", "Identify", "Open",
+            "RequestFrontPanelLocked", "RequestMMIparams", "RequestPosTriggerParams", "RequestTriggerConfigParams",
+            "SetFrontPanelLock", "SetMMIParams", "SetMMIParamsBlock", "SetMMIParamsExt", "SetTriggerConfigParams",
+            "SetTriggerConfigParamsBlock", "SetTriggerParamsParams", "SetTriggerParamsParamsBlock")),
+    "kcubedcservo": (
+        "KVS", None, (
+            "motor", "device", "identify", "void_commands", "encoder", "request_encoder_counter", "motor_params",
+            "digital_outputs", "reset_stage_to_defaults", "led_switches", "request_led_switches", "trigger_config",
+            "hub_bay", "track_settle", "dc_pid", "front_panel", "position_trigger", "encoder_resolution"), ()),
+    "kcubesteppermotor": (
+        "SCC", None, (
+            "motor", "device", "identify", "void_commands", "encoder", "request_encoder_counter", "rotation_modes",
+            "motor_params", "digital_outputs", "limit_switch", "request_limit_switch_params", "calibration",
+            "trigger_config", "stepper_power", "request_stepper_power", "hub_bay", "front_panel", "position_trigger",
+            "mmi", "pid_loop_encoder", "kcube_stepper"), ()),
+    "modularsteppermotor": (
+        "SBC", "c_short", (
+            "motor", "status_direction", "encoder", "rotation_modes", "motor_params", "digital_outputs", "limit_switch",
+            "trigger_switches", "calibration", "stepper_power", "joystick", "input_voltage"), ()),
+    "tcubebrushlessmotor": (
+        "BMC", "c_short", (
+            "motor", "device", "identify", "status_commands", "status_direction", "encoder", "request_encoder_counter",
+            "rotation_modes", "brushless", "trigger_switches", "request_trigger_switches", "firmware_version",
+            "reset_stage_to_defaults", "led_switches", "joystick", "request_joystick_params", "track_settle",
+            "settled_current_loop"), (
+            "CheckConnection", "Close", "GetLEDswitches", "GetSoftwareVersion", "Identify", "Open", "SetLEDswitches")),
+    "tcubeservo": (
+        "CC", None, (
+            "motor", "device", "identify", "void_commands", "encoder", "request_encoder_counter", "rotation_modes",
+            "motor_params", "limit_switch", "request_limit_switch_params", "led_switches", "request_led_switches",
+            "hub_bay", "dc_pid", "buttons"), ()),
+    "tcubesteppermotor": (
+        "SCC", None, (
+            "motor", "device", "identify", "void_commands", "encoder", "request_encoder_counter", "rotation_modes",
+            "motor_params", "limit_switch", "request_limit_switch_params", "calibration", "led_switches",
+            "request_led_switches", "stepper_power", "request_stepper_power", "hub_bay", "buttons",
+            "tcube_stepper"), ())}
+
+
+def functions(module):
+    # The table entries of a motor module, by module name.
+
+    capabilities = FAMILIES[module][2]
+    return [entry for capability in capabilities for entry in CAPABILITIES[capability]]
+
+
+def _invalidating(function, units, channel):
+    # Wrap a function changing the motor parameters so that it drops the
+    # cached unit conversion of the channel.
+    @functools.wraps(function)
+    def wrapper(serial_number, *args):
+        result = function(serial_number, *args)
+        units.invalidate(serial_number, args[0] if channel else None)
+        return result
+    return wrapper
+
+
+def bind_motor(namespace):
+    # Define the functions of a motor module in its namespace (its globals(),
+    # which must hold its lib) and its UnitConverter, units.
+
+    module = namespace["__name__"].rpartition(".")[2]
+    prefix, channel_type, capabilities, device_functions = FAMILIES[module]
+    channel_type = channel_type and types[channel_type]
+    bind(namespace, namespace["lib"], prefix, functions(module), channel_type, device_functions)
+
+    units = namespace["units"] = UnitConverter(namespace["get_real_value_from_device_unit"])
+    for name in ("set_motor_params", "set_motor_params_ext"):
+        namespace[name] = _invalidating(namespace[name], units, channel_type is not None)
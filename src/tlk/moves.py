@@ -0,0 +1,129 @@
+"""Futures completed by the message ending a move, for threaded code.
+
+A MoveDispatcher listens to a device's MessageBridge.  Its move methods issue
+the command and return a concurrent.futures.Future that is completed with the
+GenericMotor Moved or Homed message the move ends with, on the dll's thread,
+as soon as the message is posted:
+
+    stage = KCubeDCServo("27000001")
+    stage.open_device()
+    move = stage.moves.move_to_position(10000)
+    ...
+    message = move.result(timeout=30.0)
+
+A Stopped message completes every future of the device still pending, with
+the Stopped message.  A future waited on with a timeout stays pending after
+concurrent.futures.TimeoutError is raised; cancel it if its move is given up.
+The messages matched to a future are taken from the bridge; the others are
+left in its messages.
+"""
+import threading
+from concurrent.futures import Future
+
+from .definitions.messages import GenericMotor, Homed, Moved, Stopped
+
+
+class MoveDispatcher(object):
+    """Move futures of one device or channel, e.g. KCubeDCServo("27000001").moves."""
+
+    def __init__(self, device):
+        self.device = device
+        self.bridge = device.bridge
+        # (message ID, future) of the futures waiting for a message.
+        self._pending = []
+        self._lock = threading.Lock()
+        self.bridge.listeners.append(self._dispatch)
+
+    def _dispatch(self, message):
+        # Bridge listener: complete the futures waiting for message.
+        if message.type != GenericMotor or message.id not in (Homed, Moved, Stopped):
+            return False
+        stopped = message.id == Stopped
+        with self._lock:
+            futures = [future for message_id, future in self._pending if stopped or message_id == message.id]
+            if not futures:
+                return False
+            self._pending = [entry for entry in self._pending if not (stopped or entry[0] == message.id)]
+        for future in futures:
+            if future.set_running_or_notify_cancel():
+                future.set_result(message)
+        return True
+
+    def expect(self, message_id=Moved):
+        """A future completed by the next GenericMotor message message_id (or Stopped).
+
+        Call it before the command whose end it waits for.
+        """
+        bridge = self.bridge
+        if not bridge.started:
+            bridge.start()
+        else:
+            # Messages of earlier moves must not complete the new future.
+            bridge.drain()
+        future = Future()
+        with self._lock:
+            self._pending.append((message_id, future))
+        return future
+
+    def call(self, function, args=(), message_id=Moved):
+        """Call function(*args) and return a future completed by the message ending it."""
+        future = self.expect(message_id)
+        try:
+            function(*args)
+        except BaseException:
+            self.discard(future)
+            raise
+        return future
+
+    def discard(self, future):
+        """Stop waiting for a future from expect, whose command was not made, and cancel it."""
+        with self._lock:
+            self._pending = [entry for entry in self._pending if entry[1] is not future]
+        future.cancel()
+
+    def home(self):
+        """Home the device; the future's result is the Homed message."""
+        return self.call(self.device.home, (), Homed)
+
+    def move_to_position(self, position):
+        """Move to position, in device units."""
+        return self.call(self.device.move_to_position, (position,))
+
+    def move_absolute(self):
+        """Move to the position set with set_move_absolute_position."""
+        return self.call(self.device.move_absolute)
+
+    def move_relative(self, displacement):
+        """Move by displacement, in device units."""
+        return self.call(self.device.move_relative, (displacement,))
+
+    def move_relative_distance(self):
+        """Move by the distance set with set_move_relative_distance."""
+        return self.call(self.device.move_relative_distance)
+
+    def move_jog(self, direction):
+        """Jog in direction, a MOT_TravelDirection."""
+        return self.call(self.device.move_jog, (direction,))
+
+    def move_at_velocity(self, direction):
+        """Move in direction until a limit is reached or the move is stopped."""
+        return self.call(self.device.move_at_velocity, (direction,))
+
+    def stop_profiled(self):
+        """Stop with the current velocity profile; the result is the Stopped message."""
+        return self.call(self.device.stop_profiled, (), Stopped)
+
+    def pending(self):
+        """The number of futures waiting for a message."""
+        return len(self._pending)
+
+    def close(self):
+        """Stop listening to the bridge and cancel the futures still pending."""
+        self.bridge.listeners.remove(self._dispatch)
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for _, future in pending:
+            future.cancel()
+
+    def __repr__(self):
+        return "<MoveDispatcher of %r, %d pending>" % (self.device, self.pending())
@@ -0,0 +1,169 @@
+"""Predicted durations of moves, from a channel's velocity parameters.
+
+A MoveModel reads a channel's move velocity parameters (GetVelParams), its
+velocity profile (GetVelocityProfileParams, on the controllers that have
+one) and its backlash (GetBacklash) once, in real units, and predicts how
+long moves take, one at a time or as arrays of moves with numpy, so that a
+caller can sleep until a move should be over and only then ask for the
+status, instead of polling all along:
+
+    model = MoveModel(KCubeDCServo("27000001"))
+    time.sleep(model.duration(12.5))            # from the current position
+    model.durations(starts, targets)             # seconds of each move
+    model.path(targets)                          # of each move of a sequence
+
+Moves run from rest to rest.  Trapezoidal profiles accelerate at the
+acceleration up to the velocity; S-curve profiles also limit the jerk, the
+rate at which the acceleration changes.  A move towards decreasing positions
+with a backlash overshoots the target by the backlash distance and then
+approaches it forwards, as the controllers correct for backlash.  Settling and
+the time the controller takes to answer are not included.  The value of the
+S-curve profile mode is not documented by the Kinesis headers; the one used
+here is the position of its member in the header, as tlk.raster does.
+"""
+import math
+
+from .units import ACCELERATION, DISTANCE, VELOCITY
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# MOT_VelocityProfileModes.
+TRAPEZOIDAL = 0
+S_CURVE = 1
+
+
+def move_time(distance, velocity, acceleration, jerk=None):
+    """Seconds a move of distance takes from rest to rest; trapezoidal unless jerk is given."""
+    distance = abs(distance)
+    if distance == 0:
+        return 0.0
+    if not jerk:
+        if distance < velocity * velocity / acceleration:
+            return 2.0 * (distance / acceleration) ** 0.5
+        return distance / velocity + velocity / acceleration
+    # The velocity at which the acceleration reaches its limit.
+    corner = acceleration * acceleration / jerk
+    if velocity < corner:
+        ramp = 2.0 * math.sqrt(velocity / jerk)
+    else:
+        ramp = velocity / acceleration + acceleration / jerk
+    if distance >= velocity * ramp:
+        return distance / velocity + ramp
+    # The velocity is never reached: accelerate to a peak and decelerate.
+    peak = (distance * math.sqrt(jerk) / 2.0) ** (2.0 / 3.0)
+    if peak <= corner:
+        return 4.0 * math.sqrt(peak / jerk)
+    ratio = acceleration / jerk
+    peak = acceleration / 2.0 * (math.sqrt(ratio * ratio + 4.0 * distance / acceleration) - ratio)
+    return 2.0 * (peak / acceleration + ratio)
+
+
+def move_times(distances, velocity, acceleration, jerk=None):
+    """move_time of every distance of an array, as an array."""
+    if numpy is None:
+        return [move_time(distance, velocity, acceleration, jerk) for distance in distances]
+    distances = numpy.abs(numpy.asarray(distances, dtype=float))
+    if not jerk:
+        return numpy.where(distances < velocity * velocity / acceleration,
+                           2.0 * numpy.sqrt(distances / acceleration),
+                           distances / velocity + velocity / acceleration)
+    corner = acceleration * acceleration / jerk
+    if velocity < corner:
+        ramp = 2.0 * math.sqrt(velocity / jerk)
+    else:
+        ramp = velocity / acceleration + acceleration / jerk
+    ratio = acceleration / jerk
+    peak = (distances * math.sqrt(jerk) / 2.0) ** (2.0 / 3.0)
+    limited = acceleration / 2.0 * (numpy.sqrt(ratio * ratio + 4.0 * distances / acceleration) - ratio)
+    return numpy.where(
+        distances >= velocity * ramp, distances / velocity + ramp,
+        numpy.where(peak <= corner, 4.0 * numpy.sqrt(peak / jerk), 2.0 * (limited / acceleration + ratio)))
+
+
+class MoveModel(object):
+    """The move times of a device or channel object, in real units and seconds.
+
+    velocity, acceleration, jerk and backlash override the values read from
+    the controller; jerk 0 means a trapezoidal profile.
+    """
+
+    def __init__(self, motor, velocity=None, acceleration=None, jerk=None, backlash=None):
+        self.motor = motor
+        device = getattr(motor, "device", None)
+        self._serial_number = (device or motor).serial_number
+        self._module = (device or motor).module
+        self._channel = None if device is None else motor.number
+        self.refresh()
+        if velocity is not None:
+            self.velocity = velocity
+        if acceleration is not None:
+            self.acceleration = acceleration
+        if jerk is not None:
+            self.jerk = jerk
+        if backlash is not None:
+            self.backlash = backlash
+
+    def _real(self, value, unit_type=DISTANCE):
+        return self._module.units.to_real_units(self._serial_number, value, unit_type, self._channel)
+
+    def refresh(self):
+        """Read the velocity parameters, velocity profile and backlash again."""
+        motor = self.motor
+        acceleration, velocity = motor.get_vel_params()
+        self.acceleration = self._real(acceleration, ACCELERATION)
+        self.velocity = self._real(velocity, VELOCITY)
+        self.backlash = abs(self._real(motor.get_backlash()))
+        self.jerk = 0.0
+        if hasattr(motor, "get_velocity_profile_params"):
+            profile = motor.get_velocity_profile_params()
+            if profile.mode == S_CURVE and profile.jerk:
+                # Jerk is counted in one more time base than acceleration,
+                # at 2 ** 32 rather than 2 ** 16 device units.
+                _, velocity_scale, acceleration_scale = self._module.units.scales(
+                    self._serial_number, self._channel)
+                self.jerk = profile.jerk / (acceleration_scale * acceleration_scale / velocity_scale * 65536)
+
+    def position(self):
+        """The current position, in real units."""
+        return self._real(self.motor.get_position())
+
+    def duration(self, target, start=None):
+        """Seconds of a move to target, from start or the current position."""
+        if start is None:
+            start = self.position()
+        distance = target - start
+        if distance < 0 and self.backlash:
+            return (move_time(self.backlash - distance, self.velocity, self.acceleration, self.jerk)
+                    + move_time(self.backlash, self.velocity, self.acceleration, self.jerk))
+        return move_time(distance, self.velocity, self.acceleration, self.jerk)
+
+    def durations(self, starts, targets):
+        """Seconds of the moves from each of starts to the matching target, as an array."""
+        if numpy is None:
+            return [self.duration(target, start) for start, target in zip(starts, targets)]
+        distances = numpy.asarray(targets, dtype=float) - numpy.asarray(starts, dtype=float)
+        if not self.backlash:
+            return move_times(distances, self.velocity, self.acceleration, self.jerk)
+        reverse = distances < 0
+        times = move_times(numpy.where(reverse, self.backlash - distances, distances),
+                           self.velocity, self.acceleration, self.jerk)
+        return times + reverse * move_time(self.backlash, self.velocity, self.acceleration, self.jerk)
+
+    def path(self, targets, start=None):
+        """Seconds of each move of a sequence through targets, from start or the current position."""
+        if start is None:
+            start = self.position()
+        if numpy is None:
+            targets = list(targets)
+            return self.durations([start] + targets[:-1], targets)
+        targets = numpy.asarray(targets, dtype=float)
+        if not len(targets):
+            return targets
+        return self.durations(numpy.concatenate(([start], targets[:-1])), targets)
+
+    def __repr__(self):
+        return "<MoveModel of %r: %g/s, %g/s2, jerk %g/s3, backlash %g>" % (
+            self.motor, self.velocity, self.acceleration, self.jerk, self.backlash)
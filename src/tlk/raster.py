@@ -0,0 +1,206 @@
+"""Raster scans run by benchtop brushless controllers, planned in real units.
+
+A RasterScan describes a scan of a rectangle by two channels of one
+controller: the fast channel sweeps lines from x_start to x_stop, the slow
+channel steps from y_start to y_stop between them, lines in all.  It builds
+the MOT_RasterScanMoveParams in device units, uploads them with
+SetRasterScanMoveParams and starts, pauses and stops the scan with
+RasterScanMove; and from the channels' velocity parameters it predicts the
+timeline of the scan, so that acquisition can be aligned to it instead of
+stepping the stage from Python:
+
+    scan = RasterScan(stage, 1, 2, (0.0, 10.0), (0.0, 5.0), lines=51, dwell=0.01)
+    scan.upload()
+    scan.start()
+    scan.timeline["time"][scan.timeline["event"] == LINE_START]   # when each line starts
+    scan.positions(frame_times)                                     # where the stage is
+
+The scan is taken to run as follows: both channels move to the start, then
+for every line the fast channel sweeps it and dwells, and, but after the last
+line, returns to x_start with the flyback pattern, and the slow channel makes
+one step and dwells.  With the forward_reverse pattern every other line is
+swept from x_stop back to x_start.  Moves are trapezoidal, from rest to rest.
+The values of the pattern, trigger mode and command enumerations are not
+documented by the Kinesis headers; those used here are the positions of their
+members in the headers.
+"""
+from .definitions.structures import MOT_RasterScanMoveParams
+from .movetime import move_time
+from .units import ACCELERATION, DISTANCE, VELOCITY
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# MOT_RasterScanMovePattern.
+PATTERNS = {"flyback": 0, "forward_reverse": 1}
+
+# MOT_RasterScanMoveTriggerMode.
+TRIGGER_MODES = {"software": 0, "x_step": 1, "y_step": 2, "xy_scan": 3, "on_off": 4}
+
+# MOT_RasterScanMoveCmd.
+START = 0
+PAUSE = 1
+STOP = 2
+
+# Events of the timeline.
+AT_START = 0
+LINE_START = 1
+LINE_END = 2
+STEP_END = 3
+
+
+def _travelled(elapsed, distance, velocity, acceleration):
+    # Distance covered after elapsed seconds of a trapezoidal move, on arrays.
+    ramp = numpy.minimum(velocity / acceleration, numpy.sqrt(distance / acceleration))
+    peak = acceleration * ramp
+    duration = 2 * ramp + numpy.where(peak > 0, (distance - peak * ramp) / numpy.where(peak > 0, peak, 1), 0)
+    elapsed = numpy.clip(elapsed, 0, duration)
+    remaining = duration - elapsed
+    return numpy.where(
+        elapsed < ramp, 0.5 * acceleration * elapsed ** 2,
+        numpy.where(remaining > ramp, 0.5 * peak * ramp + peak * (elapsed - ramp),
+                    distance - 0.5 * acceleration * remaining ** 2))
+
+
+class RasterScan(object):
+    """A raster scan of a rectangle by two channels of a controller, in real units and seconds.
+
+    dwell and step_dwell are the seconds the scan waits after each line and
+    each step.  origin is the (x, y) the channels start from, read from the
+    controller if not given.
+    """
+
+    def __init__(self, device, x_channel, y_channel, x_range, y_range, lines, pattern="forward_reverse",
+                 dwell=0.0, step_dwell=0.0, trigger_mode="xy_scan", trigger_source=0, trigger_polarity=0,
+                 origin=None):
+        if lines < 1:
+            raise ValueError("a scan has at least one line")
+        if pattern not in PATTERNS:
+            raise ValueError("pattern is one of %s" % ", ".join(sorted(PATTERNS)))
+        self.device = device
+        self.x_channel = x_channel
+        self.y_channel = y_channel
+        self.x_start, self.x_stop = x_range
+        self.y_start, self.y_stop = y_range
+        self.lines = lines
+        self.pattern = pattern
+        self.dwell = dwell
+        self.step_dwell = step_dwell
+        self.step = (self.y_stop - self.y_start) / (lines - 1) if lines > 1 else 0.0
+        self.params = self._params(trigger_mode, trigger_source, trigger_polarity)
+        self.velocity = {}
+        self.acceleration = {}
+        for axis, channel in (("x", x_channel), ("y", y_channel)):
+            self.acceleration[axis], self.velocity[axis] = self._velocity_params(channel)
+        if origin is None:
+            origin = tuple(self._real(channel, device.channel(channel).get_position())
+                           for channel in (x_channel, y_channel))
+        self.origin = origin
+        self.segments = []
+        self.events = []
+        self._plan()
+        self.timeline = self._timeline()
+
+    def _device_units(self, channel, value, unit_type=DISTANCE):
+        return int(self.device.module.units.to_device_units(self.device.serial_number, value, unit_type, channel))
+
+    def _real(self, channel, value, unit_type=DISTANCE):
+        return self.device.module.units.to_real_units(self.device.serial_number, value, unit_type, channel)
+
+    def _velocity_params(self, channel):
+        acceleration, velocity = self.device.channel(channel).get_vel_params()
+        return self._real(channel, acceleration, ACCELERATION), self._real(channel, velocity, VELOCITY)
+
+    def _params(self, trigger_mode, trigger_source, trigger_polarity):
+        params = MOT_RasterScanMoveParams()
+        for axis, channel, start, distance, dwell, cycles in (
+                (params.AxisMovement1, self.x_channel, self.x_start, self.x_stop - self.x_start, self.dwell, 1),
+                (params.AxisMovement2, self.y_channel, self.y_start, self.step, self.step_dwell, self.lines)):
+            axis.ChannelNo = channel
+            axis.StartPos = self._device_units(channel, start)
+            axis.RelativeDistance = self._device_units(channel, distance)
+            axis.DwellTime = int(round(dwell * 1e3))
+            axis.CycleCount = cycles
+        params.ScanPattern = PATTERNS[self.pattern]
+        params.TriggerMode = TRIGGER_MODES.get(trigger_mode, trigger_mode)
+        params.TriggerSource = trigger_source
+        params.TriggerInPolarity = trigger_polarity
+        return params
+
+    def _plan(self):
+        # Segments (axis, start time, start, end) and events of the scan,
+        # following the order of moves in the module docstring.
+        now = 0.0
+        position = {"x": self.origin[0], "y": self.origin[1]}
+
+        def move(axis, target):
+            duration = move_time(target - position[axis], self.velocity[axis], self.acceleration[axis])
+            self.segments.append((axis, now, position[axis], target))
+            position[axis] = target
+            return duration
+
+        now += max(move("x", self.x_start), move("y", self.y_start))
+        self.events.append((now, self.x_start, self.y_start, AT_START, 0))
+        for line in range(self.lines):
+            reverse = self.pattern == "forward_reverse" and line % 2
+            start, stop = (self.x_stop, self.x_start) if reverse else (self.x_start, self.x_stop)
+            self.events.append((now, start, position["y"], LINE_START, line))
+            now += move("x", stop) + self.dwell
+            self.events.append((now - self.dwell, stop, position["y"], LINE_END, line))
+            if line == self.lines - 1:
+                break
+            if self.pattern == "flyback":
+                now += move("x", self.x_start)
+            now += move("y", self.y_start + (line + 1) * self.step) + self.step_dwell
+            self.events.append((now - self.step_dwell, position["x"], position["y"], STEP_END, line))
+        self.duration = now
+
+    def _timeline(self):
+        if numpy is None:
+            return list(self.events)
+        dtype = [("time", "f8"), ("x", "f8"), ("y", "f8"), ("event", "i1"), ("line", "i4")]
+        return numpy.array(self.events, dtype)
+
+    @property
+    def line_starts(self):
+        """The times the lines start, in seconds from the start of the scan."""
+        return [event[0] for event in self.events if event[3] == LINE_START]
+
+    def positions(self, times):
+        """The (x, y) positions of the channels at times, seconds from the start, as an array of rows."""
+        if numpy is None:
+            raise ImportError("numpy is needed for raster scan positions")
+        times = numpy.asarray(times, dtype=float)
+        result = numpy.empty(times.shape + (2,))
+        for column, axis in enumerate(("x", "y")):
+            segments = [segment for segment in self.segments if segment[0] == axis]
+            starts = numpy.array([segment[1] for segment in segments])
+            origins = numpy.array([segment[2] for segment in segments])
+            targets = numpy.array([segment[3] for segment in segments])
+            index = numpy.clip(numpy.searchsorted(starts, times, "right") - 1, 0, len(segments) - 1)
+            distance = numpy.abs(targets[index] - origins[index])
+            travelled = _travelled(
+                times - starts[index], distance, self.velocity[axis], self.acceleration[axis])
+            position = origins[index] + numpy.sign(targets[index] - origins[index]) * travelled
+            result[..., column] = numpy.where(times < starts[0], origins[0], position)
+        return result
+
+    def upload(self):
+        """Send the scan's parameters to the controller."""
+        self.device.set_raster_scan_move_params(self.params)
+
+    def start(self):
+        """Start the uploaded scan."""
+        self.device.raster_scan_move(START)
+
+    def pause(self):
+        self.device.raster_scan_move(PAUSE)
+
+    def stop(self):
+        """Stop the scan and disable it."""
+        self.device.raster_scan_move(STOP)
+
+    def __repr__(self):
+        return "<RasterScan of %r, %d lines in %.3f s>" % (self.device, self.lines, self.duration)
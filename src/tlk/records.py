@@ -0,0 +1,125 @@
+"""Arrays of ctypes structures in one contiguous buffer.
+
+The structures of tlk.definitions.structures map to NumPy structured dtypes
+with the same field names, offsets and size, and to struct format strings for
+when numpy is not installed:
+
+    records.dtype(MOT_VelocityParameters)          # dtype([('minVelocity', '<i4'), ...])
+    records.struct_format(MOT_VelocityParameters)  # '=iii'
+
+A RecordArray keeps capacity structures back to back, in a ctypes array.
+append copies a structure in with a single memcpy, as a slice assignment of
+the buffer's bytes, and the records are read as a NumPy array viewing the
+same memory (or as tuples, with the struct format) without converting the
+structures field by field:
+
+    readings = RecordArray(NT_TIAReading, 100000)
+    for _ in range(samples):
+        readings.append(get_reading(serial_number))
+    readings.array["absoluteReading"].mean()
+"""
+import functools
+import struct
+from ctypes import Array, Structure, c_bool, c_char, c_double, c_float, sizeof
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@functools.lru_cache(maxsize=None)
+def dtype(structure):
+    """The NumPy dtype of a Structure subclass: the same fields, offsets and size."""
+    if numpy is None:
+        raise ImportError("numpy is needed for structure dtypes")
+    return numpy.dtype(structure)
+
+
+def _format(ctype):
+    # struct format of a field type, without padding.
+    if issubclass(ctype, Structure):
+        return _fields_format(ctype)
+    if issubclass(ctype, Array):
+        if ctype._type_ is c_char:
+            return "%ds" % ctype._length_
+        return _format(ctype._type_) * ctype._length_
+    if ctype is c_bool:
+        return "?"
+    if ctype is c_char:
+        return "c"
+    if ctype is c_float:
+        return "f"
+    if ctype is c_double:
+        return "d"
+    code = {1: "b", 2: "h", 4: "i", 8: "q"}[sizeof(ctype)]
+    # Unsigned ctypes codes are upper case, as are struct's.
+    return code.upper() if ctype._type_.isupper() else code
+
+
+def _fields_format(structure):
+    # Fields of a structure with pad bytes up to each offset and at the end.
+    parts = []
+    end = 0
+    for field in structure._fields_:
+        name, ctype = field[:2]
+        offset = getattr(structure, name).offset
+        parts.append("x" * (offset - end) + _format(ctype))
+        end = offset + sizeof(ctype)
+    parts.append("x" * (sizeof(structure) - end))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def struct_format(structure):
+    """The struct format of a Structure subclass, in native byte order and standard sizes.
+
+    Nested structures and arrays are flattened, char arrays are "s" fields.
+    """
+    return "=" + _fields_format(structure)
+
+
+class RecordArray(object):
+    """capacity structures of one Structure subclass, in one contiguous buffer."""
+
+    def __init__(self, structure, capacity):
+        self.structure = structure
+        self.capacity = capacity
+        self.size = sizeof(structure)
+        self.buffer = (structure * capacity)()
+        self._bytes = memoryview(self.buffer).cast("B")
+        self.count = 0
+
+    def append(self, instance):
+        """Copy a structure into the next record; raises IndexError when the array is full."""
+        if self.count == self.capacity:
+            raise IndexError("RecordArray is full")
+        start = self.count * self.size
+        self._bytes[start:start + self.size] = memoryview(instance).cast("B")
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Forget the records; the buffer is reused."""
+        self.count = 0
+
+    @property
+    def array(self):
+        """The records so far, as a view of the buffer; requires numpy."""
+        return numpy.frombuffer(self.buffer, dtype(self.structure), self.count)
+
+    def __getitem__(self, index):
+        """A record as a new Structure instance."""
+        if not -self.count <= index < self.count:
+            raise IndexError(index)
+        return self.structure.from_buffer_copy(self.buffer, (index % self.count) * self.size)
+
+    def tuples(self):
+        """The records as tuples of their fields, by struct_format."""
+        view = self._bytes[:self.count * self.size]
+        return list(struct.iter_unpack(struct_format(self.structure), view))
+
+    def __repr__(self):
+        return "<RecordArray %s, %d/%d>" % (self.structure.__name__, self.count, self.capacity)
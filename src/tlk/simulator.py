@@ -0,0 +1,1049 @@
+"""In-process simulation of the Kinesis dlls.
+
+Select it with tlk.library.set_backend("simulated"), or TLK_BACKEND=simulated,
+and add controllers with add_device.  Every device module then talks to the
+simulated controllers instead of the Thorlabs dlls, on any platform.
+
+Entry points are dispatched on the part of their name after the prefix, so
+KVS_MoveToPosition, BMC_MoveToPosition and SCC_MoveToPosition share one model.
+Motors follow trapezoidal velocity profiles in real time (sped up by
+time_scale), post Homed, Moved and Stopped messages to their channel's queue
+when a move ends, and call any callback registered with RegisterMessageCallback
+from a background thread, as the dlls do.  Entry points without a model of
+their own keep the values passed to their Set form and return them from their
+Get form.  The TLI_ device list functions report the simulated devices.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from ctypes import (
+    CFUNCTYPE,
+    Array,
+    Structure,
+    _Pointer,
+    addressof,
+    c_bool,
+    c_char_p,
+    c_int,
+    c_int32,
+    c_short,
+    c_uint16,
+    cast,
+    memmove,
+    sizeof)
+from . import binding
+from .definitions import messages
+
+
+# Speed up every simulated motion by this factor.
+time_scale = 1.0
+
+# Seconds Open takes, as the dlls take to find a device on USB.
+open_delay = 0.0
+
+devices = {}
+
+# Error codes returned by simulated entry points, see KinesisException.
+FT_DeviceNotFound = 2
+TL_NOT_IMPLEMENTED = 34
+TL_INVALID_OPERATION = 36
+TL_INVALID_POSITION = 38
+TL_INVALID_CHANNEL = 42
+
+# Motor status bits, as returned by GetStatusBits.
+CW_HARDWARE_LIMIT = 0x00000001
+CCW_HARDWARE_LIMIT = 0x00000002
+MOVING_FORWARD = 0x00000010
+MOVING_REVERSE = 0x00000020
+JOGGING_FORWARD = 0x00000040
+JOGGING_REVERSE = 0x00000080
+CONNECTED = 0x00000100
+HOMING = 0x00000200
+HOMED = 0x00000400
+ENABLED = 0x80000000
+
+# Device units per real unit of position, velocity and acceleration.
+_DC_SERVO = (34304.0, 767367.49, 261.93)
+_BRUSHLESS = (20000.0, 134217.73, 13.744)
+_STEPPER = (409600.0, 21987328.0, 4506.0)
+_UNSCALED = (1.0, 1.0, 1.0)
+
+# Serial numbers start with the type ID of the controller.
+_TYPES = {
+    22: ("Benchtop NanoTrak", 1, _UNSCALED),
+    26: ("KCube Stepper Motor", 1, _STEPPER),
+    27: ("KCube DC Servo", 1, _DC_SERVO),
+    28: ("KCube Brushless Motor", 1, _BRUSHLESS),
+    29: ("KCube Piezo", 1, _UNSCALED),
+    37: ("Filter Flipper", 1, _UNSCALED),
+    38: ("Polarizer", 3, _UNSCALED),
+    40: ("Benchtop Stepper Motor", 3, _STEPPER),
+    41: ("Benchtop Piezo", 3, _UNSCALED),
+    43: ("Benchtop DC Servo", 2, _DC_SERVO),
+    44: ("Benchtop Precision Piezo", 2, _UNSCALED),
+    45: ("Integrated Stepper Motor", 1, _STEPPER),
+    56: ("KCube Laser Source", 1, _UNSCALED),
+    64: ("TCube Laser Diode", 1, _UNSCALED),
+    65: ("TCube Inertial Motor", 4, _UNSCALED),
+    67: ("TCube Brushless Motor", 1, _BRUSHLESS),
+    68: ("KCube Solenoid", 1, _UNSCALED),
+    69: ("KCube Position Aligner", 1, _UNSCALED),
+    70: ("Benchtop Stepper Motor", 3, _STEPPER),
+    71: ("Benchtop Piezo", 3, _UNSCALED),
+    73: ("Benchtop Brushless Motor", 3, _BRUSHLESS),
+    80: ("TCube Stepper Motor", 1, _STEPPER),
+    81: ("TCube Piezo", 1, _UNSCALED),
+    82: ("TCube NanoTrak", 1, _UNSCALED),
+    83: ("TCube DC Servo", 1, _DC_SERVO),
+    84: ("TCube Strain Gauge", 1, _UNSCALED),
+    85: ("TCube Solenoid", 1, _UNSCALED),
+    86: ("TCube Laser Source", 1, _UNSCALED),
+    87: ("TCube TEC", 1, _UNSCALED),
+    89: ("TCube Quad", 1, _UNSCALED),
+    97: ("KCube Inertial Motor", 4, _UNSCALED),
+    98: ("KCube Laser Diode", 1, _UNSCALED),
+    103: ("Benchtop Brushless Motor", 3, _BRUSHLESS),
+    113: ("KCube Piezo Strain Gauge", 1, _UNSCALED)}
+
+# Prefixes whose functions take a channel after the serial number, with the
+# ctypes type the channel is declared as.
+_CHANNEL_TYPES = {
+    "BDC": c_short,
+    "BMC": c_short,
+    "KIM": c_uint16,
+    "MPC": c_short,
+    "PBC": c_short,
+    "PPC2": c_int,
+    "SBC": c_short,
+    "TIM": c_uint16}
+
+_lock = threading.RLock()
+_message_posted = threading.Condition(_lock)
+_clock = time.monotonic
+
+
+def add_device(serial_number, channels=None, type_id=None):
+    # Add a simulated controller.  The type ID, channel count and unit scaling
+    # default from the serial number prefix.
+
+    serial_number = str(serial_number)
+    if type_id is None:
+        # The longest prefix that is a known type ID, e.g. 103 before 10.
+        type_id = int(serial_number[:3])
+        if type_id not in _TYPES:
+            type_id = int(serial_number[:2])
+    description, default_channels, scale = _TYPES.get(type_id, ("Simulated Device", 1, _DC_SERVO))
+    device = SimulatedDevice(serial_number, type_id, description, channels or default_channels, scale)
+    with _lock:
+        devices[serial_number] = device
+    return device
+
+
+def remove_device(serial_number):
+    # Remove a simulated controller, stopping anything it is doing.
+
+    with _lock:
+        device = devices.pop(str(serial_number))
+        for channel in device.channels.values():
+            channel.halt()
+
+
+def reset():
+    # Remove every simulated controller.
+
+    for serial_number in list(devices):
+        remove_device(serial_number)
+
+
+class _Timer(threading.Thread):
+    # Runs scheduled actions at their due time on a single daemon thread.
+
+    def __init__(self):
+        threading.Thread.__init__(self, name="tlk-simulator", daemon=True)
+        self._queue = []
+        self._counter = itertools.count()
+        self._wake = threading.Condition()
+
+    def schedule(self, when, action):
+        entry = [when, next(self._counter), action]
+        with self._wake:
+            heapq.heappush(self._queue, entry)
+            self._wake.notify()
+        return entry
+
+    def run(self):
+        while True:
+            with self._wake:
+                while not self._queue or self._queue[0][0] > _clock():
+                    timeout = self._queue[0][0] - _clock() if self._queue else None
+                    self._wake.wait(timeout)
+                action = heapq.heappop(self._queue)[2]
+            if action is not None:
+                action()
+
+
+_timer = None
+
+
+def _schedule(delay, action):
+    global _timer
+    if _timer is None:
+        _timer = _Timer()
+        _timer.start()
+    return _timer.schedule(_clock() + delay, action)
+
+
+class _Move(object):
+    # A trapezoidal move from rest to rest, in device units and seconds.
+
+    def __init__(self, origin, target, acceleration, velocity, message_id, jog=False):
+        self.origin = origin
+        self.target = target
+        self.message_id = message_id
+        self.jog = jog
+        self.timer = None
+        distance = abs(target - origin)
+        acceleration = max(acceleration, 1e-9)
+        velocity = max(velocity, 1e-9)
+        ramp = velocity / acceleration
+        if distance < velocity * ramp:
+            ramp = (distance / acceleration) ** 0.5
+            velocity = max(acceleration * ramp, 1e-9)
+        self.acceleration = acceleration
+        self.velocity = velocity
+        self.ramp = ramp
+        self.duration = 2 * ramp + max(distance - velocity * ramp, 0.0) / velocity
+        self.start = _clock()
+
+    def position(self, now):
+        elapsed = now - self.start
+        if elapsed >= self.duration:
+            return self.target
+        if elapsed < self.ramp:
+            travelled = 0.5 * self.acceleration * elapsed * elapsed
+        elif elapsed < self.duration - self.ramp:
+            travelled = 0.5 * self.velocity * self.ramp + self.velocity * (elapsed - self.ramp)
+        else:
+            remaining = self.duration - elapsed
+            travelled = abs(self.target - self.origin) - 0.5 * self.acceleration * remaining * remaining
+        if self.target < self.origin:
+            travelled = -travelled
+        return self.origin + travelled
+
+
+class SimulatedChannel(object):
+    """State of one channel (or the only channel) of a simulated controller."""
+
+    def __init__(self, device, number, scale):
+        self.device = device
+        self.number = number
+        self.counts, self.velocity_scale, self.acceleration_scale = scale
+        self.position = 0.0
+        self.move = None
+        self.homed = False
+        self.homing = False
+        self.enabled = True
+        self.acceleration = int(4.0 * self.acceleration_scale)
+        self.velocity = int(2.0 * self.velocity_scale)
+        self.homing_velocity = int(1.0 * self.velocity_scale)
+        self.jog_step = int(0.1 * self.counts)
+        self.move_absolute_position = 0
+        self.move_relative_distance = 0
+        self.backlash = 0
+        self.minimum = 0
+        self.maximum = int(25.0 * self.counts)
+        self.polling = 0
+        self.messages = deque()
+        self.callback = None
+        self.settings = {}
+
+    def current_position(self):
+        move = self.move
+        if move is None:
+            return self.position
+        return move.position(_clock())
+
+    def status_bits(self):
+        bits = CONNECTED
+        move = self.move
+        if move is not None:
+            if move.target >= move.origin:
+                bits |= JOGGING_FORWARD | MOVING_FORWARD if move.jog else MOVING_FORWARD
+            else:
+                bits |= JOGGING_REVERSE | MOVING_REVERSE if move.jog else MOVING_REVERSE
+        position = self.current_position()
+        if position >= self.maximum:
+            bits |= CW_HARDWARE_LIMIT
+        if position <= self.minimum and self.homed:
+            bits |= CCW_HARDWARE_LIMIT
+        if self.homing:
+            bits |= HOMING
+        if self.homed:
+            bits |= HOMED
+        if self.enabled:
+            bits |= ENABLED
+        return bits
+
+    def start_move(self, target, velocity, message_id, jog=False, acceleration=None):
+        # Start moving to target (device units) at velocity and acceleration
+        # (device units, the channel's acceleration by default).
+        scale = time_scale
+        velocity = velocity / self.velocity_scale * self.counts * scale
+        if acceleration is None:
+            acceleration = self.acceleration
+        acceleration = acceleration / self.acceleration_scale * self.counts * scale * scale
+        with _lock:
+            origin = self.current_position()
+            self.cancel()
+            move = _Move(origin, float(target), acceleration, velocity, message_id, jog)
+            self.move = move
+            move.timer = _schedule(move.duration, lambda: self._finish(move))
+        return move
+
+    def _finish(self, move):
+        with _lock:
+            if self.move is not move:
+                return
+            self.position = move.target
+            self.move = None
+            if self.homing:
+                self.homing = False
+                self.homed = True
+        if move.message_id is not None:
+            self.post(messages.GenericMotor, move.message_id)
+
+    def cancel(self):
+        # Freeze the channel where it is without posting a message.
+        with _lock:
+            move = self.move
+            if move is None:
+                return False
+            self.position = move.position(_clock())
+            self.move = None
+            move.timer[2] = None
+            self.homing = False
+            return True
+
+    def halt(self):
+        if self.cancel():
+            self.post(messages.GenericMotor, messages.Stopped)
+
+    def post(self, message_type, message_id, data=0):
+        # Queue a message and notify anyone waiting for it.
+        with _lock:
+            self.messages.append((message_type, message_id, data))
+            _message_posted.notify_all()
+            callback = self.callback
+        if callback is not None:
+            callback()
+
+
+class SimulatedDevice(object):
+    """A simulated controller, with one SimulatedChannel per channel."""
+
+    def __init__(self, serial_number, type_id, description, channels, scale):
+        self.serial_number = serial_number
+        self.type_id = type_id
+        self.description = description
+        self.opened = False
+        # Error codes returned by the next calls to Open, in order.
+        self.open_errors = deque()
+        # Multi-channel move arrays by array ID: the last index to run and the
+        # points by index, as (time in ms, {channel: position}).
+        self.move_arrays = {}
+        # A token of the raster scan running, if one is.
+        self.raster = None
+        # Called when a vector move ends.
+        self.synchronized_callback = None
+        self.channels = dict(
+            (number, SimulatedChannel(self, number, scale)) for number in range(1, channels + 1))
+
+    def __repr__(self):
+        return "<SimulatedDevice %s %s>" % (self.serial_number, self.description)
+
+
+################################################################
+# Argument conversion.  Wrappers may pass ctypes instances, byref() or
+# pointer() references or plain Python values.
+
+def _target(arg):
+    obj = getattr(arg, "_obj", None)
+    if obj is not None:
+        return obj
+    if isinstance(arg, _Pointer):
+        return arg.contents
+    return arg
+
+
+def _text(arg):
+    arg = _target(arg)
+    if isinstance(arg, str):
+        return arg
+    if isinstance(arg, bytes):
+        value = arg
+    elif isinstance(arg, (c_char_p, Array)):
+        value = arg.value
+    elif isinstance(arg, _Pointer):
+        value = cast(arg, c_char_p).value
+    else:
+        return None
+    return value.split(b"\0", 1)[0].decode() if isinstance(value, bytes) else None
+
+
+def _value(arg):
+    arg = _target(arg)
+    if isinstance(arg, (Structure, Array)):
+        return type(arg).from_buffer_copy(arg)
+    return getattr(arg, "value", arg)
+
+
+def _store(arg, value):
+    target = _target(arg)
+    if isinstance(target, (Structure, Array)):
+        if isinstance(value, type(target)):
+            memmove(addressof(target), addressof(value), sizeof(target))
+    elif hasattr(target, "value") and not isinstance(target, type):
+        target.value = value
+
+
+def _write_text(buffer, size, text):
+    target = _target(buffer)
+    if not isinstance(target, (Array, _Pointer)):
+        return
+    data = text.encode()[:max(int(_value(size)) - 1, 0)] + b"\0"
+    memmove(target, data, len(data))
+
+
+################################################################
+# Entry points taking a serial number, dispatched on the name suffix.
+
+_handlers = {}
+
+
+def _entry(*names):
+    def register(handler):
+        for name in names:
+            _handlers[name] = handler
+        return handler
+    return register
+
+
+@_entry("Open")
+def _open(channel, *args):
+    if open_delay:
+        time.sleep(open_delay)
+    if channel.device.open_errors:
+        return channel.device.open_errors.popleft()
+    channel.device.opened = True
+    channel.post(messages.GenericDevice, messages.SettingsInitialized)
+
+
+@_entry("Close")
+def _close(channel, *args):
+    channel.device.opened = False
+    channel.polling = 0
+
+
+@_entry("CheckConnection", "LoadSettings", "LoadNamedSettings", "PersistSettings", "CanHome")
+def _true(channel, *args):
+    return True
+
+
+@_entry("CanMoveWithoutHomingFirst")
+def _false(channel, *args):
+    return False
+
+
+@_entry("NeedsHoming")
+def _needs_homing(channel, *args):
+    return not channel.homed
+
+
+@_entry("StartPolling")
+def _start_polling(channel, milliseconds=0, *args):
+    channel.polling = int(_value(milliseconds))
+    return True
+
+
+@_entry("StopPolling")
+def _stop_polling(channel, *args):
+    channel.polling = 0
+
+
+@_entry("PollingDuration")
+def _polling_duration(channel, *args):
+    return channel.polling
+
+
+@_entry("EnableChannel")
+def _enable_channel(channel, *args):
+    channel.enabled = True
+
+
+@_entry("DisableChannel")
+def _disable_channel(channel, *args):
+    channel.enabled = False
+
+
+@_entry("GetNextMessage")
+def _get_next_message(channel, message_type=None, message_id=None, message_data=None, *args):
+    with _lock:
+        if not channel.messages:
+            return False
+        message = channel.messages.popleft()
+    for arg, value in zip((message_type, message_id, message_data), message):
+        _store(arg, value)
+    return True
+
+
+@_entry("WaitForMessage")
+def _wait_for_message(channel, message_type=None, message_id=None, message_data=None, *args):
+    with _message_posted:
+        _message_posted.wait_for(lambda: channel.messages)
+    return _get_next_message(channel, message_type, message_id, message_data)
+
+
+@_entry("MessageQueueSize")
+def _message_queue_size(channel, *args):
+    return len(channel.messages)
+
+
+@_entry("ClearMessageQueue")
+def _clear_message_queue(channel, *args):
+    with _lock:
+        channel.messages.clear()
+
+
+@_entry("RegisterMessageCallback")
+def _register_message_callback(channel, callback=None, *args):
+    if callback is not None and not callable(callback):
+        address = _value(callback)
+        callback = CFUNCTYPE(None)(address) if address else None
+    channel.callback = callback
+
+
+@_entry("GetPosition")
+def _get_position(channel, *args):
+    return int(round(channel.current_position()))
+
+
+@_entry("SetPositionCounter")
+def _set_position_counter(channel, count=0, *args):
+    with _lock:
+        channel.cancel()
+        channel.position = float(_value(count))
+
+
+@_entry("GetPositionCounter", "GetEncoderCounter")
+def _get_position_counter(channel, *args):
+    return int(round(channel.current_position()))
+
+
+@_entry("GetStatusBits")
+def _get_status_bits(channel, *args):
+    return channel.status_bits()
+
+
+@_entry("Home")
+def _home(channel, *args):
+    with _lock:
+        channel.start_move(channel.minimum, channel.homing_velocity, messages.Homed)
+        channel.homed = False
+        channel.homing = True
+
+
+def _move_to(channel, target):
+    target = int(round(target))
+    if not channel.minimum <= target <= channel.maximum:
+        return TL_INVALID_POSITION
+    channel.start_move(target, channel.velocity, messages.Moved)
+
+
+@_entry("MoveToPosition")
+def _move_to_position(channel, index=0, *args):
+    return _move_to(channel, _value(index))
+
+
+@_entry("MoveAbsolute")
+def _move_absolute(channel, *args):
+    return _move_to(channel, channel.move_absolute_position)
+
+
+@_entry("MoveRelative")
+def _move_relative(channel, displacement=0, *args):
+    return _move_to(channel, channel.current_position() + _value(displacement))
+
+
+@_entry("MoveRelativeDistance")
+def _move_relative_distance(channel, *args):
+    return _move_to(channel, channel.current_position() + channel.move_relative_distance)
+
+
+@_entry("MoveJog")
+def _move_jog(channel, direction=1, *args):
+    step = channel.jog_step if _value(direction) == 1 else -channel.jog_step
+    target = min(max(channel.current_position() + step, channel.minimum), channel.maximum)
+    channel.start_move(target, channel.velocity, messages.Moved, jog=True)
+
+
+@_entry("MoveAtVelocity")
+def _move_at_velocity(channel, direction=1, *args):
+    target = channel.maximum if _value(direction) == 1 else channel.minimum
+    channel.start_move(target, channel.velocity, messages.Moved)
+
+
+@_entry("StopImmediate", "StopProfiled")
+def _stop(channel, *args):
+    channel.halt()
+
+
+def _mask_channels(channel, mask):
+    mask = int(_value(mask))
+    return [number for number in sorted(channel.device.channels) if mask & (1 << (number - 1))]
+
+
+@_entry("SetMultiChannelMoveArrayParams")
+def _set_move_array_params(channel, array_id=0, cycle_start=0, cycle_end=0, repeat_count=0, end_index=0, *args):
+    array = channel.device.move_arrays.setdefault(int(_value(array_id)), {"end_index": None, "points": {}})
+    array["end_index"] = int(_value(end_index))
+
+
+@_entry("SetMultiChannelMoveArraySection")
+def _set_move_array_section(channel, array_id=0, channels_mask=0, number_of_points=0, start_index=0,
+                            time_positions=None, *args):
+    # Points are a time in ms followed by the position of every channel in
+    # the mask, as int32.
+    channels = _mask_channels(channel, channels_mask)
+    points = int(_value(number_of_points))
+    width = 1 + len(channels)
+    data = _target(time_positions)
+    if not isinstance(data, Array):
+        data = (c_int32 * (points * width)).from_address(_value(data))
+    data = list(memoryview(data).cast("B").cast("i")[:points * width])
+    array = channel.device.move_arrays.setdefault(int(_value(array_id)), {"end_index": None, "points": {}})
+    start = int(_value(start_index))
+    for index in range(points):
+        point = data[index * width:(index + 1) * width]
+        array["points"][start + index] = (point[0], dict(zip(channels, point[1:])))
+
+
+@_entry("StartMultiChannelMoveArray")
+def _start_move_array(channel, array_id=0, channels_mask=0, *args):
+    # Each channel moves from point to point at constant velocity, leaving a
+    # point at its time so as to arrive at the next one at its time, as the
+    # firmware interpolates between points; the last move posts Moved.
+    device = channel.device
+    array = device.move_arrays.get(int(_value(array_id)))
+    if array is None or not array["points"]:
+        return TL_INVALID_OPERATION
+    channels = [device.channels[number] for number in _mask_channels(channel, channels_mask)]
+    end = array["end_index"]
+    if end is None:
+        end = max(array["points"])
+    points = [array["points"][index] for index in range(end + 1) if index in array["points"]]
+
+    def step(index):
+        leave = points[index - 1][0] if index else 0
+        duration = max(points[index][0] - leave, 1) / 1e3
+        last = index == len(points) - 1
+        for target in channels:
+            position = points[index][1].get(target.number)
+            if position is None:
+                continue
+            distance = abs(position - target.current_position()) / target.counts
+            velocity = max(distance / duration, 1e-6) * target.velocity_scale
+            target.start_move(position, velocity, messages.Moved if last else None,
+                              acceleration=velocity / duration * 1e3)
+        if not last:
+            _schedule((points[index][0] - leave) / 1e3 / time_scale, lambda: step(index + 1))
+
+    _schedule(0, lambda: step(0))
+
+
+@_entry("RegisterSynchronizedMoveCompleteCallback")
+def _register_synchronized_callback(channel, callback=None, *args):
+    if callback is not None and not callable(callback):
+        address = _value(callback)
+        callback = CFUNCTYPE(None)(address) if address else None
+    channel.device.synchronized_callback = callback
+
+
+@_entry("VectorMoveToPosition")
+def _vector_move_to_position(channel, targets=None, count=0, acceleration=0, velocity=0, *args):
+    # Move the channels in a straight line, acceleration and velocity being
+    # those of the vector in the units of the first channel, and call the
+    # synchronized move callback when they all arrive.
+    device = channel.device
+    targets = _target(targets)
+    count = int(_value(count))
+    if isinstance(targets, Structure):
+        targets = (type(targets) * count).from_address(addressof(targets))
+    moves = []
+    for target in targets[:count]:
+        moving = device.channels.get(target.channelNumber)
+        if moving is None:
+            return TL_INVALID_CHANNEL
+        if not moving.minimum <= target.position <= moving.maximum:
+            return TL_INVALID_POSITION
+        moves.append((moving, target.position, (target.position - moving.current_position()) / moving.counts))
+    length = sum(distance * distance for _, _, distance in moves) ** 0.5 or 1.0
+    first = moves[0][0] if moves else channel
+    velocity = _value(velocity) / first.velocity_scale
+    acceleration = _value(acceleration) / first.acceleration_scale
+    started = []
+    for moving, position, distance in moves:
+        share = abs(distance) / length
+        started.append((moving, moving.start_move(
+            position, max(velocity * share, 1e-9) * moving.velocity_scale, None,
+            acceleration=max(acceleration * share, 1e-9) * moving.acceleration_scale)))
+
+    def done():
+        if any(moving.move is move for moving, move in started):
+            _schedule(0, done)
+        elif all(moving.position == move.target for moving, move in started):
+            callback = device.synchronized_callback
+            if callback is not None:
+                callback()
+
+    _schedule(max([move.duration for _, move in started] or [0]), done)
+
+
+@_entry("RasterScanMove")
+def _raster_scan_move(channel, move_cmd=0, *args):
+    # Run the scan set with SetRasterScanMoveParams: to the start, then each
+    # line, a flyback with the flyback pattern (0), and a step.  Any other
+    # command than start (0) stops it.
+    device = channel.device
+    device.raster = None
+    if int(_value(move_cmd)) != 0:
+        for target in device.channels.values():
+            target.halt()
+        return
+    params = channel.settings.get("RasterScanMoveParams")
+    if not params:
+        return TL_INVALID_OPERATION
+    params = params[0]
+    fast, slow = params.AxisMovement1, params.AxisMovement2
+    x, y = device.channels.get(fast.ChannelNo), device.channels.get(slow.ChannelNo)
+    if x is None or y is None:
+        return TL_INVALID_CHANNEL
+    phases = [([(x, fast.StartPos), (y, slow.StartPos)], 0)]
+    for line in range(max(slow.CycleCount, 1)):
+        reverse = params.ScanPattern == 1 and line % 2
+        phases.append(([(x, fast.StartPos if reverse else fast.StartPos + fast.RelativeDistance)], fast.DwellTime))
+        if line < slow.CycleCount - 1:
+            if params.ScanPattern != 1:
+                phases.append(([(x, fast.StartPos)], 0))
+            phases.append(([(y, slow.StartPos + (line + 1) * slow.RelativeDistance)], slow.DwellTime))
+    scan = device.raster = object()
+
+    def run(index):
+        if device.raster is not scan:
+            return
+        last = index == len(phases) - 1
+        moves, dwell = phases[index]
+        duration = max(target.start_move(position, target.velocity, messages.Moved if last else None).duration
+                       for target, position in moves)
+        if not last:
+            _schedule(duration + dwell / 1e3 / time_scale, lambda: run(index + 1))
+
+    run(0)
+
+
+@_entry("SetMoveAbsolutePosition")
+def _set_move_absolute_position(channel, position=0, *args):
+    channel.move_absolute_position = int(_value(position))
+
+
+@_entry("GetMoveAbsolutePosition")
+def _get_move_absolute_position(channel, *args):
+    return channel.move_absolute_position
+
+
+@_entry("SetMoveRelativeDistance")
+def _set_move_relative_distance(channel, distance=0, *args):
+    channel.move_relative_distance = int(_value(distance))
+
+
+@_entry("GetMoveRelativeDistance")
+def _get_move_relative_distance(channel, *args):
+    return channel.move_relative_distance
+
+
+@_entry("SetVelParams")
+def _set_vel_params(channel, acceleration=0, velocity=0, *args):
+    channel.acceleration = int(_value(acceleration))
+    channel.velocity = int(_value(velocity))
+
+
+@_entry("GetVelParams")
+def _get_vel_params(channel, acceleration=None, velocity=None, *args):
+    _store(acceleration, channel.acceleration)
+    _store(velocity, channel.velocity)
+
+
+@_entry("SetVelParamsBlock")
+def _set_vel_params_block(channel, parameters=None, *args):
+    parameters = _target(parameters)
+    if isinstance(parameters, Structure):
+        channel.acceleration = parameters.acceleration
+        channel.velocity = parameters.maxVelocity
+
+
+@_entry("GetVelParamsBlock")
+def _get_vel_params_block(channel, parameters=None, *args):
+    parameters = _target(parameters)
+    if isinstance(parameters, Structure):
+        parameters.minVelocity = 0
+        parameters.acceleration = channel.acceleration
+        parameters.maxVelocity = channel.velocity
+
+
+@_entry("SetJogStepSize")
+def _set_jog_step_size(channel, step=0, *args):
+    channel.jog_step = int(_value(step))
+
+
+@_entry("GetJogStepSize")
+def _get_jog_step_size(channel, *args):
+    return channel.jog_step
+
+
+@_entry("SetHomingVelocity")
+def _set_homing_velocity(channel, velocity=0, *args):
+    channel.homing_velocity = int(_value(velocity))
+
+
+@_entry("GetHomingVelocity")
+def _get_homing_velocity(channel, *args):
+    return channel.homing_velocity
+
+
+@_entry("SetBacklash")
+def _set_backlash(channel, distance=0, *args):
+    channel.backlash = int(_value(distance))
+
+
+@_entry("GetBacklash")
+def _get_backlash(channel, *args):
+    return channel.backlash
+
+
+@_entry("SetStageAxisLimits")
+def _set_stage_axis_limits(channel, minimum=0, maximum=0, *args):
+    channel.minimum = int(_value(minimum))
+    channel.maximum = int(_value(maximum))
+
+
+@_entry("GetStageAxisMinPos")
+def _get_stage_axis_min_pos(channel, *args):
+    return channel.minimum
+
+
+@_entry("GetStageAxisMaxPos")
+def _get_stage_axis_max_pos(channel, *args):
+    return channel.maximum
+
+
+@_entry("GetMotorTravelLimits")
+def _get_motor_travel_limits(channel, minimum=None, maximum=None, *args):
+    _store(minimum, channel.minimum / channel.counts)
+    _store(maximum, channel.maximum / channel.counts)
+
+
+def _unit_scale(channel, unit_type):
+    return (channel.counts, channel.velocity_scale, channel.acceleration_scale)[int(_value(unit_type))]
+
+
+@_entry("GetRealValueFromDeviceUnit")
+def _get_real_value_from_device_unit(channel, device_unit=0, real_unit=None, unit_type=0, *args):
+    _store(real_unit, _value(device_unit) / _unit_scale(channel, unit_type))
+
+
+@_entry("GetDeviceUnitFromRealValue")
+def _get_device_unit_from_real_value(channel, real_unit=0, device_unit=None, unit_type=0, *args):
+    _store(device_unit, int(round(_value(real_unit) * _unit_scale(channel, unit_type))))
+
+
+@_entry("GetMotorParamsExt")
+def _get_motor_params_ext(channel, steps_per_rev=None, gear_box_ratio=None, pitch=None, *args):
+    _store(steps_per_rev, channel.counts)
+    _store(gear_box_ratio, 1.0)
+    _store(pitch, 1.0)
+
+
+@_entry("SetMotorParamsExt")
+def _set_motor_params_ext(channel, steps_per_rev=0, gear_box_ratio=1, pitch=1, *args):
+    counts = _value(steps_per_rev) * _value(gear_box_ratio) / _value(pitch)
+    if counts > 0:
+        ratio = counts / channel.counts
+        channel.counts = counts
+        channel.velocity_scale *= ratio
+        channel.acceleration_scale *= ratio
+
+
+@_entry("GetNumChannels")
+def _get_num_channels(channel, *args):
+    return len(channel.device.channels)
+
+
+def _generic(action, key):
+    # Remember what Set was given and hand it back from Get.
+    if action == "Set":
+        def handler(channel, *args):
+            channel.settings[key] = [_value(arg) for arg in args]
+    elif action == "Get":
+        def handler(channel, *args):
+            stored = channel.settings.get(key)
+            # Without output arguments the value is returned.
+            if all(_target(arg) is arg for arg in args):
+                return stored[0] if stored else 0
+            if stored:
+                for arg, value in zip(args, stored):
+                    _store(arg, value)
+    elif action == "Can":
+        handler = _true
+    elif action in ("Is", "Has"):
+        handler = _false
+    else:
+        def handler(channel, *args):
+            return None
+    return handler
+
+
+################################################################
+# Device manager entry points.
+
+def _device_list(type_ids=None):
+    return ",".join(
+        serial_number for serial_number, device in sorted(devices.items())
+        if type_ids is None or device.type_id in type_ids) + ","
+
+
+def _tli_build_device_list(*args):
+    return 0
+
+
+def _tli_get_device_list_size(*args):
+    return len(devices)
+
+
+def _tli_get_device_list_ext(buffer=None, size=0, *args):
+    _write_text(buffer, size, _device_list())
+
+
+def _tli_get_device_list_by_type_ext(buffer=None, size=0, type_id=0, *args):
+    _write_text(buffer, size, _device_list((int(_value(type_id)),)))
+
+
+def _tli_get_device_list_by_types_ext(buffer=None, size=0, type_ids=None, length=0, *args):
+    type_ids = _target(type_ids)
+    if isinstance(type_ids, (Array, _Pointer)):
+        type_ids = [type_ids[index] for index in range(int(_value(length)))]
+    else:
+        type_ids = [_value(type_ids)]
+    _write_text(buffer, size, _device_list(type_ids))
+
+
+def _tli_get_device_info(*args):
+    serial_number = next((text for text in map(_text, args) if text), None)
+    device = devices.get(serial_number)
+    if device is None:
+        return FT_DeviceNotFound
+    info = _target(args[-1])
+    if isinstance(info, Structure):
+        info.typeID = device.type_id
+        info.description = device.description.encode()
+        info.serialNo = device.serial_number.encode()[:8]
+        info.isKnownType = True
+        info.maxChannels = len(device.channels)
+
+
+def _tli_not_implemented(*args):
+    return TL_NOT_IMPLEMENTED
+
+
+_device_manager = {
+    "BuildDeviceList": _tli_build_device_list,
+    "GetDeviceListSize": _tli_get_device_list_size,
+    "GetDeviceListExt": _tli_get_device_list_ext,
+    "GetDeviceListByTypeExt": _tli_get_device_list_by_type_ext,
+    "GetDeviceListByTypesExt": _tli_get_device_list_by_types_ext,
+    "GetDeviceInfo": _tli_get_device_info,
+    "GetDeviceList": _tli_not_implemented,
+    "GetDeviceListByType": _tli_not_implemented,
+    "GetDeviceListByTypes": _tli_not_implemented}
+
+
+################################################################
+
+class SimulatedFunction(object):
+    """A simulated entry point, callable like a ctypes foreign function."""
+
+    def __init__(self, name):
+        self.__name__ = name
+        self.restype = c_int
+        self.argtypes = None
+        self.errcheck = None
+        prefix, _, suffix = name.partition("_")
+        self._device_manager = prefix == "TLI"
+        if self._device_manager:
+            self._handler = _device_manager.get(suffix, _tli_build_device_list)
+        else:
+            action = next((action for action in ("Get", "Set", "Request", "Can", "Is", "Has")
+                           if suffix.startswith(action)), None)
+            self._handler = _handlers.get(suffix) or _generic(action, suffix[len(action or ""):])
+        self._channel_type = _CHANNEL_TYPES.get(prefix)
+        # Whether the function takes a channel, if it was bound from a table;
+        # otherwise a second argument of the channel type is taken for one.
+        self._takes_channel = name in binding.channel_functions if name in binding.conventions else None
+
+    def _result(self, result):
+        if self.restype is c_bool:
+            return True if result is None else bool(result)
+        return 0 if result is None else result
+
+    def _failure(self, code):
+        return False if self.restype is c_bool else code
+
+    def __call__(self, *args):
+        if self._device_manager:
+            return self._result(self._handler(*args))
+        device = devices.get(_text(args[0])) if args else None
+        if device is None:
+            return self._failure(FT_DeviceNotFound)
+        args = args[1:]
+        number = 1
+        argtypes = self.argtypes
+        takes_channel = self._takes_channel
+        if takes_channel is None:
+            takes_channel = argtypes and len(argtypes) > 1 and argtypes[1] is self._channel_type
+        if args and takes_channel:
+            number = int(_value(args[0]))
+            args = args[1:]
+        channel = device.channels.get(number)
+        if channel is None:
+            return self._failure(TL_INVALID_CHANNEL)
+        return self._result(self._handler(channel, *args))
+
+    def __repr__(self):
+        return "<SimulatedFunction %s>" % self.__name__
+
+
+class SimulatedLibrary(object):
+    """Simulated stand-in for one Kinesis dll."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        function = SimulatedFunction(name)
+        setattr(self, name, function)
+        return function
+
+    def __repr__(self):
+        return "<SimulatedLibrary %s>" % self._name
@@ -0,0 +1,255 @@
+"""Decoding the status words returned by get_status_bits.
+
+The meaning of the status bits depends on the device family.  A StatusDecoder
+holds the masks of one family, for its single bits and for the flags combining
+several of them (moving, limit, fault, ...), and decodes a status word into a
+Status, whose attributes are the flags:
+
+    decoder = status.decoder(stage)         # or status.MOTOR
+    flags = decoder.decode(stage.get_status_bits())
+    if flags.moving or flags.fault:
+        ...
+
+Every flag of a Status is tested once, when it is created, and the decoder
+keeps the Status of every word it has decoded: decoding a word seen before is
+one dict lookup, and reading a flag reads a slot.  Treat them as immutable.
+
+decode_array tests every flag on an array of words at once, e.g. a column of
+a tlk.telemetry.RingBuffer, and returns a boolean array per flag.
+
+The inertial motor, filter flipper, polarizer and PDXC2 controllers report
+their status with the motor bits, the strain gauge readers with the piezo
+bits.  The laser, position aligner, solenoid and TEC controllers have layouts
+of their own, listed in UNDECODED, which are not decoded.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Status bits of the motor controllers, as (flag, mask).
+MOTOR_BITS = (
+    ("cw_hardware_limit", 0x00000001),
+    ("ccw_hardware_limit", 0x00000002),
+    ("cw_software_limit", 0x00000004),
+    ("ccw_software_limit", 0x00000008),
+    ("moving_forward", 0x00000010),
+    ("moving_reverse", 0x00000020),
+    ("jogging_forward", 0x00000040),
+    ("jogging_reverse", 0x00000080),
+    ("connected", 0x00000100),
+    ("homing", 0x00000200),
+    ("homed", 0x00000400),
+    ("initializing", 0x00000800),
+    ("tracking", 0x00001000),
+    ("settled", 0x00002000),
+    ("position_error", 0x00004000),
+    ("instrument_error", 0x00008000),
+    ("interlock", 0x00010000),
+    ("overtemperature", 0x00020000),
+    ("bus_voltage_fault", 0x00040000),
+    ("commutation_error", 0x00080000),
+    ("digital_input_1", 0x00100000),
+    ("digital_input_2", 0x00200000),
+    ("digital_input_3", 0x00400000),
+    ("digital_input_4", 0x00800000),
+    ("overload", 0x01000000),
+    ("encoder_fault", 0x02000000),
+    ("overcurrent", 0x04000000),
+    ("bus_current_fault", 0x08000000),
+    ("power_ok", 0x10000000),
+    ("active", 0x20000000),
+    ("error", 0x40000000),
+    ("enabled", 0x80000000))
+
+# Flags set if any of the bits are, as (flag, bit flags).
+MOTOR_ANY = (
+    ("moving", ("moving_forward", "moving_reverse", "jogging_forward", "jogging_reverse")),
+    ("jogging", ("jogging_forward", "jogging_reverse")),
+    ("hardware_limit", ("cw_hardware_limit", "ccw_hardware_limit")),
+    ("software_limit", ("cw_software_limit", "ccw_software_limit")),
+    ("limit", ("cw_hardware_limit", "ccw_hardware_limit", "cw_software_limit", "ccw_software_limit")),
+    ("fault", ("position_error", "instrument_error", "overtemperature", "bus_voltage_fault", "commutation_error",
+               "overload", "encoder_fault", "overcurrent", "bus_current_fault", "error")))
+
+# Status bits of the piezo controllers.
+PIEZO_BITS = (
+    ("connected", 0x00000001),
+    ("zeroed", 0x00000010),
+    ("zeroing", 0x00000020),
+    ("strain_gauge_connected", 0x00000100),
+    ("closed_loop", 0x00000400),
+    ("digital_input_1", 0x00100000),
+    ("digital_input_2", 0x00200000),
+    ("digital_input_3", 0x00400000),
+    ("digital_input_4", 0x00800000),
+    ("active", 0x20000000),
+    ("enabled", 0x80000000))
+
+PIEZO_ANY = ()
+
+# Status bits of the NanoTrak controllers.
+NANOTRAK_BITS = (
+    ("tracking", 0x00000001),
+    ("tracking_with_signal", 0x00000002),
+    ("tracking_channel_a", 0x00000004),
+    ("tracking_channel_b", 0x00000008),
+    ("auto_ranging", 0x00000010),
+    ("under_read", 0x00000020),
+    ("over_read", 0x00000040),
+    ("channel_a_connected", 0x00010000),
+    ("channel_b_connected", 0x00020000),
+    ("channel_a_enabled", 0x00040000),
+    ("channel_b_enabled", 0x00080000),
+    ("channel_a_closed_loop", 0x00100000),
+    ("channel_b_closed_loop", 0x00200000))
+
+NANOTRAK_ANY = (
+    ("out_of_range", ("under_read", "over_read")),)
+
+
+class Status(object):
+    """A decoded status word; subclassed for every family with a slot per flag."""
+
+    __slots__ = ("bits",)
+
+    # (flag, mask) of the family.
+    masks = ()
+
+    def __init__(self, bits):
+        self.bits = bits
+        for flag, mask in self.masks:
+            setattr(self, flag, bits & mask != 0)
+
+    @property
+    def names(self):
+        """The names of the family's flags."""
+        return [flag for flag, _ in self.masks]
+
+    def flags(self):
+        """The names of the flags that are set."""
+        return [name for name in self.names if getattr(self, name)]
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.bits == self.bits
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    def __int__(self):
+        return self.bits
+
+    def __repr__(self):
+        return "<%s 0x%08x %s>" % (type(self).__name__, self.bits, " ".join(self.flags()))
+
+
+class StatusDecoder(object):
+    """The masks of a device family's status bits, and a cache of decoded words.
+
+    bits is a table like MOTOR_BITS, combined one like MOTOR_ANY.
+    """
+
+    # Decoded words kept; a device shows a handful, so this is never reached
+    # unless words are not status bits.
+    cache_size = 4096
+
+    def __init__(self, name, bits, combined=()):
+        self.name = name
+        self.masks = dict(bits)
+        for flag, names in combined:
+            mask = 0
+            for bit in names:
+                mask |= self.masks[bit]
+            self.masks[flag] = mask
+        self.Status = type("%sStatus" % name.title(), (Status,), {
+            "__slots__": tuple(self.masks), "masks": tuple(self.masks.items())})
+        self._cache = {}
+
+    def decode(self, bits):
+        """The Status of a status word."""
+        try:
+            return self._cache[bits]
+        except KeyError:
+            pass
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        status = self._cache[bits] = self.Status(int(bits))
+        return status
+
+    __call__ = decode
+
+    def test(self, bits, flag):
+        """Whether flag is set in bits, a status word or an array of them."""
+        mask = self.masks[flag]
+        if numpy is not None and isinstance(bits, numpy.ndarray):
+            return _words(bits) & mask != 0
+        return bits & mask != 0
+
+    def decode_array(self, bits, flags=None):
+        """{flag: boolean array} for an array of status words, for flags (default all).
+
+        Without numpy, bits is a sequence and the values are lists.
+        """
+        if numpy is None:
+            words = [int(word) for word in bits]
+            return dict((flag, [word & self.masks[flag] != 0 for word in words]) for flag in flags or self.masks)
+        words = _words(numpy.asarray(bits))
+        return dict((flag, words & self.masks[flag] != 0) for flag in flags or self.masks)
+
+    def __repr__(self):
+        return "<StatusDecoder %s, %d flags>" % (self.name, len(self.masks))
+
+
+def _words(bits):
+    # Status words as unsigned integers.  Signed words (c_long) and floats
+    # (e.g. from a RingBuffer) are converted, which is exact for 32 bit words.
+    if bits.dtype.kind == "u":
+        return bits
+    return bits.astype(numpy.uint32)
+
+
+MOTOR = StatusDecoder("motor", MOTOR_BITS, MOTOR_ANY)
+PIEZO = StatusDecoder("piezo", PIEZO_BITS, PIEZO_ANY)
+NANOTRAK = StatusDecoder("nanotrak", NANOTRAK_BITS, NANOTRAK_ANY)
+
+# The decoder of each device prefix.
+DECODERS = {
+    "BDC": MOTOR,
+    "BMC": MOTOR,
+    "BVC": MOTOR,
+    "CC": MOTOR,
+    "FF": MOTOR,
+    "ISC": MOTOR,
+    "KIM": MOTOR,
+    "KVS": MOTOR,
+    "MPC": MOTOR,
+    "PDXC2": MOTOR,
+    "SBC": MOTOR,
+    "SCC": MOTOR,
+    "TIM": MOTOR,
+    "IPP": PIEZO,
+    "KPC": PIEZO,
+    "PBC": PIEZO,
+    "PCC": PIEZO,
+    "PPC2": PIEZO,
+    "SG": PIEZO,
+    "NT": NANOTRAK}
+
+# Prefixes whose status bits have layouts of their own, not decoded here:
+# laser diode and laser source, position aligner, solenoid and TEC controllers.
+UNDECODED = ("LD", "LS", "QD", "SC", "TC")
+
+
+def decoder(device):
+    """The StatusDecoder of a device or channel object, device class or prefix."""
+    prefix = device if isinstance(device, str) else getattr(device, "prefix", None)
+    if prefix is None:
+        prefix = device.device.prefix
+    try:
+        return DECODERS[prefix]
+    except KeyError:
+        if prefix in UNDECODED:
+            raise ValueError("the status bits of %s devices are not decoded; test them against their own masks"
+                             % prefix)
+        raise ValueError("no status decoder for %s devices" % prefix)
@@ -0,0 +1,296 @@
+"""Sampling device readings at a fixed rate into preallocated ring buffers.
+
+A Sampler thread calls a set of getters, typically get_position and
+get_status_bits of many devices, at a fixed rate and stores what they return,
+with the time of each sample, in a RingBuffer.  No Python object is kept per
+sample: the buffer's columns are float64 arrays (numpy arrays when numpy is
+installed, array.array otherwise) sized when it is created, and the getters
+use their own CallContext buffers.
+
+    sampler = Sampler(rate=200.0, capacity=200 * 60)
+    for stage in stages:
+        stage.start_polling(5)
+        sampler.add_device(stage)
+    sampler.start()
+    ...
+    times, columns = sampler.buffer.window(200)  # the last second
+    position = columns["27000001:get_position"]
+
+Each column is stored twice, once after the other, so that any run of up to
+capacity consecutive samples is one contiguous slice: windows are views of the
+buffer (numpy arrays or memoryviews), not copies.  They are overwritten as the
+sampler goes on, after capacity more samples; copy what is kept for longer.
+Values are read with the dll's polling (start_polling) refreshing them; a
+getter that raises stores NaN and counts an error.
+
+get_reading of the NanoTrak and position aligner families fills a structure,
+which is sampled with one call per sample into a column per numeric field,
+named e.g. serial:get_reading.absoluteReading; the strain gauge's
+get_reading is sampled unsmoothed.
+"""
+import array
+import bisect
+import operator
+import threading
+import time
+from ctypes import Structure, _Pointer
+
+from .callcontext import CallContext
+from .library import keeps_functions
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NAN = float("nan")
+
+
+# The getters add_device samples, of those a device has.
+SAMPLED = (
+    "get_position",
+    "get_status_bits",
+    "get_output_voltage",
+    "get_voltage_reading",
+    "get_current_reading",
+    "get_temperature_reading",
+    "get_reading")
+
+
+def _column(length):
+    if numpy is not None:
+        return numpy.zeros(length)
+    return array.array("d", bytes(8 * length))
+
+
+def _view(column, start, stop):
+    if numpy is not None:
+        return column[start:stop]
+    return memoryview(column)[start:stop]
+
+
+def _suffix(name):
+    return "".join(part.title() for part in name.split("_"))
+
+
+def _fields(structure, prefix=""):
+    # Dotted paths of the fields of a structure, of nested structures too.
+    paths = []
+    for name, field_type in structure._fields_:
+        if isinstance(field_type, type) and issubclass(field_type, Structure):
+            paths.extend(_fields(field_type, prefix + name + "."))
+        else:
+            paths.append(prefix + name)
+    return paths
+
+
+def _getters(context, suffix):
+    # (column suffix, getter) of a function of the context: a column per
+    # field of a structure it fills, read with one call.
+    argtypes = context.function(suffix).argtypes or ()
+    extra = argtypes[len(context.args):]
+    # Inputs, as smoothed of get_reading of the strain gauges, are passed as 0.
+    inputs = tuple(argtype() for argtype in extra if not issubclass(argtype, _Pointer))
+    extra = extra[len(inputs):]
+    get = context.getter(suffix, *inputs)
+    output = getattr(extra[0], "_type_", None) if len(extra) == 1 else None
+    if not (isinstance(output, type) and issubclass(output, Structure)):
+        return [("", get)]
+    paths = _fields(output)
+    fields = [operator.attrgetter(path) for path in paths]
+    reading = [None]
+
+    def first():
+        reading[0] = None
+        reading[0] = get()
+        return fields[0](reading[0])
+
+    def other(field):
+        def getter():
+            if reading[0] is None:
+                raise ValueError("the reading failed")
+            return field(reading[0])
+        return getter
+
+    getters = [first] + [other(field) for field in fields[1:]]
+    return [("." + path, getter) for path, getter in zip(paths, getters)]
+
+
+class RingBuffer(object):
+    """capacity timestamped samples of the named float64 columns."""
+
+    def __init__(self, names, capacity):
+        self.names = tuple(names)
+        self.capacity = capacity
+        self.times = _column(2 * capacity)
+        self.columns = [_column(2 * capacity) for _ in self.names]
+        # Samples appended so far; the newest is at (count - 1) % capacity.
+        self.count = 0
+
+    def append(self, timestamp, values):
+        """Store one sample, values in the order of names."""
+        index = self.count % self.capacity
+        mirror = index + self.capacity
+        self.times[index] = self.times[mirror] = timestamp
+        for column, value in zip(self.columns, values):
+            column[index] = column[mirror] = value
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def latest(self):
+        """(time, values) of the newest sample, or None if there is none."""
+        if not self.count:
+            return None
+        index = (self.count - 1) % self.capacity
+        return self.times[index], tuple(column[index] for column in self.columns)
+
+    def window(self, samples=None):
+        """(times, {name: values}) of the newest samples, as views of the buffer.
+
+        samples defaults to, and is limited to, all the samples held.
+        """
+        count = self.count
+        held = min(count, self.capacity)
+        samples = held if samples is None else min(samples, held)
+        start = (count - samples) % self.capacity
+        stop = start + samples
+        return (_view(self.times, start, stop),
+                dict((name, _view(column, start, stop)) for name, column in zip(self.names, self.columns)))
+
+    def since(self, timestamp):
+        """The window of the samples taken at or after timestamp."""
+        times, _ = self.window()
+        return self.window(len(times) - bisect.bisect_left(times, timestamp))
+
+    def __repr__(self):
+        return "<RingBuffer %d columns, %d/%d samples>" % (len(self.names), len(self), self.capacity)
+
+
+class Sampler(object):
+    """A thread calling getters rate times a second into a RingBuffer.
+
+    Timestamps are time.monotonic() seconds.  Add every column before start;
+    the buffer is created then.
+    """
+
+    def __init__(self, rate=100.0, capacity=65536, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.names = []
+        self.getters = []
+        # The (context, suffix, index among the getters _getters makes) of
+        # each getter of add_device, None for those given to add.
+        self._sources = []
+        self.buffer = None
+        self.errors = 0
+        # Sampling times missed because a round took longer than the period.
+        self.overruns = 0
+        self._thread = None
+        self._stopping = threading.Event()
+        keeps_functions(self)
+
+    def add(self, name, getter):
+        """Sample getter, a function of no arguments returning a number, as column name."""
+        if self._thread is not None:
+            raise RuntimeError("columns cannot be added while the sampler runs")
+        self.names.append(name)
+        self.getters.append(getter)
+        self._sources.append(None)
+
+    def add_device(self, device, names=None):
+        """Sample the getters of a device or channel object, by default those in SAMPLED.
+
+        The columns are named serial:getter, or serial/channel:getter.
+        """
+        context = device.context
+        if context.channel is None:
+            label = context.serial_number.value.decode()
+            context = CallContext(context.lib, context.prefix, context.serial_number)
+        else:
+            label = "%s/%d" % (context.serial_number.value.decode(), context.channel.value)
+            context = CallContext(
+                context.lib, context.prefix, context.serial_number, context.channel.value, type(context.channel))
+        for name in names or [name for name in SAMPLED if hasattr(device, name)]:
+            for index, (field, getter) in enumerate(_getters(context, _suffix(name))):
+                self.add("%s:%s%s" % (label, name, field), getter)
+                self._sources[-1] = (context, _suffix(name), index)
+
+    def rebind(self):
+        """Make the getters of add_device again, with the current functions."""
+        made = {}
+        for column, source in enumerate(self._sources):
+            if source is not None:
+                context, suffix, index = source
+                key = (id(context), suffix)
+                if key not in made:
+                    made[key] = _getters(context, suffix)
+                self.getters[column] = made[key][index][1]
+
+    def start(self):
+        """Create the buffer, if it was not, and start sampling."""
+        if self._thread is not None:
+            return
+        if self.buffer is None or self.buffer.names != tuple(self.names):
+            self.buffer = RingBuffer(self.names, self.capacity)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="tlk sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling; the buffer is kept."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+    @property
+    def running(self):
+        """Whether the sampler thread runs."""
+        return self._thread is not None
+
+    def sample(self):
+        """Call every getter once and append the sample."""
+        # RingBuffer.append, writing each value as it is read.
+        buffer = self.buffer
+        index = buffer.count % buffer.capacity
+        mirror = index + buffer.capacity
+        buffer.times[index] = buffer.times[mirror] = self.clock()
+        for column, getter in zip(buffer.columns, self.getters):
+            try:
+                column[index] = column[mirror] = getter()
+            except Exception:
+                self.errors += 1
+                column[index] = column[mirror] = NAN
+        buffer.count += 1
+
+    def _run(self):
+        period = 1.0 / self.rate
+        clock = self.clock
+        wait = self._stopping.wait
+        due = clock()
+        while True:
+            self.sample()
+            due += period
+            delay = due - clock()
+            if delay < 0:
+                missed = int(-delay / period) + 1
+                self.overruns += missed
+                due += missed * period
+                delay += missed * period
+            if wait(delay):
+                return
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __repr__(self):
+        return "<Sampler %d columns at %g Hz, %s>" % (
+            len(self.names), self.rate, "running" if self.running else "stopped")
@@ -0,0 +1,136 @@
+"""Multi-axis trajectories run by the controller as multi-channel move arrays.
+
+Benchtop brushless controllers can run an array of time-stamped positions of
+several channels in firmware, keeping the channels synchronized without the
+host timing every point.  A MoveArray is such a trajectory compiled for one
+controller: times in seconds and positions in real units are converted to
+device units in bulk, once, into one contiguous buffer of points, each a time
+in milliseconds followed by the position of every channel as int32, which is
+uploaded with SetMultiChannelMoveArraySection in as few sections as fit in
+section_bytes, and run with StartMultiChannelMoveArray:
+
+    stage = BenchtopBrushlessMotor("73000001")
+    times = numpy.linspace(0.0, 2.0, 401)
+    positions = numpy.column_stack((5 + numpy.cos(times * numpy.pi), 5 + numpy.sin(times * numpy.pi)))
+    trajectory = MoveArray(stage, times, positions, channels=(1, 2))
+    trajectory.upload()
+    trajectory.start()
+
+positions has one row per time and one column per channel; a sequence of
+rows works as well when numpy is not installed.  The time of a point is the
+time the channels reach it, counted from the start of the array.
+"""
+from ctypes import addressof, c_int32, sizeof
+
+from .units import DISTANCE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The most bytes of points sent with one SetMultiChannelMoveArraySection call.
+SECTION_BYTES = 4096
+
+
+def channels_mask(channels):
+    """The bit mask of channel numbers, counting from 1."""
+    mask = 0
+    for channel in channels:
+        mask |= 1 << (channel - 1)
+    return mask
+
+
+class MoveArray(object):
+    """A trajectory of a multi-channel controller, in device units, as the controller takes it."""
+
+    def __init__(self, device, times, positions, channels=(1, 2), array_id=0, repeat_count=1, deceleration=0):
+        self.device = device
+        self.channels = tuple(sorted(channels))
+        if list(self.channels) != list(channels) or len(set(channels)) != len(channels):
+            raise ValueError("channels must be given in increasing order, each once")
+        self.array_id = array_id
+        self.repeat_count = repeat_count
+        self.deceleration = deceleration
+        self.mask = channels_mask(self.channels)
+        self.width = 1 + len(self.channels)
+        self.point_size = self.width * sizeof(c_int32)
+        if numpy is not None:
+            self.data = self._compile_array(times, positions)
+            self.buffer = (c_int32 * self.data.size).from_buffer(self.data)
+        else:
+            self.buffer = self._compile_rows(times, positions)
+        self.points = len(self.buffer) // self.width
+
+    def _compile_array(self, times, positions):
+        # One int32 array of points, converting each channel's column at once.
+        times = numpy.asarray(times, dtype=float)
+        positions = numpy.asarray(positions, dtype=float).reshape(len(times), -1)
+        if positions.shape[1] != len(self.channels):
+            raise ValueError("positions has %d columns for %d channels" % (positions.shape[1], len(self.channels)))
+        milliseconds = numpy.rint(times * 1e3)
+        if len(milliseconds) and (milliseconds[0] < 0 or numpy.any(numpy.diff(milliseconds) <= 0)):
+            raise ValueError("times must increase by at least 1 ms from a time >= 0")
+        data = numpy.empty((len(times), self.width), numpy.int32)
+        data[:, 0] = milliseconds
+        units = self.device.module.units
+        for column, channel in enumerate(self.channels):
+            data[:, column + 1] = units.to_device_units(
+                self.device.serial_number, positions[:, column], DISTANCE, channel)
+        return data.reshape(-1)
+
+    def _compile_rows(self, times, positions):
+        # The same without numpy.
+        units = self.device.module.units
+        scales = [units.scales(self.device.serial_number, channel)[DISTANCE] for channel in self.channels]
+        flat = []
+        previous = -1
+        for time, row in zip(times, positions):
+            row = [row] if isinstance(row, (int, float)) else list(row)
+            if len(row) != len(self.channels):
+                raise ValueError("positions has %d columns for %d channels" % (len(row), len(self.channels)))
+            milliseconds = int(round(time * 1e3))
+            if milliseconds <= previous:
+                raise ValueError("times must increase by at least 1 ms from a time >= 0")
+            previous = milliseconds
+            flat.append(milliseconds)
+            flat.extend(int(round(value * scale)) for value, scale in zip(row, scales))
+        return (c_int32 * len(flat))(*flat)
+
+    def sections(self, section_bytes=SECTION_BYTES):
+        """(start index, number of points, address) of the sections the points are uploaded in."""
+        per_section = max(1, section_bytes // self.point_size)
+        address = addressof(self.buffer)
+        return [(start, min(per_section, self.points - start), address + start * self.point_size)
+                for start in range(0, self.points, per_section)]
+
+    def upload(self, section_bytes=SECTION_BYTES):
+        """Send the array's parameters and its points; returns the number of section calls."""
+        device = self.device
+        device.set_multi_channel_move_array_params(
+            self.array_id, 0, self.points - 1, self.repeat_count, self.points - 1, self.deceleration)
+        sections = self.sections(section_bytes)
+        set_section = device.set_multi_channel_move_array_section
+        for start, points, address in sections:
+            set_section(self.array_id, self.mask, points, start, address)
+        return len(sections)
+
+    def start(self):
+        """Start the uploaded array on all its channels."""
+        self.device.start_multi_channel_move_array(self.array_id, self.mask)
+
+    def stop(self):
+        """Stop the channels, decelerating with their velocity profiles."""
+        self.device.stop_profiled_synchronously(self.mask)
+
+    @property
+    def duration(self):
+        """The time of the last point, in seconds."""
+        return self.buffer[(self.points - 1) * self.width] / 1e3 if self.points else 0.0
+
+    def __len__(self):
+        return self.points
+
+    def __repr__(self):
+        return "<MoveArray %d of %r, %d points on channels %s>" % (
+            self.array_id, self.device, self.points, ",".join(map(str, self.channels)))
@@ -0,0 +1,107 @@
+"""Conversion between device units and real world units in bulk.
+
+get_device_unit_from_real_value and get_real_value_from_device_unit make one
+dll call per value.  A UnitConverter asks the dll for a channel's scaling once,
+keeps it, and converts scalars, sequences and NumPy arrays with plain
+arithmetic.  Every motor module has one, named units:
+
+    from tlk import kcubedcservo
+    from tlk.units import VELOCITY
+    counts = kcubedcservo.units.to_device_units("27000001", positions)
+    mm_per_s = kcubedcservo.units.to_real_units("27000001", velocities, VELOCITY)
+
+The scaling is looked up again after invalidate(), which the motor modules call
+whenever the motor parameters of a channel are changed.
+"""
+import numbers
+import threading
+from ctypes import Array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Unit types, as taken by the unitType argument of the dll conversions.
+DISTANCE = 0
+VELOCITY = 1
+ACCELERATION = 2
+
+UNIT_TYPES = (DISTANCE, VELOCITY, ACCELERATION)
+
+# Device units converted to find a scale.  Large enough that the dll's own
+# rounding does not affect the result.
+_CALIBRATION_UNITS = 1 << 20
+
+
+class UnitConverter(object):
+    """Cached device units per real unit of every channel of one device family.
+
+    real_value_from_device_unit is the module's get_real_value_from_device_unit,
+    called as (serial_number[, channel], device_unit, unit_type).  Its answer
+    for a large device unit gives the scale of each unit type, which holds for
+    every value because the conversions are linear.
+    """
+
+    def __init__(self, real_value_from_device_unit):
+        self._real_value_from_device_unit = real_value_from_device_unit
+        self._lock = threading.Lock()
+        self._scales = {}
+
+    def _key(self, serial_number, channel):
+        if isinstance(serial_number, Array):
+            serial_number = serial_number.value
+        if isinstance(serial_number, bytes):
+            serial_number = serial_number.decode()
+        return (str(serial_number), channel)
+
+    def scales(self, serial_number, channel=None):
+        """Device units per real unit of a channel, indexed by unit type."""
+        key = self._key(serial_number, channel)
+        scales = self._scales.get(key)
+        if scales is None:
+            channel_args = () if channel is None else (channel,)
+            scales = tuple(
+                _CALIBRATION_UNITS / self._real_value_from_device_unit(
+                    serial_number, *(channel_args + (_CALIBRATION_UNITS, unit_type)))
+                for unit_type in UNIT_TYPES)
+            with self._lock:
+                self._scales[key] = scales
+        return scales
+
+    def invalidate(self, serial_number=None, channel=None):
+        """Forget the scaling of one channel, of every channel of one device
+        (channel None), or of every device (serial_number None)."""
+        with self._lock:
+            if serial_number is None:
+                self._scales.clear()
+                return
+            serial_number, channel_key = self._key(serial_number, channel)
+            for key in list(self._scales):
+                if key[0] == serial_number and (channel is None or key[1] == channel_key):
+                    del self._scales[key]
+
+    def to_device_units(self, serial_number, values, unit_type=DISTANCE, channel=None):
+        """Convert real units to device units.
+
+        values may be a number (NumPy scalars included), a sequence or a NumPy
+        array; the result is an int, a list of ints or an int64 array.
+        """
+        scale = self.scales(serial_number, channel)[unit_type]
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return numpy.rint(values * scale).astype(numpy.int64)
+        if isinstance(values, numbers.Real):
+            return int(round(values * scale))
+        return [int(round(value * scale)) for value in values]
+
+    def to_real_units(self, serial_number, values, unit_type=DISTANCE, channel=None):
+        """Convert device units to real units.
+
+        values may be a number (NumPy scalars included), a sequence or a NumPy
+        array; the result is a float, a list of floats or a float64 array.
+        """
+        scale = self.scales(serial_number, channel)[unit_type]
+        if isinstance(values, numbers.Real) or numpy is not None and isinstance(values, numpy.ndarray):
+            return values / scale
+        return [value / scale for value in values]
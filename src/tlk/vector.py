@@ -0,0 +1,193 @@
+"""Vector moves of several channels of a benchtop brushless controller.
+
+VectorMoveToPosition moves channels together, along a straight line, to an
+array of MOT_ChannelPosition targets, and the controller calls the callback
+registered with RegisterSynchronizedMoveCompleteCallback when they arrive.
+VectorMoves queues such moves for a set of channels: targets are given in
+real units, one move or an array of them, converted to device units in bulk
+and written into one contiguous MOT_ChannelPosition array; a thread issues
+the moves one after the other, each as soon as the previous one is complete,
+and completes a concurrent.futures.Future for every move:
+
+    stage = BenchtopBrushlessMotor("73000001")
+    stage.open_device()
+    xy = VectorMoves(stage, channels=(1, 2))
+    xy.move_to((5.0, 3.0)).result(timeout=10.0)
+    futures = xy.queue(numpy.column_stack((x, y)))    # one move per row
+    futures[-1].result()
+    xy.close()
+
+The futures complete with None.  A move that does not complete within
+timeout seconds fails its future, and the ones queued after it, with
+concurrent.futures.TimeoutError.  A controller has one synchronized move
+callback, so there is one VectorMoves per controller at a time.
+"""
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future, TimeoutError
+from ctypes import sizeof
+
+from .definitions.structures import MOT_ChannelPosition
+from .messagebridge import MESSAGE_CALLBACK
+from .records import dtype
+from .trajectory import channels_mask
+from .units import ACCELERATION, DISTANCE, VELOCITY
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class VectorMoves(object):
+    """Queued vector moves of channels of one controller, in real units.
+
+    velocity and acceleration are those of the vector, in the real units of
+    the first channel; by default the velocity parameters of the first
+    channel are used.
+    """
+
+    def __init__(self, device, channels=(1, 2), velocity=None, acceleration=None, timeout=60.0):
+        self.device = device
+        self.channels = tuple(channels)
+        self.timeout = timeout
+        first = self.channels[0]
+        default_acceleration, default_velocity = device.channel(first).get_vel_params()
+        units = device.module.units
+        self.velocity = default_velocity if velocity is None else units.to_device_units(
+            device.serial_number, velocity, VELOCITY, first)
+        self.acceleration = default_acceleration if acceleration is None else units.to_device_units(
+            device.serial_number, acceleration, ACCELERATION, first)
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._complete = threading.Event()
+        self._stopped = False
+        self._callback = MESSAGE_CALLBACK(self._complete.set)
+        device.register_synchronized_move_complete_callback(self._callback)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="tlk-vector-%s" % device.serial, daemon=True)
+        self._thread.start()
+
+    def targets(self, positions):
+        """The MOT_ChannelPosition array of rows of positions, one row per move, in one buffer."""
+        width = len(self.channels)
+        units = self.device.module.units
+        serial_number = self.device.serial_number
+        if numpy is not None:
+            positions = numpy.asarray(positions, dtype=float).reshape(-1, width)
+            targets = (MOT_ChannelPosition * positions.size)()
+            records = numpy.frombuffer(targets, dtype(MOT_ChannelPosition)).reshape(-1, width)
+            records["channelNumber"] = self.channels
+            for column, channel in enumerate(self.channels):
+                records["position"][:, column] = units.to_device_units(
+                    serial_number, positions[:, column], DISTANCE, channel)
+            return targets
+        rows = [list(row) for row in positions]
+        targets = (MOT_ChannelPosition * (len(rows) * width))()
+        for index, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError("a move has %d positions for %d channels" % (len(row), width))
+            for column, channel in enumerate(self.channels):
+                target = targets[index * width + column]
+                target.channelNumber = channel
+                target.position = units.to_device_units(serial_number, row[column], DISTANCE, channel)
+        return targets
+
+    def queue(self, positions):
+        """Queue one move per row of positions; returns their futures."""
+        targets = self.targets(positions)
+        if not len(targets):
+            return []
+        width = len(self.channels)
+        moves = len(targets) // width
+        # Each move passes a view of its part of the one array.
+        size = width * sizeof(MOT_ChannelPosition)
+        views = [(MOT_ChannelPosition * width).from_buffer(targets, index * size) for index in range(moves)]
+        futures = [Future() for _ in range(moves)]
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("VectorMoves is closed")
+            self._queue.extend(zip(views, futures))
+            self._condition.notify()
+        return futures
+
+    def move_to(self, position):
+        """Queue a move to one position of every channel; returns its future."""
+        return self.queue([position])[0]
+
+    def pending(self):
+        """The number of moves queued and not yet started."""
+        return len(self._queue)
+
+    def _next(self):
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            return self._queue.popleft() if self._queue else (None, None)
+
+    def _run(self):
+        vector_move = self.device.vector_move_to_position
+        while True:
+            targets, future = self._next()
+            if future is None:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            self._complete.clear()
+            self._stopped = False
+            try:
+                vector_move(targets, len(targets), self.acceleration, self.velocity)
+            except BaseException as exception:
+                future.set_exception(exception)
+                continue
+            if self._complete.wait(self.timeout):
+                if self._stopped:
+                    future.set_exception(CancelledError("vector move stopped"))
+                else:
+                    future.set_result(None)
+            else:
+                future.set_exception(TimeoutError("vector move did not complete in %g s" % self.timeout))
+                self._fail_queued(TimeoutError("an earlier vector move did not complete"))
+
+    def _fail_queued(self, exception):
+        with self._condition:
+            queued = list(self._queue)
+            self._queue.clear()
+        for _, future in queued:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(exception)
+
+    def stop(self):
+        """Cancel the queued moves and stop the channels with their velocity profiles.
+
+        The future of the move under way fails with CancelledError.
+        """
+        with self._condition:
+            queued = list(self._queue)
+            self._queue.clear()
+        for _, future in queued:
+            future.cancel()
+        self.device.stop_profiled_synchronously(channels_mask(self.channels))
+        self._stopped = True
+        self._complete.set()
+
+    def close(self):
+        """Finish the queued moves, stop the thread and unregister the callback."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        if self._callback is not None:
+            # The dll must not keep a pointer to the callback once it is freed.
+            self.device.register_synchronized_move_complete_callback(None)
+            self._callback = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return "<VectorMoves of %r, channels %s, %d queued>" % (
+            self.device, ",".join(map(str, self.channels)), len(self._queue))
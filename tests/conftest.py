@@ -0,0 +1,16 @@
+import pytest
+
+from tlk import library
+
+library.set_backend("simulated")
+
+from tlk import simulator  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def simulated():
+    # A fresh set of simulated controllers, moving fast, for every test.
+    simulator.reset()
+    simulator.time_scale = 100.0
+    yield simulator
+    simulator.reset()
@@ -0,0 +1,42 @@
+import asyncio
+
+from tlk.aio import Motor
+from tlk.definitions.messages import GenericDevice, GenericMotor, Moved, SettingsInitialized, Stopped
+from tlk.kcubedcservo import KCubeDCServo
+from tlk.messagebridge import Message
+
+
+def test_move_leaves_other_messages(simulated):
+    simulated.add_device("27000001")
+    motor = Motor(KCubeDCServo("27000001"))
+    motor.open_device()
+    motor.bridge.start()
+    other = Message(GenericDevice, SettingsInitialized, 7)
+    motor.bridge.messages.append(other)
+
+    async def move():
+        return await motor.move_to(10000, timeout=10.0)
+
+    assert asyncio.run(move()).id == Moved
+    assert list(motor.bridge.messages).count(other) == 1
+    assert motor.get_position() == 10000
+
+
+def test_move_takes_one_ending_message(simulated, monkeypatch):
+    device = simulated.add_device("27000001")
+    motor = Motor(KCubeDCServo("27000001"))
+    motor.open_device()
+    motor.bridge.start()
+
+    def move_to_position(self, position):
+        # Both messages are read by the same drain.
+        device.channels[1].messages.extend([(GenericMotor, Moved, 0), (GenericMotor, Stopped, 0)])
+        motor.bridge.drain()
+
+    monkeypatch.setattr(KCubeDCServo, "move_to_position", move_to_position)
+
+    async def move():
+        return await motor.move_to(10000, timeout=10.0)
+
+    assert asyncio.run(move()).id == Moved
+    assert [message.id for message in motor.bridge.messages if message.type == GenericMotor] == [Stopped]
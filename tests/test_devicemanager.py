@@ -0,0 +1,17 @@
+from tlk.devicemanager import DeviceInventory
+
+
+def test_invalidate_while_looking_up(simulated):
+    simulated.add_device("27000001")
+    inventory = DeviceInventory()
+    refresh = inventory.refresh
+
+    def refresh_then_invalidate():
+        # Another thread invalidates right after the list is rebuilt.
+        indexes = refresh()
+        inventory.invalidate()
+        return indexes
+
+    inventory.refresh = refresh_then_invalidate
+    assert inventory.get("27000001").serialNo == b"27000001"
+    assert len(inventory) == 1
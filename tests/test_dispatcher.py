@@ -0,0 +1,41 @@
+import threading
+
+from tlk.dispatcher import Dispatcher, device_lock
+from tlk.kcubedcservo import KCubeDCServo
+
+
+def test_calls_take_the_device_lock(simulated):
+    simulated.add_device("27000001")
+    stage = Dispatcher(KCubeDCServo("27000001"))
+    lock = device_lock("27000001")
+    lock.reset()
+    stage.get_position()
+    assert lock.acquisitions == 1 and lock.contended == 0
+    entered = threading.Event()
+
+    def hold():
+        with stage.exclusive():
+            entered.set()
+            leave.wait(1.0)
+
+    leave = threading.Event()
+    thread = threading.Thread(target=hold)
+    thread.start()
+    entered.wait(1.0)
+    timer = threading.Timer(0.05, leave.set)
+    timer.start()
+    stage.get_position()
+    thread.join()
+    assert lock.contended == 1 and lock.max_wait > 0.0
+
+
+def test_not_threadsafe_takes_no_lock(simulated):
+    simulated.add_device("27000001")
+    device = KCubeDCServo("27000001")
+    stage = Dispatcher(device, threadsafe=False)
+    lock = device_lock("27000001")
+    lock.reset()
+    assert stage.get_position == device.get_position
+    with stage.exclusive():
+        stage.get_position()
+    assert lock.acquisitions == 0
@@ -0,0 +1,40 @@
+import pytest
+
+from tlk.definitions.kinesisexception import KinesisException
+from tlk.definitions.messages import Moved
+from tlk.group import MoveGroup
+from tlk.kcubedcservo import KCubeDCServo
+from tlk.kcubesteppermotor import KCubeStepperMotor
+
+
+def open_group(simulated):
+    simulated.add_device("27000001")
+    simulated.add_device("26000001")
+    members = [KCubeDCServo("27000001"), KCubeStepperMotor("26000001")]
+    for member in members:
+        member.open_device()
+    return MoveGroup(members)
+
+
+def test_move_to(simulated):
+    group = open_group(simulated)
+    move = group.move_to((1.0, 2.0))
+    assert [message.id for message in move.wait(timeout=10.0)] == [Moved, Moved]
+    assert len(move.offsets()) == 2 and move.skew >= 0.0
+
+
+def test_failed_member_does_not_swallow_later_moves(simulated, monkeypatch):
+    group = open_group(simulated)
+    servo, stepper = group.members
+
+    def fail(self):
+        raise KinesisException(36)
+
+    monkeypatch.setattr(KCubeStepperMotor, "move_absolute", fail)
+    with pytest.raises(KinesisException):
+        group.move_to((1.0, 2.0))
+    assert stepper.moves.pending() == 0
+    monkeypatch.undo()
+    stepper.moves.move_to_position(stepper.module.units.to_device_units(stepper.serial_number, 3.0)).result(10.0)
+    move = group.move_to((2.0, 1.0))
+    assert [message.id for message in move.wait(timeout=10.0)] == [Moved, Moved]
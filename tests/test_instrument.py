@@ -0,0 +1,72 @@
+import pytest
+
+from tlk import devicemanager, instrument
+from tlk.definitions.kinesisexception import KinesisException
+from tlk.instrument import SUB_BITS, Histogram, _bucket, _bucket_limit
+from tlk.kcubedcservo import KCubeDCServo
+from tlk.messagebridge import MessageBridge
+from tlk.telemetry import Sampler
+
+
+def test_buckets_per_power_of_two():
+    assert len({_bucket(ns) for ns in range(1 << 20, 1 << 21)}) == 1 << SUB_BITS
+    for ns in list(range(1000)) + [12345, 1 << 30, (1 << 40) + 12345]:
+        index = _bucket(ns)
+        assert _bucket_limit(index - 1) < ns <= _bucket_limit(index) <= ns + ns / (1 << SUB_BITS)
+
+
+def test_percentile():
+    histogram = Histogram()
+    for ns in range(1, 100001):
+        histogram.record(ns * 100)
+    assert abs(histogram.percentile(50.0) - 5000000) <= 5000000 / (1 << SUB_BITS)
+
+
+def calls(name, serial):
+    stats = instrument.functions.get(name)
+    histogram = stats and stats.serials.get(serial.encode())
+    return histogram.count if histogram else 0
+
+
+def test_cached_functions_are_not_timed_after_disable(simulated):
+    simulated.add_device("27000001")
+    stage = KCubeDCServo("27000001")
+    stage.open_device()
+    bridge = MessageBridge(stage.module.lib, stage.prefix, "27000001")
+    bridge.start()
+    sampler = Sampler()
+    sampler.add_device(stage, ["get_position"])
+    # Cached before enable, timed while enabled.
+    stage.context.get_position()
+    instrument.reset()
+    instrument.enable()
+    try:
+        stage.context.get_position()
+        sampler.getters[0]()
+        bridge.drain()
+        assert calls("KVS_GetPosition", "27000001") == 2
+        assert calls("KVS_GetNextMessage", "27000001") >= 1
+    finally:
+        instrument.disable()
+    instrument.reset()
+    stage.context.get_position()
+    sampler.getters[0]()
+    bridge.drain()
+    assert not instrument.snapshot()
+    assert not hasattr(bridge._get_next_message, "wrapped")
+
+
+def test_device_manager_failures_and_serials(simulated):
+    simulated.add_device("27000001")
+    instrument.reset()
+    instrument.enable()
+    try:
+        with pytest.raises(KinesisException):
+            devicemanager.get_device_info("99999999")
+        assert devicemanager.get_device_list_ext() == ["27000001"]
+    finally:
+        instrument.disable()
+    stats = instrument.snapshot()
+    assert stats["TLI_GetDeviceInfo"]["errors"] == 1
+    assert list(stats["TLI_GetDeviceInfo"]["serials"]) == ["99999999"]
+    assert list(stats["TLI_GetDeviceListExt"]["serials"]) == [""]
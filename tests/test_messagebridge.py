@@ -0,0 +1,46 @@
+import threading
+import time
+
+from tlk.definitions import messages
+from tlk.kcubedcservo import KCubeDCServo
+from tlk.messagebridge import MessageBridge
+
+
+def test_wait_timeout_is_a_deadline(simulated):
+    simulated.add_device("27000001")
+    stage = KCubeDCServo("27000001")
+    bridge = MessageBridge(stage.module.lib, stage.prefix, "27000001")
+    stopping = threading.Event()
+
+    def chatter():
+        # Wake the waiter with no message, again and again.
+        while not stopping.is_set():
+            with bridge.condition:
+                bridge.condition.notify_all()
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=chatter)
+    thread.start()
+    try:
+        start = time.monotonic()
+        assert bridge.wait(timeout=0.1) is None
+        assert time.monotonic() - start < 0.5
+    finally:
+        stopping.set()
+        thread.join()
+
+
+def test_listener_removed_while_draining(simulated):
+    device = simulated.add_device("27000001")
+    stage = KCubeDCServo("27000001")
+    bridge = MessageBridge(stage.module.lib, stage.prefix, "27000001")
+    seen = []
+
+    def once(message):
+        bridge.listeners.remove(once)
+
+    bridge.listeners.extend([once, seen.append])
+    device.channels[1].post(messages.GenericMotor, messages.Moved)
+    bridge.drain()
+    assert [message.id for message in seen] == [messages.Moved]
+    assert bridge.listeners == [seen.append]
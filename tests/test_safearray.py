@@ -0,0 +1,13 @@
+from tlk.definitions import safearray
+
+
+def test_empty_safearray(monkeypatch):
+    # An empty SAFEARRAY of doubles, whose data pointer is NULL.
+    monkeypatch.setattr(safearray, "_get_vartype", lambda psa: safearray.VT_R8)
+    monkeypatch.setattr(safearray, "_get_shape", lambda psa: (0,))
+    monkeypatch.setattr(safearray, "SafeArrayAccessData", lambda psa, ptr: 0, raising=False)
+    monkeypatch.setattr(safearray, "SafeArrayUnaccessData", lambda psa: 0, raising=False)
+    with safearray.SafeArrayData(None) as data:
+        assert len(data.view) == 0 and data.view.format == "d"
+    assert len(safearray.UnpackSafeArrayData(None)) == 0
+    assert safearray.UnpackSafeArray(None) == ()
@@ -0,0 +1,4 @@
+def test_type_from_serial_number(simulated):
+    assert simulated.add_device("10300001").description == "Benchtop Brushless Motor"
+    assert simulated.add_device("11300001").description == "KCube Piezo Strain Gauge"
+    assert simulated.add_device("27000001").description == "KCube DC Servo"
@@ -0,0 +1,33 @@
+import importlib
+import pkgutil
+
+import pytest
+
+import tlk
+from tlk import status
+from tlk.device import Device
+
+
+def device_classes():
+    # Every device class of the device modules that has get_status_bits.
+    for module in pkgutil.iter_modules(tlk.__path__):
+        if module.name in ("simulator",):
+            continue
+        for value in vars(importlib.import_module("tlk." + module.name)).values():
+            if isinstance(value, type) and issubclass(value, Device) and value.prefix:
+                if hasattr(value, "get_status_bits"):
+                    yield value
+
+
+@pytest.mark.parametrize("cls", sorted(set(device_classes()), key=lambda cls: cls.__name__))
+def test_every_device_has_a_decoder(cls):
+    if cls.prefix in status.UNDECODED:
+        with pytest.raises(ValueError, match="not decoded"):
+            status.decoder(cls)
+    else:
+        assert status.decoder(cls).decode(0x80000000)
+
+
+def test_decode_motor():
+    flags = status.MOTOR.decode(0x80000410)
+    assert flags.moving and flags.homed and flags.enabled and not flags.fault
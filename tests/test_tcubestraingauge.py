@@ -0,0 +1,11 @@
+from tlk.tcubestraingauge import TCubeStrainGauge
+
+
+def test_get_reading_returns_the_reading(simulated):
+    device = simulated.add_device("84000001")
+    gauge = TCubeStrainGauge("84000001")
+    gauge.open_device()
+    assert gauge.get_reading(True) == 0
+    device.channels[1].settings["Reading"] = [-1234]
+    assert gauge.get_reading(True) == -1234
+    assert gauge.get_reading(False) == -1234
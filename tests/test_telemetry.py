@@ -0,0 +1,24 @@
+from tlk.kcubepositionaligner import KCubePositionAligner
+from tlk.tcubenanotrack import TCubeNanoTrak
+from tlk.tcubestraingauge import TCubeStrainGauge
+from tlk.telemetry import Sampler
+
+
+def test_readings_are_sampled(simulated):
+    for serial in ("82000001", "84000001", "69000001"):
+        simulated.add_device(serial)
+    simulated.devices["84000001"].channels[1].settings["Reading"] = [-1234]
+    sampler = Sampler()
+    sampler.add_device(TCubeNanoTrak("82000001"))
+    sampler.add_device(TCubeStrainGauge("84000001"))
+    sampler.add_device(KCubePositionAligner("69000001"))
+    for name in ("82000001:get_reading.absoluteReading", "82000001:get_reading.underOrOverRead",
+                 "84000001:get_reading", "69000001:get_reading.demandPos.x", "69000001:get_reading.sum"):
+        assert name in sampler.names
+    sampler.start()
+    sampler.stop()
+    sampler.sample()
+    assert sampler.errors == 0
+    assert len(sampler.buffer) >= 1
+    _, values = sampler.buffer.latest()
+    assert values[sampler.names.index("84000001:get_reading")] == -1234
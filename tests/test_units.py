@@ -0,0 +1,16 @@
+import pytest
+
+from tlk.kcubedcservo import KCubeDCServo
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_numpy_scalars(simulated):
+    simulated.add_device("27000001")
+    units = KCubeDCServo("27000001").module.units
+    assert units.to_device_units("27000001", numpy.float32(1.5)) == 51456
+    assert units.to_device_units("27000001", numpy.int64(2)) == 68608
+    assert units.to_device_units("27000001", numpy.arange(3.0)[1]) == 34304
+    assert units.to_real_units("27000001", numpy.int64(34304)) == 1.0
+    assert units.to_real_units("27000001", numpy.array([34304, 68608])).tolist() == [1.0, 2.0]
+    assert units.to_device_units("27000001", [1.0, 2.0]) == [34304, 68608]
@@ -0,0 +1,14 @@
+from tlk.benchtopbrushlessmotor import BenchtopBrushlessMotor
+from tlk.vector import VectorMoves
+
+
+def test_close_unregisters_callback(simulated):
+    device = simulated.add_device("73000001")
+    stage = BenchtopBrushlessMotor("73000001")
+    stage.open_device()
+    xy = VectorMoves(stage, channels=(1, 2))
+    assert device.synchronized_callback is not None
+    xy.move_to((1.0, 2.0)).result(timeout=10.0)
+    xy.close()
+    assert device.synchronized_callback is None
+    assert xy._callback is None